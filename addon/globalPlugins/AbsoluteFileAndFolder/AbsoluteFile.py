@@ -1,205 +1,129 @@
 # AbsoluteFile.py
 import os
 import wx
-import ui
-import api
 import gui
 import globalVars
-import json
 import addonHandler
-import core
 import ctypes
 from ctypes import wintypes
-from comtypes.client import CreateObject as COMCreate
-import urllib.parse
 import logHandler
+from . import bookmarkDialog
+from . import bookmarkManager
+from . import bookmarks
+from . import categories
+from . import history
+from . import pathHealth
+from . import search
+from . import virtualList
 
 addonHandler.initTranslation()
 
 TITLE = _("Absolute Files")
 
-class AbsoluteFileManager:
+class AbsoluteFileManager(bookmarkManager.BookmarkManager):
+	kind = pathHealth.KIND_FILE
+	legacyRecentKey = "recentFiles"
+	noun = "file"
+
 	def __init__(self):
-		self._files = {}
-		self._order = []
-		self._pinned = set()
-		self._recentFiles = []
-		self._showPath = False
-		self._sortMode = "UPPERCASE"
-		self._newFile = ""
+		super().__init__()
+		self._categories = categories.defaultRegistry()
+		self._matcher = categories.CategoryMatcher(self._categories)
+		self._savedIndex = categories.CategoryIndex(self._matcher)
+		self._recentIndex = categories.CategoryIndex(self._matcher)
 		self.loadConfig()
 
 	def _get_config_path(self):
 		folder = os.path.join(globalVars.appArgs.configPath, "ChaiChaimee", "AbsoluteFileAndFloder")
 		return os.path.join(folder, "AbsoluteFiles.json")
 
-	def _getCurrentPathFromExplorer(self):
-		try:
-			fg = api.getForegroundObject()
-			if not fg or not fg.appModule or fg.appModule.appName != "explorer":
-				return None
-
-			shell = COMCreate("Shell.Application")
-			if not shell:
-				return None
-
-			for window in shell.Windows():
-				try:
-					if not window or window.hwnd != fg.windowHandle:
-						continue
-
-					if hasattr(window, "Document") and window.Document:
-						try:
-							item = window.Document.FocusedItem
-							if item:
-								path = item.Path
-								if path and os.path.isfile(path):
-									return os.path.normpath(path)
-						except Exception:
-							pass
-
-					if hasattr(window, "LocationURL") and window.LocationURL:
-						url = window.LocationURL
-						if url.startswith("file:///"):
-							path = urllib.parse.unquote(url[8:])
-							path = path.replace("/", "\\")
-							if os.path.isfile(path):
-								return os.path.normpath(path)
-
-				except Exception:
-					continue
-
-			focus = api.getFocusObject()
-			if focus and focus.appModule and focus.appModule.appName == "explorer":
-				for window in shell.Windows():
-					try:
-						if not window or window.hwnd != focus.windowHandle:
-							continue
-						if hasattr(window, "Document") and window.Document:
-							try:
-								item = window.Document.FocusedItem
-								if item:
-									path = item.Path
-									if path and os.path.isfile(path):
-										return os.path.normpath(path)
-							except Exception:
-								pass
-					except Exception:
-						continue
-
-		except Exception as e:
-			logHandler.log.warning(f"Failed to get Explorer file path: {e}", exc_info=True)
-		return None
-
-	def loadConfig(self):
-		config_path = self._get_config_path()
-		if os.path.isfile(config_path):
-			try:
-				with open(config_path, 'r', encoding='utf-8') as f:
-					data = json.load(f)
-				self._files = data.get("files", {})
-				self._order = data.get("order", list(self._files.keys()))
-				self._pinned = set(data.get("pinned", []))
-				self._recentFiles = data.get("recentFiles", [])
-				self._showPath = data.get("showPath", False)
-				self._sortMode = data.get("sortMode", "UPPERCASE")
-			except Exception as e:
-				logHandler.log.warning(f"Failed to load file config: {e}", exc_info=True)
-
-	def saveConfig(self):
-		data = {
-			"files": self._files,
-			"order": self._order,
-			"pinned": list(self._pinned),
-			"recentFiles": self._recentFiles,
-			"showPath": self._showPath,
-			"sortMode": self._sortMode
-		}
-		config_path = self._get_config_path()
-		try:
-			os.makedirs(os.path.dirname(config_path), exist_ok=True)
-			with open(config_path, 'w', encoding='utf-8') as f:
-				json.dump(data, f, ensure_ascii=False, indent=2)
-		except Exception as e:
-			logHandler.log.error(f"Failed to save file config: {e}", exc_info=True)
-
-	def addToRecent(self, path):
-		if path and os.path.isfile(path):
-			try:
-				if path in self._recentFiles:
-					self._recentFiles.remove(path)
-				self._recentFiles.insert(0, path)
-				self._recentFiles = self._recentFiles[:20]
-				self.saveConfig()
-			except Exception as e:
-				logHandler.log.warning(f"Failed to add to recent files: {e}", exc_info=True)
-
-	def show(self):
-		self.loadConfig()
-		path = self._getCurrentPathFromExplorer()
-		if path and os.path.isfile(path):
-			self._newFile = path
-		elif path and os.path.isdir(path):
-			self._newFile = ""
-		else:
-			self._newFile = ""
-		self.dialog = AbsoluteFilesDialog(gui.mainFrame, self)
-		gui.mainFrame.prePopup()
-		self.dialog.Show()
-		self.dialog.CentreOnScreen()
-		gui.mainFrame.postPopup()
-
-class AbsoluteFilesDialog(wx.Dialog):
-	def __init__(self, parent, manager):
-		super().__init__(parent, title=TITLE, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER | wx.MAXIMIZE_BOX)
-		self.manager = manager
-		self._displayedRecentPaths = []
-		self._contextMenuOpen = False
-		self._initUI()
-		self._bindEvents()
-		self.updateFiles()
-		self.timer = wx.Timer(self)
-		self.Bind(wx.EVT_TIMER, self.on_timeout, self.timer)
-		self.Bind(wx.EVT_ACTIVATE, self.on_activate)
-		self.timer.Start(15000)
-		wx.CallAfter(self.listSaved.SetFocus)
-
-	def _play_close_beep(self):
-		try:
-			import winsound
-			winsound.Beep(100, 100)
-		except Exception:
-			pass
-
-	def _reset_timer(self):
-		if self.timer and not self._contextMenuOpen:
-			self.timer.Stop()
-			self.timer.Start(15000)
-
-	def _stop_timer(self):
-		if self.timer:
-			self.timer.Stop()
-
-	def on_activate(self, event):
-		if event.GetActive():
-			self._contextMenuOpen = False
-			self._reset_timer()
-		event.Skip()
-
-	def on_timeout(self, event):
-		if not self._contextMenuOpen:
-			self._play_close_beep()
-			self.Close()
+	def _get_history_path(self):
+		return os.path.join(os.path.dirname(self._get_config_path()), "AbsoluteFilesHistory.json")
+
+	def _accepts(self, path):
+		return os.path.isfile(path)
+
+	def _createDialog(self):
+		return AbsoluteFilesDialog(gui.mainFrame, self)
+
+	def _loadData(self, data):
+		self._categories = categories.normalizeRegistry(data.get("categories"))
+
+	def _configData(self):
+		return {"categories": [dict(entry, rules=list(entry["rules"])) for entry in self._categories]}
+
+	def _savedAdded(self, name, path):
+		super()._savedAdded(name, path)
+		self._savedIndex.add(name, path)
+
+	def _savedRenamed(self, oldName, newName, entry):
+		super()._savedRenamed(oldName, newName, entry)
+		self._savedIndex.rename(oldName, newName)
+
+	def _savedRemoved(self, name, entry):
+		super()._savedRemoved(name, entry)
+		self._savedIndex.remove(name)
+
+	def _recentAdded(self, path):
+		super()._recentAdded(path)
+		self._recentIndex.add(path, path)
+
+	def _recentDropped(self, paths):
+		super()._recentDropped(paths)
+		for path in paths:
+			self._recentIndex.remove(path)
+
+	def _rebuildSavedIndexes(self):
+		super()._rebuildSavedIndexes()
+		self._matcher = categories.CategoryMatcher(self._categories)
+		self._savedIndex.rebuild(self._bookmarks.items(), self._matcher)
+
+	def _rebuildRecentIndexes(self):
+		super()._rebuildRecentIndexes()
+		self._recentIndex.rebuild(((p, p) for p in self._recent), self._matcher)
+
+	def setCategories(self, registry):
+		self._categories = categories.normalizeRegistry(registry)
+		self._matcher = categories.CategoryMatcher(self._categories)
+		self._savedIndex.rebuild(self._bookmarks.items(), self._matcher)
+		self._recentIndex.rebuild(((p, p) for p in self._recent), self._matcher)
+		self.saveConfig()
+
+class AbsoluteFilesDialog(bookmarkDialog.BookmarkDialog):
+	title = TITLE
+	messages = {
+		"noPath": _("No file selected in Explorer to add."),
+		"noSelection": _("No files selected in Explorer to add."),
+		"allSaved": _("All selected files are already saved."),
+		"added": _("Added {} files"),
+		"addedSkipped": _("Added {} files, {} already saved"),
+		"openMany": _("Open {} files?"),
+		"unavailable": _("File is {}: {}"),
+		"someUnavailable": _("{} of {} files could not be opened")
+	}
+	_recentViewCache = (None, [], {})
+
+	def _resetControls(self):
+		self.filterCombo.SetSelection(0)
 
 	def _initUI(self):
 		mainSizer = wx.BoxSizer(wx.VERTICAL)
 		filterSizer = wx.BoxSizer(wx.HORIZONTAL)
 		filterSizer.Add(wx.StaticText(self, label=_("Filter Type:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
-		self.filterCombo = wx.ComboBox(self, choices=["All", "Audio", "Video", "Document", "Code", "Exe"], style=wx.CB_READONLY)
+		self._filterTypes = [categories.ALL] + self.manager._matcher.labels
+		self.filterCombo = wx.ComboBox(self, choices=["All"] + self.manager._matcher.labels, style=wx.CB_READONLY)
 		self.filterCombo.SetSelection(0)
 		filterSizer.Add(self.filterCombo, 1, wx.EXPAND)
+		self.btnCategories = wx.Button(self, label=_("&Categories..."))
+		filterSizer.Add(self.btnCategories, 0, wx.LEFT, 5)
 		mainSizer.Add(filterSizer, 0, wx.EXPAND | wx.ALL, 5)
 
+		searchSizer = wx.BoxSizer(wx.HORIZONTAL)
+		searchSizer.Add(wx.StaticText(self, label=_("&Search:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.searchField = wx.TextCtrl(self)
+		searchSizer.Add(self.searchField, 1, wx.EXPAND)
+		mainSizer.Add(searchSizer, 0, wx.EXPAND | wx.ALL, 5)
+
 		self.tabs = wx.Notebook(self)
 		self.panelSaved = wx.Panel(self.tabs)
 		self.panelRecent = wx.Panel(self.tabs)
@@ -208,35 +132,50 @@ class AbsoluteFilesDialog(wx.Dialog):
 		mainSizer.Add(self.tabs, 1, wx.EXPAND | wx.ALL, 5)
 
 		savedSizer = wx.BoxSizer(wx.VERTICAL)
-		self.listSaved = wx.ListCtrl(self.panelSaved, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
+		self.savedModel = virtualList.VirtualListModel()
+		self.listSaved = virtualList.VirtualListCtrl(self.panelSaved, self.savedModel, style=wx.LC_REPORT | wx.BORDER_SUNKEN, status=self._savedStatus)
 		self.listSaved.InsertColumn(0, _("Name"), width=250)
 		self.listSaved.InsertColumn(1, _("Path"), width=400)
+		self.listSaved.InsertColumn(2, _("Status"), width=120)
 		savedSizer.Add(self.listSaved, 1, wx.EXPAND | wx.ALL, 5)
 
 		savedBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
 		self.btnAdd = wx.Button(self.panelSaved, label=_("&Add"))
+		self.btnAddSelected = wx.Button(self.panelSaved, label=_("Add Se&lected"))
 		self.btnEdit = wx.Button(self.panelSaved, label=_("&Edit"))
 		self.btnRemove = wx.Button(self.panelSaved, label=_("&Remove"))
 		savedBtnSizer.Add(self.btnAdd, 0, wx.RIGHT, 5)
+		savedBtnSizer.Add(self.btnAddSelected, 0, wx.RIGHT, 5)
 		savedBtnSizer.Add(self.btnEdit, 0, wx.RIGHT, 5)
 		savedBtnSizer.Add(self.btnRemove, 0)
 		savedSizer.Add(savedBtnSizer, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
 		self.panelSaved.SetSizer(savedSizer)
 
 		recentSizer = wx.BoxSizer(wx.VERTICAL)
-		self.listRecent = wx.ListCtrl(self.panelRecent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
+		self.recentModel = virtualList.VirtualListModel()
+		self.listRecent = virtualList.VirtualListCtrl(self.panelRecent, self.recentModel, style=wx.LC_REPORT | wx.BORDER_SUNKEN, status=self._recentStatus)
 		self.listRecent.InsertColumn(0, _("File Name"), width=250)
 		self.listRecent.InsertColumn(1, _("Path"), width=400)
+		self.listRecent.InsertColumn(2, _("Status"), width=120)
 		recentSizer.Add(self.listRecent, 1, wx.EXPAND | wx.ALL, 5)
+		recentBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
+		recentBtnSizer.Add(wx.StaticText(self.panelRecent, label=_("History si&ze:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.spinHistorySize = wx.SpinCtrl(
+			self.panelRecent,
+			min=history.MIN_CAPACITY,
+			max=history.MAX_CAPACITY,
+			initial=self.manager._recent.capacity
+		)
+		recentBtnSizer.Add(self.spinHistorySize, 0, wx.RIGHT, 10)
 		self.btnClearRecent = wx.Button(self.panelRecent, label=_("Clear History"))
-		recentSizer.Add(self.btnClearRecent, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
+		recentBtnSizer.Add(self.btnClearRecent, 0)
+		recentSizer.Add(recentBtnSizer, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
 		self.panelRecent.SetSizer(recentSizer)
 
 		optionsSizer = wx.BoxSizer(wx.HORIZONTAL)
-		choices = [_("Custom order"), _("Ascending, a-z"), _("Descending z-a")]
+		choices = [_("Custom order"), _("Ascending, a-z"), _("Descending z-a"), _("Most used first")]
 		self.sortCombo = wx.ComboBox(self, choices=choices, style=wx.CB_READONLY)
-		mode_map = {"CUSTOM": 0, "UPPERCASE": 1, "LOWERCASE": 2}
-		self.sortCombo.SetSelection(mode_map.get(self.manager._sortMode, 1))
+		self._selectSortMode()
 		optionsSizer.Add(self.sortCombo, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 		mainSizer.Add(optionsSizer, 0, wx.EXPAND | wx.ALL, 5)
 
@@ -253,14 +192,18 @@ class AbsoluteFilesDialog(wx.Dialog):
 
 	def _bindEvents(self):
 		self.filterCombo.Bind(wx.EVT_COMBOBOX, lambda e: self.updateFiles() or self._reset_timer())
+		self.btnCategories.Bind(wx.EVT_BUTTON, self.onEditCategories)
+		self.searchField.Bind(wx.EVT_TEXT, self.onSearch)
 		self.sortCombo.Bind(wx.EVT_COMBOBOX, self.onSortChanged)
 		self.tabs.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.onTabChanged)
 		self.btnOpen.Bind(wx.EVT_BUTTON, self.onOpen)
 		self.btnClose.Bind(wx.EVT_BUTTON, lambda e: self.Close())
 		self.btnAdd.Bind(wx.EVT_BUTTON, self.onAdd)
+		self.btnAddSelected.Bind(wx.EVT_BUTTON, self.onAddSelected)
 		self.btnEdit.Bind(wx.EVT_BUTTON, self.onEdit)
 		self.btnRemove.Bind(wx.EVT_BUTTON, self.onRemove)
 		self.btnClearRecent.Bind(wx.EVT_BUTTON, self.onClearRecent)
+		self.spinHistorySize.Bind(wx.EVT_SPINCTRL, self.onHistorySizeChanged)
 		self.listSaved.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onOpen)
 		self.listRecent.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onOpen)
 		self.listSaved.Bind(wx.EVT_CONTEXT_MENU, self.onContextMenu)
@@ -270,10 +213,6 @@ class AbsoluteFilesDialog(wx.Dialog):
 		self.Bind(wx.EVT_CHAR_HOOK, self.onCharHook)
 		self.Bind(wx.EVT_CLOSE, self.on_close)
 
-	def on_close(self, event):
-		self._stop_timer()
-		event.Skip()
-
 	def onTabChanged(self, evt):
 		self.updateFiles()
 		if self.tabs.GetSelection() == 0:
@@ -282,117 +221,28 @@ class AbsoluteFilesDialog(wx.Dialog):
 			self.listRecent.SetFocus()
 		self._reset_timer()
 
-	def onSortChanged(self, evt):
-		idx = self.sortCombo.GetSelection()
-		self.manager._sortMode = ["CUSTOM", "UPPERCASE", "LOWERCASE"][idx]
-		self.manager.saveConfig()
-		self.updateFiles()
-		self._reset_timer()
-
-	def onCharHook(self, evt):
-		if evt.GetKeyCode() == wx.WXK_ESCAPE:
-			self.Close()
-		else:
-			evt.Skip()
-		self._reset_timer()
-
-	def onKeyDown(self, evt):
-		if evt.GetKeyCode() == wx.WXK_DELETE:
-			if self.tabs.GetSelection() == 0:
-				self.onRemove(None)
-		else:
-			evt.Skip()
-		self._reset_timer()
-
-	def onOpen(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() == 0:
-			lst = self.listSaved
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				return
-			name = lst.GetItemText(idx, 0)
-			path = self.manager._files.get(name)
-		else:
-			lst = self.listRecent
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				return
-			if idx >= len(self._displayedRecentPaths):
-				return
-			path = self._displayedRecentPaths[idx]
-		if path and os.path.isfile(path):
-			os.startfile(path)
-			self.manager.addToRecent(path)
-			self.Close()
-
-	def onAdd(self, evt):
-		self._reset_timer()
-		if not self.manager._newFile:
-			ui.message(_("No file selected in Explorer to add."))
-			return
-		default = os.path.basename(self.manager._newFile)
-		dlg = wx.TextEntryDialog(self, _("Enter display name"), TITLE, default)
-		if dlg.ShowModal() == wx.ID_OK:
-			name = dlg.GetValue().strip()
-			if name:
-				if name in self.manager._files:
-					gui.messageBox(_("This name already exists."), TITLE, wx.OK | wx.ICON_WARNING)
-				else:
-					self.manager._files[name] = self.manager._newFile
-					if name not in self.manager._order:
-						self.manager._order.append(name)
-					self.manager.saveConfig()
-					self.updateFiles()
-		dlg.Destroy()
-
-	def onEdit(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() != 0:
-			return
-		idx = self.listSaved.GetFirstSelected()
-		if idx == -1:
-			return
-		oldName = self.listSaved.GetItemText(idx, 0)
-		dlg = wx.TextEntryDialog(self, _("Rename"), TITLE, oldName)
+	def onEditCategories(self, evt):
+		self._stop_timer()
+		text = "\n".join("{}: {}".format(entry["label"], ", ".join(entry["rules"])) for entry in self.manager._categories)
+		dlg = wx.TextEntryDialog(
+			self,
+			_("One category per line, as Name: .ext, *.pattern"),
+			TITLE,
+			text,
+			style=wx.OK | wx.CANCEL | wx.TE_MULTILINE
+		)
 		if dlg.ShowModal() == wx.ID_OK:
-			newName = dlg.GetValue().strip()
-			if newName and newName != oldName:
-				if newName in self.manager._files:
-					gui.messageBox(_("This name already exists."), TITLE, wx.OK | wx.ICON_WARNING)
-				else:
-					path = self.manager._files.pop(oldName)
-					self.manager._files[newName] = path
-					self.manager._order = [newName if x == oldName else x for x in self.manager._order]
-					if oldName in self.manager._pinned:
-						self.manager._pinned.remove(oldName)
-						self.manager._pinned.add(newName)
-					self.manager.saveConfig()
-					self.updateFiles()
-		dlg.Destroy()
-
-	def onRemove(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() != 0:
-			return
-		idx = self.listSaved.GetFirstSelected()
-		if idx == -1:
-			return
-		name = self.listSaved.GetItemText(idx, 0)
-		if gui.messageBox(_("Remove {}?").format(name), TITLE, wx.YES_NO) == wx.YES:
-			self.manager._files.pop(name, None)
-			if name in self.manager._order:
-				self.manager._order.remove(name)
-			self.manager._pinned.discard(name)
-			self.manager.saveConfig()
+			registry = []
+			for line in dlg.GetValue().splitlines():
+				label, sep, rules = line.partition(":")
+				label = label.strip()
+				if not sep or not label:
+					continue
+				registry.append({"label": label, "rules": [r.strip() for r in rules.split(",") if r.strip()]})
+			self.manager.setCategories(registry)
 			self.updateFiles()
-
-	def onClearRecent(self, evt):
+		dlg.Destroy()
 		self._reset_timer()
-		if gui.messageBox(_("Clear history?"), TITLE, wx.YES_NO) == wx.YES:
-			self.manager._recentFiles = []
-			self.manager.saveConfig()
-			self.updateFiles()
 
 	def onContextMenu(self, evt):
 		self._stop_timer()
@@ -400,55 +250,56 @@ class AbsoluteFilesDialog(wx.Dialog):
 		
 		if self.tabs.GetSelection() == 0:
 			lst = self.listSaved
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				self._contextMenuOpen = False
-				self._reset_timer()
-				return
-			name = lst.GetItemText(idx, 0)
-			path = self.manager._files.get(name)
+			names = lst.selectedKeys()
+			paths = [self.manager._bookmarks.path(name) for name in names]
 		else:
 			lst = self.listRecent
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				self._contextMenuOpen = False
-				self._reset_timer()
-				return
-			if idx >= len(self._displayedRecentPaths):
-				self._contextMenuOpen = False
-				self._reset_timer()
-				return
-			path = self._displayedRecentPaths[idx]
+			paths = lst.selectedKeys()
+		if not paths:
+			self._contextMenuOpen = False
+			self._reset_timer()
+			return
 		
 		menu = wx.Menu()
 		
-		if path and os.path.isfile(path):
+		if len(paths) == 1:
+			path = paths[0]
 			ext = os.path.splitext(path)[1].lower()
 			if ext in ('.exe', '.bat', '.cmd', '.msi'):
 				itemAdmin = menu.Append(wx.ID_ANY, _("Run as Administrator"))
-				self.Bind(wx.EVT_MENU, lambda e: self.runAsAdmin(path), itemAdmin)
+				menu.Bind(wx.EVT_MENU, lambda e: self.runAsAdmin(path), itemAdmin)
 				menu.AppendSeparator()
 		
 		if self.tabs.GetSelection() == 0:
-			pin_label = _("Unpin") if name in self.manager._pinned else _("Pin to top")
+			# With several bookmarks selected, Pin pins them all unless all are pinned already.
+			allPinned = all(self.manager._bookmarks.isPinned(name) for name in names)
+			pin_label = _("Unpin") if allPinned else _("Pin to top")
 			itemPin = menu.Append(wx.ID_ANY, pin_label)
-			self.Bind(wx.EVT_MENU, lambda e: self.onTogglePin(name), itemPin)
+			menu.Bind(wx.EVT_MENU, lambda e: self.onSetPinned(names, not allPinned), itemPin)
 			menu.AppendSeparator()
-			itemEdit = menu.Append(wx.ID_ANY, _("Edit"))
+			if len(names) == 1:
+				itemEdit = menu.Append(wx.ID_ANY, _("Edit"))
+				menu.Bind(wx.EVT_MENU, self.onEdit, itemEdit)
 			itemDelete = menu.Append(wx.ID_ANY, _("Delete"))
 			
 			if self.manager._sortMode == "CUSTOM":
 				menu.AppendSeparator()
 				itemUp = menu.Append(wx.ID_ANY, _("Move Up"))
 				itemDown = menu.Append(wx.ID_ANY, _("Move Down"))
-				self.Bind(wx.EVT_MENU, lambda e: self.moveItem(name, -1), itemUp)
-				self.Bind(wx.EVT_MENU, lambda e: self.moveItem(name, 1), itemDown)
+				itemTop = menu.Append(wx.ID_ANY, _("Move to Top"))
+				itemBottom = menu.Append(wx.ID_ANY, _("Move to Bottom"))
+				menu.Bind(wx.EVT_MENU, lambda e: self.moveItems(names, -1), itemUp)
+				menu.Bind(wx.EVT_MENU, lambda e: self.moveItems(names, 1), itemDown)
+				menu.Bind(wx.EVT_MENU, lambda e: self.moveItemsToEdge(names, False), itemTop)
+				menu.Bind(wx.EVT_MENU, lambda e: self.moveItemsToEdge(names, True), itemBottom)
+				if len(names) == 1:
+					itemPosition = menu.Append(wx.ID_ANY, _("Move to Position..."))
+					menu.Bind(wx.EVT_MENU, lambda e: self.onMoveToPosition(names[0]), itemPosition)
 			
-			self.Bind(wx.EVT_MENU, self.onEdit, itemEdit)
-			self.Bind(wx.EVT_MENU, self.onRemove, itemDelete)
+			menu.Bind(wx.EVT_MENU, self.onRemove, itemDelete)
 		else:
 			itemDelete = menu.Append(wx.ID_ANY, _("Remove from Recent"))
-			self.Bind(wx.EVT_MENU, lambda e, p=path: self.onRemoveRecentByPath(p), itemDelete)
+			menu.Bind(wx.EVT_MENU, lambda e: self.onRemoveRecent(paths), itemDelete)
 		
 		def on_menu_close(event):
 			self._contextMenuOpen = False
@@ -459,47 +310,30 @@ class AbsoluteFilesDialog(wx.Dialog):
 		lst.PopupMenu(menu)
 		menu.Destroy()
 
-	def onRemoveRecentByPath(self, path):
-		self._reset_timer()
-		if path in self.manager._recentFiles:
-			if gui.messageBox(_("Remove {} from recent list?").format(os.path.basename(path)), TITLE, wx.YES_NO) == wx.YES:
-				self.manager._recentFiles.remove(path)
-				self.manager.saveConfig()
-				self.updateFiles()
-
-	def onTogglePin(self, name):
+	def onRemoveRecent(self, paths):
 		self._reset_timer()
-		if name in self.manager._pinned:
-			self.manager._pinned.remove(name)
-		else:
-			self.manager._pinned.add(name)
-		self.manager.saveConfig()
-		self.updateFiles()
-
-	def moveItem(self, targetName, direction):
-		self._reset_timer()
-		if self.tabs.GetSelection() != 0:
+		paths = [path for path in paths if path in self.manager._recent]
+		if not paths:
 			return
-		
-		pinnedList = [x for x in self.manager._order if x in self.manager._pinned]
-		unpinnedList = [x for x in self.manager._order if x not in self.manager._pinned and x in self.manager._files]
-		
-		if targetName in pinnedList:
-			currentIndex = pinnedList.index(targetName)
-			newIndex = currentIndex + direction
-			if 0 <= newIndex < len(pinnedList):
-				pinnedList[currentIndex], pinnedList[newIndex] = pinnedList[newIndex], pinnedList[currentIndex]
-				self.manager._order = pinnedList + unpinnedList
-				self.manager.saveConfig()
-				self.updateFiles(newIndex)
+		if len(paths) == 1:
+			question = _("Remove {} from recent list?").format(os.path.basename(paths[0]))
 		else:
-			currentIndex = unpinnedList.index(targetName)
-			newIndex = currentIndex + direction
-			if 0 <= newIndex < len(unpinnedList):
-				unpinnedList[currentIndex], unpinnedList[newIndex] = unpinnedList[newIndex], unpinnedList[currentIndex]
-				self.manager._order = pinnedList + unpinnedList
-				self.manager.saveConfig()
-				self.updateFiles(len(pinnedList) + newIndex)
+			question = _("Remove {} files from recent list?").format(len(paths))
+		if gui.messageBox(question, TITLE, wx.YES_NO) == wx.YES:
+			self.manager.removeAllRecent(paths)
+			self.updateFiles()
+
+	def _open(self, paths, unavailable):
+		opened = []
+		for path in paths:
+			try:
+				os.startfile(path)
+			except OSError as e:
+				logHandler.log.warning(f"Failed to open file: {e}", exc_info=True)
+				unavailable.append((path, pathHealth.UNREACHABLE))
+			else:
+				opened.append(path)
+		return opened
 
 	def runAsAdmin(self, path):
 		self._reset_timer()
@@ -520,46 +354,78 @@ class AbsoluteFilesDialog(wx.Dialog):
 		except Exception as e:
 			logHandler.log.warning(f"Failed to run as admin: {e}", exc_info=True)
 
-	def updateFiles(self, selectIdx=0):
-		self.listSaved.DeleteAllItems()
-		self.listRecent.DeleteAllItems()
-		self._displayedRecentPaths = []
-		f_type = self.filterCombo.GetValue().lower()
-		exts = {
-			"audio": ('.mp3', '.wav', '.flac', '.m4a', '.ogg'),
-			"video": ('.mp4', '.mkv', '.avi', '.mov'),
-			"document": ('.pdf', '.docx', '.txt', '.xlsx', '.pptx'),
-			"code": ('.py', '.cpp', '.java', '.js', '.html', '.css'),
-			"exe": ('.exe', '.bat', '.cmd', '.msi')
-		}
+	def _recentView(self):
+		key = (self.manager._version, self.manager._sortMode == "FRECENCY")
+		if self._recentViewCache[0] != key:
+			ordered = list(self.manager._recent)
+			if key[1]:
+				ordered.sort(key=self.manager._frecency.logScore, reverse=True)
+			self._recentViewCache = (key, ordered, {p: i for i, p in enumerate(ordered)})
+		return self._recentViewCache[1], self._recentViewCache[2]
+
+	# view is only read without a query; matches come straight from the search index.
+	def _filtered(self, view, index, f_type, searchIndex, query):
+		if query:
+			return searchIndex.search(query, search.RESULT_LIMIT, None if f_type == categories.ALL else index.members(f_type))
+		ordered, positions = view()
+		if f_type == categories.ALL:
+			return ordered
+		members = [key for key in index.members(f_type) if key in positions]
+		members.sort(key=positions.__getitem__)
+		return members
+
+	def _buildSavedRows(self, f_type, query):
+		names = self._filtered(self.manager.savedView, self.manager._savedIndex, f_type, self.manager._savedSearch, query)
+		path = self.manager._bookmarks.path
+		showPath = self.manager._showPath
+		return [(name, path(name) if showPath else "", name) for name in names]
+
+	def _buildRecentRows(self, f_type, query):
+		paths = self._filtered(self._recentView, self.manager._recentIndex, f_type, self.manager._recentSearch, query)
+		return [(os.path.basename(p), p, p) for p in paths]
+
+	def _updateFilterLabels(self, index, total):
+		types = [categories.ALL] + self.manager._matcher.labels
+		labels = ["{} ({})".format("All", total)]
+		labels.extend("{} ({})".format(label, index.count(label)) for label in types[1:])
+		if types != self._filterTypes:
+			selected = self._filterTypes[max(self.filterCombo.GetSelection(), 0)]
+			self._filterTypes = types
+			self.filterCombo.Set(labels)
+			self.filterCombo.SetSelection(types.index(selected) if selected in types else 0)
+		elif labels != self.filterCombo.GetItems():
+			selection = self.filterCombo.GetSelection()
+			for i, label in enumerate(labels):
+				self.filterCombo.SetString(i, label)
+			self.filterCombo.SetSelection(selection)
+
+	def _filterState(self):
+		return self._filterTypes[max(self.filterCombo.GetSelection(), 0)], self.searchField.GetValue().strip()
+
+	def _savedViewKey(self):
+		return self._viewKey(*self._filterState())
+
+	# Unfiltered custom order matches the rows one to one.
+	def _showsFullOrder(self):
+		f_type, query = self._filterState()
+		return f_type == categories.ALL and not query and self.manager._sortMode == bookmarks.SORT_CUSTOM
+
+	def _viewKey(self, f_type, query):
+		return (self.manager._version, f_type, self.manager._sortMode, self.manager._showPath, query)
+
+	def updateFiles(self, selectKey=None):
+		if self.tabs.GetSelection() == 0:
+			self._updateFilterLabels(self.manager._savedIndex, len(self.manager._bookmarks))
+		else:
+			self._updateFilterLabels(self.manager._recentIndex, len(self.manager._recent))
+		f_type, query = self._filterState()
+		key = self._viewKey(f_type, query)
 		if self.tabs.GetSelection() == 0:
-			pinned = [x for x in self.manager._order if x in self.manager._pinned]
-			unpinned = [x for x in self.manager._order if x not in self.manager._pinned and x in self.manager._files]
-			if self.manager._sortMode == "UPPERCASE":
-				unpinned.sort(key=lambda x: x.upper())
-			elif self.manager._sortMode == "LOWERCASE":
-				unpinned.sort(key=lambda x: x.lower(), reverse=True)
-			items = pinned + unpinned
-			count = 0
-			for name in items:
-				path = self.manager._files[name]
-				if f_type == "all" or path.lower().endswith(exts.get(f_type, ())):
-					idx = self.listSaved.InsertItem(count, name)
-					if self.manager._showPath:
-						self.listSaved.SetItem(idx, 1, path)
-					count += 1
-			if self.listSaved.GetItemCount() > 0 and selectIdx < self.listSaved.GetItemCount():
-				self.listSaved.Select(selectIdx)
-				self.listSaved.Focus(selectIdx)
+			self.listSaved.sync(key, lambda: self._buildSavedRows(f_type, query), selectKey)
 			has_selection = self.listSaved.GetFirstSelected() != -1
 			self.btnEdit.Enable(has_selection)
 			self.btnRemove.Enable(has_selection)
-			self.btnAdd.Enable(bool(self.manager._newFile))
+			self.btnAdd.Enable(bool(self.manager._newPath))
+			self.btnAddSelected.Enable(self.manager._explorerWindow is not None)
 		else:
-			count = 0
-			for p in self.manager._recentFiles:
-				if f_type == "all" or p.lower().endswith(exts.get(f_type, ())):
-					idx = self.listRecent.InsertItem(count, os.path.basename(p))
-					self.listRecent.SetItem(idx, 1, p)
-					self._displayedRecentPaths.append(p)
-					count += 1
\ No newline at end of file
+			self.listRecent.sync(key, lambda: self._buildRecentRows(f_type, query), selectKey, selectFirst=False)
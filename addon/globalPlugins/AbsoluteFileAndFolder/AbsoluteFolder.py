@@ -1,236 +1,133 @@
 # AbsoluteFolder.py
 import os
 import wx
-import ui
-import api
 import gui
-import globalVars
-import json
-import time
-import ctypes
-from ctypes import wintypes
-import urllib.parse
-from comtypes.client import CreateObject as COMCreate
 import addonHandler
-import core
-import logHandler
+from . import bookmarkDialog
+from . import bookmarkManager
+from . import bookmarks
+from . import history
+from . import pathHealth
+from . import restore
+from . import search
+from . import startupRestore
+from . import virtualList
 
 addonHandler.initTranslation()
 
 TITLE = _("Absolute Folders")
 
-def get_system_uptime():
-	try:
-		kernel32 = ctypes.windll.kernel32
-		kernel32.GetTickCount64.argtypes = []
-		kernel32.GetTickCount64.restype = ctypes.c_ulonglong
-		return kernel32.GetTickCount64()
-	except Exception as e:
-		logHandler.log.warning(f"Failed to get system uptime: {e}", exc_info=True)
-		return 0
-
-class AbsoluteFolderManager:
+class AbsoluteFolderManager(bookmarkManager.BookmarkManager):
+	kind = pathHealth.KIND_FOLDER
+	legacyRecentKey = "recentFolders"
+	noun = "folder"
+
 	def __init__(self):
-		self._files = {}
-		self._order = []
-		self._pinned = set()
-		self._showPath = False
-		self._sortMode = "UPPERCASE"
-		self._newFolder = ""
+		super().__init__()
 		self._autoLoadLastFolder = False
 		self._lastOpenedFolders = []
-		self._recentFolders = []
-		self._lastSystemUptime = 0
-		self._systemRestartDetected = False
-		self.dialog = None
+		self._restoreConcurrency = restore.DEFAULT_CONCURRENCY
+		self._sessionStore = startupRestore.sessionStore()
+		# Bulk opens still running, cancelled when NVDA exits.
+		self._openPipelines = set()
 
 	def _get_config_path(self):
-		folder = os.path.join(globalVars.appArgs.configPath, "ChaiChaimee", "AbsoluteFileAndFloder")
-		return os.path.join(folder, "AbsoluteFolders.json")
-
-	def _getCurrentPathFromExplorer(self):
-		try:
-			fg = api.getForegroundObject()
-			if not fg or not fg.appModule or fg.appModule.appName != "explorer":
-				return None
-
-			shell = COMCreate("Shell.Application")
-			if not shell:
-				return None
-
-			for window in shell.Windows():
-				try:
-					if not window or window.hwnd != fg.windowHandle:
-						continue
-
-					if hasattr(window, "Document") and window.Document:
-						folder = window.Document.Folder
-						if folder and hasattr(folder, "Self"):
-							path = folder.Self.Path
-							if path and os.path.isdir(path):
-								return os.path.normpath(path)
-
-					if hasattr(window, "LocationURL") and window.LocationURL:
-						url = window.LocationURL
-						if url.startswith("file:///"):
-							path = urllib.parse.unquote(url[8:])
-							path = path.replace("/", "\\")
-							if os.path.isdir(path):
-								return os.path.normpath(path)
-
-					if hasattr(window, "LocationName") and window.LocationName:
-						possible_path = window.LocationName
-						if os.path.isabs(possible_path) and os.path.isdir(possible_path):
-							return os.path.normpath(possible_path)
-
-				except Exception:
-					continue
-
-			focus = api.getFocusObject()
-			if focus and focus.appModule and focus.appModule.appName == "explorer":
-				for window in shell.Windows():
-					try:
-						if not window or window.hwnd != focus.windowHandle:
-							continue
-						if hasattr(window, "Document") and window.Document:
-							folder = window.Document.Folder
-							if folder and hasattr(folder, "Self"):
-								path = folder.Self.Path
-								if path and os.path.isdir(path):
-									return os.path.normpath(path)
-					except Exception:
-						continue
-
-		except Exception as e:
-			logHandler.log.warning(f"Failed to get Explorer folder path: {e}", exc_info=True)
-		return None
-
-	def loadConfig(self):
-		config_path = self._get_config_path()
-		if os.path.isfile(config_path):
-			try:
-				with open(config_path, 'r', encoding='utf-8') as f:
-					data = json.load(f)
-				self._sortMode = data.get("sortMode", "UPPERCASE")
-				self._pinned = set(data.get("pinned", []))
-				self._showPath = data.get("showPath", False)
-				self._files = data.get("files", {})
-				self._order = data.get("order", list(self._files.keys()))
-				self._autoLoadLastFolder = data.get("autoLoadLastFolder", False)
-				self._lastOpenedFolders = data.get("lastOpenedFolders", [])
-				self._recentFolders = data.get("recentFolders", [])
-				self._lastSystemUptime = data.get("lastSystemUptime", 0)
-			except Exception as e:
-				logHandler.log.warning(f"Failed to load folder config: {e}", exc_info=True)
-
-	def saveConfig(self):
-		data = {
-			"sortMode": self._sortMode,
-			"files": self._files,
-			"order": self._order,
-			"pinned": list(self._pinned),
-			"showPath": self._showPath,
+		return startupRestore.configPath()
+
+	def _get_history_path(self):
+		return os.path.join(os.path.dirname(self._get_config_path()), "AbsoluteFoldersHistory.json")
+
+	def _accepts(self, path):
+		return os.path.isdir(path)
+
+	def _createDialog(self):
+		return AbsoluteFoldersDialog(gui.mainFrame, self)
+
+	def _loadData(self, data):
+		self._autoLoadLastFolder = data.get("autoLoadLastFolder", False)
+		self._lastOpenedFolders = data.get("lastOpenedFolders", [])
+		self._restoreConcurrency = restore.clampConcurrency(data.get("restoreConcurrency", restore.DEFAULT_CONCURRENCY))
+
+	def _configData(self):
+		return {
 			"autoLoadLastFolder": self._autoLoadLastFolder,
-			"lastOpenedFolders": self._lastOpenedFolders,
-			"recentFolders": self._recentFolders,
-			"lastSystemUptime": self._lastSystemUptime
+			"lastOpenedFolders": list(self._lastOpenedFolders),
+			"restoreConcurrency": self._restoreConcurrency
 		}
-		config_path = self._get_config_path()
-		try:
-			os.makedirs(os.path.dirname(config_path), exist_ok=True)
-			with open(config_path, 'w', encoding='utf-8') as f:
-				json.dump(data, f, ensure_ascii=False, indent=2)
-		except Exception as e:
-			logHandler.log.error(f"Failed to save folder config: {e}", exc_info=True)
-
-	def shouldAutoOpenOnStartup(self):
-		if not self._autoLoadLastFolder or not self._lastOpenedFolders:
-			return False
-		current_uptime = get_system_uptime()
-		if self._lastSystemUptime == 0:
-			self._lastSystemUptime = current_uptime
-			self.saveConfig()
+
+	# Saved folders join the auto-open list while it is in use and leave it when removed.
+	def _savedAdded(self, name, path):
+		super()._savedAdded(name, path)
+		if self._autoLoadLastFolder and path not in self._lastOpenedFolders:
+			self._lastOpenedFolders.append(path)
+
+	def _savedRemoved(self, name, entry):
+		super()._savedRemoved(name, entry)
+		if entry.path in self._lastOpenedFolders:
+			self._lastOpenedFolders.remove(entry.path)
+
+	# The auto-open list, or the folders of the last Explorer snapshot when it is empty.
+	def foldersToRestore(self):
+		return startupRestore.foldersToRestore(self._lastOpenedFolders, self._sessionStore)
+
+	# Puts opened folders on the auto-open list when it is in use.
+	# Opens several folders paced like the startup restore, so Explorer is not handed every
+	# window at once.
+	def openFolders(self, paths):
+		pipeline = restore.RestorePipeline(
+			paths,
+			concurrency=self._restoreConcurrency,
+			onDone=lambda report: self._openPipelines.discard(pipeline),
+			action="Opened"
+		)
+		self._openPipelines.add(pipeline)
+		pipeline.start()
+		return pipeline
+
+	def cancelOpening(self):
+		for pipeline in list(self._openPipelines):
+			pipeline.cancel()
+
+	def rememberOpened(self, paths):
+		if not self._autoLoadLastFolder:
 			return False
-		if current_uptime < self._lastSystemUptime:
-			self._lastSystemUptime = current_uptime
-			self.saveConfig()
-			return True
-		if current_uptime < 30000 and self._lastSystemUptime > 30000:
-			self._lastSystemUptime = current_uptime
+		new = [path for path in dict.fromkeys(paths) if path not in self._lastOpenedFolders]
+		if new:
+			self._lastOpenedFolders.extend(new)
 			self.saveConfig()
-			return True
-		self._lastSystemUptime = current_uptime
-		self.saveConfig()
-		return False
-
-	def addToRecent(self, path):
-		if path and os.path.isdir(path):
-			try:
-				if path in self._recentFolders:
-					self._recentFolders.remove(path)
-				self._recentFolders.insert(0, path)
-				self._recentFolders = self._recentFolders[:20]
-				self.saveConfig()
-			except Exception as e:
-				logHandler.log.warning(f"Failed to add to recent folders: {e}", exc_info=True)
-
-	def show(self):
-		self.loadConfig()
-		path = self._getCurrentPathFromExplorer()
-		if path and os.path.isdir(path):
-			self._newFolder = path
-		else:
-			self._newFolder = ""
-		self.dialog = AbsoluteFoldersDialog(gui.mainFrame, self)
-		gui.mainFrame.prePopup()
-		self.dialog.Show()
-		self.dialog.CentreOnScreen()
-		gui.mainFrame.postPopup()
-
-class AbsoluteFoldersDialog(wx.Dialog):
-	def __init__(self, parent, manager):
-		super().__init__(parent, title=TITLE, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER | wx.MAXIMIZE_BOX)
-		self.manager = manager
-		self._contextMenuOpen = False
-		self._initUI()
-		self._bindEvents()
-		self.updateFiles()
-		self.updateAutoOpenList()
-		self.timer = wx.Timer(self)
-		self.Bind(wx.EVT_TIMER, self.on_timeout, self.timer)
-		self.Bind(wx.EVT_ACTIVATE, self.on_activate)
-		self.timer.Start(15000)
-		wx.CallAfter(self.listSaved.SetFocus)
-
-	def _play_close_beep(self):
-		try:
-			import winsound
-			winsound.Beep(100, 100)
-		except Exception:
-			pass
-
-	def _reset_timer(self):
-		if self.timer and not self._contextMenuOpen:
-			self.timer.Stop()
-			self.timer.Start(15000)
-
-	def _stop_timer(self):
-		if self.timer:
-			self.timer.Stop()
-
-	def on_activate(self, event):
-		if event.GetActive():
-			self._contextMenuOpen = False
-			self._reset_timer()
-		event.Skip()
-
-	def on_timeout(self, event):
-		if not self._contextMenuOpen:
-			self._play_close_beep()
-			self.Close()
+		return bool(new)
+
+class AbsoluteFoldersDialog(bookmarkDialog.BookmarkDialog):
+	title = TITLE
+	messages = {
+		"noPath": _("No folder selected in Explorer to add."),
+		"noSelection": _("No folders selected in Explorer to add."),
+		"allSaved": _("All selected folders are already saved."),
+		"added": _("Added {} folders"),
+		"addedSkipped": _("Added {} folders, {} already saved"),
+		"openMany": _("Open {} folders?"),
+		"unavailable": _("Folder is {}: {}"),
+		"someUnavailable": _("{} of {} folders could not be opened")
+	}
+
+	def _resetControls(self):
+		self.chkShowPath.SetValue(self.manager._showPath)
+		self.chkAutoLoad.SetValue(self.manager._autoLoadLastFolder)
+		self.autoOpenPanel.Show(self.manager._autoLoadLastFolder)
+		self.spinConcurrency.SetValue(self.manager._restoreConcurrency)
+		self.btnEdit.Enable(True)
+		self.btnRemove.Enable(True)
+		self.Layout()
+		self.Fit()
 
 	def _initUI(self):
 		mainSizer = wx.BoxSizer(wx.VERTICAL)
+		searchSizer = wx.BoxSizer(wx.HORIZONTAL)
+		searchSizer.Add(wx.StaticText(self, label=_("&Search:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.searchField = wx.TextCtrl(self)
+		searchSizer.Add(self.searchField, 1, wx.EXPAND)
+		mainSizer.Add(searchSizer, 0, wx.EXPAND | wx.ALL, 5)
+
 		self.tabs = wx.Notebook(self)
 		self.panelSaved = wx.Panel(self.tabs)
 		self.panelRecent = wx.Panel(self.tabs)
@@ -239,27 +136,43 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		mainSizer.Add(self.tabs, 1, wx.EXPAND | wx.ALL, 5)
 
 		savedSizer = wx.BoxSizer(wx.VERTICAL)
-		self.listSaved = wx.ListCtrl(self.panelSaved, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
+		self.savedModel = virtualList.VirtualListModel()
+		self.listSaved = virtualList.VirtualListCtrl(self.panelSaved, self.savedModel, style=wx.LC_REPORT | wx.BORDER_SUNKEN, status=self._savedStatus)
 		self.listSaved.InsertColumn(0, _("Name"), width=250)
 		self.listSaved.InsertColumn(1, _("Path"), width=400)
+		self.listSaved.InsertColumn(2, _("Status"), width=120)
 		savedSizer.Add(self.listSaved, 1, wx.EXPAND | wx.ALL, 5)
 		self.panelSaved.SetSizer(savedSizer)
 
 		recentSizer = wx.BoxSizer(wx.VERTICAL)
-		self.listRecent = wx.ListCtrl(self.panelRecent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
+		self.recentModel = virtualList.VirtualListModel()
+		self.listRecent = virtualList.VirtualListCtrl(self.panelRecent, self.recentModel, style=wx.LC_REPORT | wx.BORDER_SUNKEN, status=self._recentStatus)
 		self.listRecent.InsertColumn(0, _("Folder Name"), width=250)
 		self.listRecent.InsertColumn(1, _("Path"), width=400)
+		self.listRecent.InsertColumn(2, _("Status"), width=120)
 		recentSizer.Add(self.listRecent, 1, wx.EXPAND | wx.ALL, 5)
+		recentBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
+		recentBtnSizer.Add(wx.StaticText(self.panelRecent, label=_("History si&ze:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.spinHistorySize = wx.SpinCtrl(
+			self.panelRecent,
+			min=history.MIN_CAPACITY,
+			max=history.MAX_CAPACITY,
+			initial=self.manager._recent.capacity
+		)
+		recentBtnSizer.Add(self.spinHistorySize, 0, wx.RIGHT, 10)
 		self.btnClearRecent = wx.Button(self.panelRecent, label=_("Clear History"))
-		recentSizer.Add(self.btnClearRecent, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
+		recentBtnSizer.Add(self.btnClearRecent, 0)
+		recentSizer.Add(recentBtnSizer, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
 		self.panelRecent.SetSizer(recentSizer)
 
 		btnSizer = wx.BoxSizer(wx.HORIZONTAL)
 		self.btnAdd = wx.Button(self, label=_("&Add"))
+		self.btnAddSelected = wx.Button(self, label=_("Add Se&lected"))
 		self.btnOpen = wx.Button(self, label=_("&Open"))
 		self.btnEdit = wx.Button(self, label=_("&Edit"))
 		self.btnRemove = wx.Button(self, label=_("&Remove"))
 		btnSizer.Add(self.btnAdd, 0, wx.RIGHT, 5)
+		btnSizer.Add(self.btnAddSelected, 0, wx.RIGHT, 5)
 		btnSizer.Add(self.btnOpen, 0, wx.RIGHT, 5)
 		btnSizer.Add(self.btnEdit, 0, wx.RIGHT, 5)
 		btnSizer.Add(self.btnRemove, 0, wx.RIGHT, 5)
@@ -270,10 +183,9 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		self.chkShowPath.SetValue(self.manager._showPath)
 		optionsSizer.Add(self.chkShowPath, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 
-		choices = [_("Custom order"), _("Ascending, a-z"), _("Descending z-a")]
+		choices = [_("Custom order"), _("Ascending, a-z"), _("Descending z-a"), _("Most used first")]
 		self.sortCombo = wx.ComboBox(self, choices=choices, style=wx.CB_READONLY)
-		mode_map = {"CUSTOM": 0, "UPPERCASE": 1, "LOWERCASE": 2}
-		self.sortCombo.SetSelection(mode_map.get(self.manager._sortMode, 1))
+		self._selectSortMode()
 		optionsSizer.Add(self.sortCombo, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 		mainSizer.Add(optionsSizer, 0, wx.EXPAND | wx.ALL, 5)
 
@@ -289,6 +201,16 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		self.listAutoOpen.InsertColumn(0, _("Folder Name"), width=250)
 		self.listAutoOpen.InsertColumn(1, _("Path"), width=400)
 		autoOpenListSizer.Add(self.listAutoOpen, 1, wx.EXPAND | wx.ALL, 5)
+		concurrencySizer = wx.BoxSizer(wx.HORIZONTAL)
+		concurrencySizer.Add(wx.StaticText(self.autoOpenPanel, label=_("Folders opened at &once:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.spinConcurrency = wx.SpinCtrl(
+			self.autoOpenPanel,
+			min=1,
+			max=restore.MAX_CONCURRENCY,
+			initial=self.manager._restoreConcurrency
+		)
+		concurrencySizer.Add(self.spinConcurrency, 0)
+		autoOpenListSizer.Add(concurrencySizer, 0, wx.ALL, 5)
 		self.autoOpenPanel.SetSizer(autoOpenListSizer)
 		autoOpenSizer.Add(self.autoOpenPanel, 0, wx.EXPAND | wx.ALL, 5)
 		if not self.manager._autoLoadLastFolder:
@@ -307,14 +229,18 @@ class AbsoluteFoldersDialog(wx.Dialog):
 
 	def _bindEvents(self):
 		self.tabs.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.onTabChanged)
+		self.searchField.Bind(wx.EVT_TEXT, self.onSearch)
 		self.chkShowPath.Bind(wx.EVT_CHECKBOX, self.onShowPathChanged)
 		self.sortCombo.Bind(wx.EVT_COMBOBOX, self.onSortChanged)
 		self.btnAdd.Bind(wx.EVT_BUTTON, self.onAdd)
+		self.btnAddSelected.Bind(wx.EVT_BUTTON, self.onAddSelected)
 		self.btnOpen.Bind(wx.EVT_BUTTON, self.onOpen)
 		self.btnEdit.Bind(wx.EVT_BUTTON, self.onEdit)
 		self.btnRemove.Bind(wx.EVT_BUTTON, self.onRemove)
 		self.btnClose.Bind(wx.EVT_BUTTON, lambda e: self.Close())
 		self.btnClearRecent.Bind(wx.EVT_BUTTON, self.onClearRecent)
+		self.spinHistorySize.Bind(wx.EVT_SPINCTRL, self.onHistorySizeChanged)
+		self.spinConcurrency.Bind(wx.EVT_SPINCTRL, self.onConcurrencyChanged)
 		self.listSaved.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onOpen)
 		self.listRecent.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onOpen)
 		self.listSaved.Bind(wx.EVT_CONTEXT_MENU, self.onContextMenu)
@@ -325,10 +251,6 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		self.Bind(wx.EVT_CHAR_HOOK, self.onCharHook)
 		self.Bind(wx.EVT_CLOSE, self.on_close)
 
-	def on_close(self, event):
-		self._stop_timer()
-		event.Skip()
-
 	def onAutoLoadChanged(self, evt):
 		self._reset_timer()
 		self.manager._autoLoadLastFolder = self.chkAutoLoad.GetValue()
@@ -347,7 +269,7 @@ class AbsoluteFoldersDialog(wx.Dialog):
 			return
 		menu = wx.Menu()
 		itemDelete = menu.Append(wx.ID_ANY, _("Delete"))
-		self.Bind(wx.EVT_MENU, self.onAutoOpenDelete, itemDelete)
+		menu.Bind(wx.EVT_MENU, self.onAutoOpenDelete, itemDelete)
 		self.listAutoOpen.PopupMenu(menu)
 		menu.Destroy()
 
@@ -363,17 +285,19 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		idx = self.listAutoOpen.GetFirstSelected()
 		if idx == -1:
 			return
-		if idx < len(self.manager._lastOpenedFolders):
-			folder_path = self.manager._lastOpenedFolders[idx]
+		# Missing folders are hidden from the list, so rows are matched by path, not position.
+		folder_path = self.listAutoOpen.GetItemText(idx, 1)
+		if folder_path in self.manager._lastOpenedFolders:
 			if gui.messageBox(_("Remove {} from auto-open list?").format(folder_path), TITLE, wx.YES_NO) == wx.YES:
-				self.manager._lastOpenedFolders.pop(idx)
+				self.manager._lastOpenedFolders.remove(folder_path)
 				self.manager.saveConfig()
 				self.updateAutoOpenList()
 
 	def onTabChanged(self, evt):
 		self.updateFiles()
 		is_saved_tab = self.tabs.GetSelection() == 0
-		self.btnAdd.Enable(is_saved_tab and bool(self.manager._newFolder))
+		self.btnAdd.Enable(is_saved_tab and bool(self.manager._newPath))
+		self.btnAddSelected.Enable(is_saved_tab and self.manager._explorerWindow is not None)
 		self.btnEdit.Enable(is_saved_tab)
 		self.btnRemove.Enable(is_saved_tab)
 		if is_saved_tab:
@@ -382,126 +306,12 @@ class AbsoluteFoldersDialog(wx.Dialog):
 			self.listRecent.SetFocus()
 		self._reset_timer()
 
-	def onCharHook(self, evt):
-		if evt.GetKeyCode() == wx.WXK_ESCAPE:
-			self.Close()
-		else:
-			evt.Skip()
-		self._reset_timer()
-
-	def onKeyDown(self, evt):
-		self._reset_timer()
-		if evt.GetKeyCode() == wx.WXK_DELETE:
-			if self.tabs.GetSelection() == 0:
-				self.onRemove(None)
-		else:
-			evt.Skip()
-
 	def onShowPathChanged(self, evt):
 		self._reset_timer()
 		self.manager._showPath = self.chkShowPath.GetValue()
 		self.manager.saveConfig()
 		self.updateFiles()
 
-	def onSortChanged(self, evt):
-		self._reset_timer()
-		idx = self.sortCombo.GetSelection()
-		self.manager._sortMode = ["CUSTOM", "UPPERCASE", "LOWERCASE"][idx]
-		self.manager.saveConfig()
-		self.updateFiles()
-
-	def onAdd(self, evt):
-		self._reset_timer()
-		if not self.manager._newFolder:
-			ui.message(_("No folder selected in Explorer to add."))
-			return
-		default = os.path.basename(self.manager._newFolder)
-		dlg = wx.TextEntryDialog(self, _("Enter display name"), TITLE, default)
-		if dlg.ShowModal() == wx.ID_OK:
-			name = dlg.GetValue().strip()
-			if name:
-				if name in self.manager._files:
-					gui.messageBox(_("This name already exists."), TITLE, wx.OK | wx.ICON_WARNING)
-				else:
-					self.manager._files[name] = self.manager._newFolder
-					if name not in self.manager._order:
-						self.manager._order.append(name)
-					if self.manager._autoLoadLastFolder and self.manager._newFolder not in self.manager._lastOpenedFolders:
-						self.manager._lastOpenedFolders.append(self.manager._newFolder)
-					self.manager.saveConfig()
-					self.updateFiles()
-					self.updateAutoOpenList()
-		dlg.Destroy()
-
-	def onOpen(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() == 0:
-			lst = self.listSaved
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				return
-			name = lst.GetItemText(idx, 0)
-			path = self.manager._files.get(name)
-		else:
-			lst = self.listRecent
-			idx = lst.GetFirstSelected()
-			if idx == -1:
-				return
-			path = self.manager._recentFolders[idx]
-		if path and os.path.isdir(path):
-			os.startfile(path)
-			self.manager.addToRecent(path)
-			if self.manager._autoLoadLastFolder and path not in self.manager._lastOpenedFolders:
-				self.manager._lastOpenedFolders.append(path)
-				self.manager.saveConfig()
-				self.updateAutoOpenList()
-			self.Close()
-
-	def onEdit(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() != 0:
-			return
-		idx = self.listSaved.GetFirstSelected()
-		if idx == -1:
-			return
-		oldName = self.listSaved.GetItemText(idx, 0)
-		dlg = wx.TextEntryDialog(self, _("Rename"), TITLE, oldName)
-		if dlg.ShowModal() == wx.ID_OK:
-			newName = dlg.GetValue().strip()
-			if newName and newName != oldName:
-				if newName in self.manager._files:
-					gui.messageBox(_("This name already exists."), TITLE, wx.OK | wx.ICON_WARNING)
-				else:
-					path = self.manager._files.pop(oldName)
-					self.manager._files[newName] = path
-					self.manager._order = [newName if x == oldName else x for x in self.manager._order]
-					if oldName in self.manager._pinned:
-						self.manager._pinned.remove(oldName)
-						self.manager._pinned.add(newName)
-					self.manager.saveConfig()
-					self.updateFiles()
-		dlg.Destroy()
-
-	def onRemove(self, evt):
-		self._reset_timer()
-		if self.tabs.GetSelection() != 0:
-			return
-		idx = self.listSaved.GetFirstSelected()
-		if idx == -1:
-			return
-		name = self.listSaved.GetItemText(idx, 0)
-		if gui.messageBox(_("Remove {}?").format(name), TITLE, wx.YES_NO) == wx.YES:
-			path = self.manager._files.get(name)
-			self.manager._files.pop(name, None)
-			if name in self.manager._order:
-				self.manager._order.remove(name)
-			self.manager._pinned.discard(name)
-			if path and path in self.manager._lastOpenedFolders:
-				self.manager._lastOpenedFolders.remove(path)
-			self.manager.saveConfig()
-			self.updateFiles()
-			self.updateAutoOpenList()
-
 	def onContextMenu(self, evt):
 		self._stop_timer()
 		self._contextMenuOpen = True
@@ -511,31 +321,40 @@ class AbsoluteFoldersDialog(wx.Dialog):
 			self._reset_timer()
 			return
 		
-		idx = self.listSaved.GetFirstSelected()
-		if idx == -1:
+		names = self.listSaved.selectedKeys()
+		if not names:
 			self._contextMenuOpen = False
 			self._reset_timer()
 			return
 		
-		name = self.listSaved.GetItemText(idx, 0)
 		menu = wx.Menu()
 		
-		pin_label = _("Unpin") if name in self.manager._pinned else _("Pin to top")
+		# With several bookmarks selected, Pin pins them all unless all are pinned already.
+		allPinned = all(self.manager._bookmarks.isPinned(name) for name in names)
+		pin_label = _("Unpin") if allPinned else _("Pin to top")
 		itemPin = menu.Append(wx.ID_ANY, pin_label)
 		menu.AppendSeparator()
-		itemEdit = menu.Append(wx.ID_ANY, _("Edit"))
+		if len(names) == 1:
+			itemEdit = menu.Append(wx.ID_ANY, _("Edit"))
+			menu.Bind(wx.EVT_MENU, self.onEdit, itemEdit)
 		itemDelete = menu.Append(wx.ID_ANY, _("Delete"))
 		
 		if self.manager._sortMode == "CUSTOM":
 			menu.AppendSeparator()
 			itemUp = menu.Append(wx.ID_ANY, _("Move Up"))
 			itemDown = menu.Append(wx.ID_ANY, _("Move Down"))
-			self.Bind(wx.EVT_MENU, lambda e: self.moveItem(name, -1), itemUp)
-			self.Bind(wx.EVT_MENU, lambda e: self.moveItem(name, 1), itemDown)
+			itemTop = menu.Append(wx.ID_ANY, _("Move to Top"))
+			itemBottom = menu.Append(wx.ID_ANY, _("Move to Bottom"))
+			menu.Bind(wx.EVT_MENU, lambda e: self.moveItems(names, -1), itemUp)
+			menu.Bind(wx.EVT_MENU, lambda e: self.moveItems(names, 1), itemDown)
+			menu.Bind(wx.EVT_MENU, lambda e: self.moveItemsToEdge(names, False), itemTop)
+			menu.Bind(wx.EVT_MENU, lambda e: self.moveItemsToEdge(names, True), itemBottom)
+			if len(names) == 1:
+				itemPosition = menu.Append(wx.ID_ANY, _("Move to Position..."))
+				menu.Bind(wx.EVT_MENU, lambda e: self.onMoveToPosition(names[0]), itemPosition)
 		
-		self.Bind(wx.EVT_MENU, lambda e: self.onTogglePin(name), itemPin)
-		self.Bind(wx.EVT_MENU, self.onEdit, itemEdit)
-		self.Bind(wx.EVT_MENU, self.onRemove, itemDelete)
+		menu.Bind(wx.EVT_MENU, lambda e: self.onSetPinned(names, not allPinned), itemPin)
+		menu.Bind(wx.EVT_MENU, self.onRemove, itemDelete)
 		
 		def on_menu_close(event):
 			self._contextMenuOpen = False
@@ -546,76 +365,68 @@ class AbsoluteFoldersDialog(wx.Dialog):
 		self.listSaved.PopupMenu(menu)
 		menu.Destroy()
 
-	def onTogglePin(self, name):
-		self._reset_timer()
-		if name in self.manager._pinned:
-			self.manager._pinned.remove(name)
+	def _open(self, paths, unavailable):
+		if len(paths) == 1:
+			os.startfile(paths[0])
 		else:
-			self.manager._pinned.add(name)
-		self.manager.saveConfig()
-		self.updateFiles()
+			self.manager.openFolders(paths)
+		if self.manager.rememberOpened(paths):
+			self.updateAutoOpenList()
+		return paths
 
-	def moveItem(self, targetName, direction):
+	def onConcurrencyChanged(self, evt):
 		self._reset_timer()
-		
-		pinnedList = [x for x in self.manager._order if x in self.manager._pinned]
-		unpinnedList = [x for x in self.manager._order if x not in self.manager._pinned and x in self.manager._files]
-		
-		if targetName in pinnedList:
-			currentIndex = pinnedList.index(targetName)
-			newIndex = currentIndex + direction
-			if 0 <= newIndex < len(pinnedList):
-				pinnedList[currentIndex], pinnedList[newIndex] = pinnedList[newIndex], pinnedList[currentIndex]
-				self.manager._order = pinnedList + unpinnedList
-				self.manager.saveConfig()
-				self.updateFiles(newIndex)
+		self.manager._restoreConcurrency = restore.clampConcurrency(self.spinConcurrency.GetValue())
+		self.manager.saveConfig()
+
+	def _buildSavedRows(self, query):
+		showPath = self.manager._showPath
+		if query:
+			names = self.manager._savedSearch.search(query, search.RESULT_LIMIT)
 		else:
-			currentIndex = unpinnedList.index(targetName)
-			newIndex = currentIndex + direction
-			if 0 <= newIndex < len(unpinnedList):
-				unpinnedList[currentIndex], unpinnedList[newIndex] = unpinnedList[newIndex], unpinnedList[currentIndex]
-				self.manager._order = pinnedList + unpinnedList
-				self.manager.saveConfig()
-				self.updateFiles(len(pinnedList) + newIndex)
+			names = self.manager.savedView()[0]
+		path = self.manager._bookmarks.path
+		return [(name, path(name) if showPath else "", name) for name in names]
+
+	def _buildRecentRows(self, query):
+		showPath = self.manager._showPath
+		if query:
+			paths = self.manager._recentSearch.search(query, search.RESULT_LIMIT)
+		elif self.manager._sortMode == "FRECENCY":
+			paths = sorted(self.manager._recent, key=self.manager._frecency.logScore, reverse=True)
+		else:
+			paths = self.manager._recent
+		return [(os.path.basename(path), path if showPath else "", path) for path in paths]
 
-	def onClearRecent(self, evt):
-		self._reset_timer()
-		if gui.messageBox(_("Clear history?"), TITLE, wx.YES_NO) == wx.YES:
-			self.manager._recentFolders = []
-			self.manager.saveConfig()
-			self.updateFiles()
-
-	def updateFiles(self, selectIdx=0):
-		self.listSaved.DeleteAllItems()
-		self.listRecent.DeleteAllItems()
+	def _savedViewKey(self):
+		return self._viewKey(self.searchField.GetValue().strip())
+
+	# Unfiltered custom order matches the rows one to one.
+	def _showsFullOrder(self):
+		return not self.searchField.GetValue().strip() and self.manager._sortMode == bookmarks.SORT_CUSTOM
+
+	def _viewKey(self, query):
+		return (self.manager._version, self.manager._sortMode, self.manager._showPath, query)
+
+	def updateFiles(self, selectKey=None):
+		query = self.searchField.GetValue().strip()
+		key = self._viewKey(query)
 		if self.tabs.GetSelection() == 0:
-			pinned = [x for x in self.manager._order if x in self.manager._pinned]
-			unpinned = [x for x in self.manager._order if x not in self.manager._pinned and x in self.manager._files]
-			if self.manager._sortMode == "UPPERCASE":
-				unpinned.sort(key=lambda x: x.upper())
-			elif self.manager._sortMode == "LOWERCASE":
-				unpinned.sort(key=lambda x: x.lower(), reverse=True)
-			items = pinned + unpinned
-			for i, name in enumerate(items):
-				self.listSaved.InsertItem(i, name)
-				if self.manager._showPath:
-					self.listSaved.SetItem(i, 1, self.manager._files[name])
-			if self.listSaved.GetItemCount() > 0 and selectIdx < self.listSaved.GetItemCount():
-				self.listSaved.Select(selectIdx)
-				self.listSaved.Focus(selectIdx)
+			self.listSaved.sync(key, lambda: self._buildSavedRows(query), selectKey)
 			has_selection = self.listSaved.GetFirstSelected() != -1
 			self.btnEdit.Enable(has_selection)
 			self.btnRemove.Enable(has_selection)
-			self.btnAdd.Enable(bool(self.manager._newFolder))
+			self.btnAdd.Enable(bool(self.manager._newPath))
+			self.btnAddSelected.Enable(self.manager._explorerWindow is not None)
 		else:
-			for i, path in enumerate(self.manager._recentFolders):
-				self.listRecent.InsertItem(i, os.path.basename(path))
-				if self.manager._showPath:
-					self.listRecent.SetItem(i, 1, path)
+			self.listRecent.sync(key, lambda: self._buildRecentRows(query), selectKey, selectFirst=False)
+
+	def _updateExtraLists(self):
+		self.updateAutoOpenList()
 
 	def updateAutoOpenList(self):
 		self.listAutoOpen.DeleteAllItems()
-		for i, path in enumerate(self.manager._lastOpenedFolders):
-			if os.path.isdir(path):
-				self.listAutoOpen.InsertItem(i, os.path.basename(path))
-				self.listAutoOpen.SetItem(i, 1, path)
\ No newline at end of file
+		for path in self.manager._lastOpenedFolders:
+			if pathHealth.cache.state(path, pathHealth.KIND_FOLDER) != pathHealth.MISSING:
+				index = self.listAutoOpen.InsertItem(self.listAutoOpen.GetItemCount(), os.path.basename(path))
+				self.listAutoOpen.SetItem(index, 1, path)
\ No newline at end of file
@@ -2,22 +2,27 @@
 # Copyright (C) 2026 'Chai Chaimee'
 # Licensed under GNU General Public License. See COPYING.txt for details.
 
+import sys
 import time
-import wx
+import threading
 import globalPluginHandler
 import scriptHandler
 import addonHandler
 import core
 import os
-import shutil
 import globalVars
 import logHandler
-from . import AbsoluteFile
-from . import AbsoluteFolder
 
 addonHandler.initTranslation()
 
+# Only the gesture bindings and the deferred restore check are loaded with NVDA; the
+# managers, dialogs and Explorer/COM code are imported on first use.
+
+def _loadedModule(name):
+	return sys.modules.get(f"{__name__}.{name}")
+
 def _migrate_config_files():
+	import shutil
 	config_path = globalVars.appArgs.configPath
 	new_folder = os.path.join(config_path, "ChaiChaimee", "AbsoluteFileAndFloder")
 	if not os.path.isdir(new_folder):
@@ -44,30 +49,95 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 	def __init__(self):
 		super().__init__()
-		_migrate_config_files()
+		self._configMigrated = False
 		self._pending_call_id = None
 		self._last_tap_time = 0.0
 		self._tap_count = 0
 		self._tap_threshold = 0.4
+		self._folderManager = None
+		self._fileManager = None
+		self._managerLock = threading.Lock()
+		self._quickOpen = None
+		self._prefetch = None
+		self._restore = None
+		self._session = None
+		self._autoOpenAtStartup = False
+		self.lastOpenTiming = None
+		self.lastRestoreReport = None
 		core.callLater(3000, self._checkAndOpenLastFolders)
 
+	def _ensureConfigMigrated(self):
+		if not self._configMigrated:
+			self._configMigrated = True
+			_migrate_config_files()
+
+	def _getFolderManager(self):
+		with self._managerLock:
+			if self._folderManager is None:
+				self._ensureConfigMigrated()
+				from . import AbsoluteFolder
+				self._folderManager = AbsoluteFolder.AbsoluteFolderManager()
+			return self._folderManager
+
+	def _getFileManager(self):
+		with self._managerLock:
+			if self._fileManager is None:
+				self._ensureConfigMigrated()
+				from . import AbsoluteFile
+				self._fileManager = AbsoluteFile.AbsoluteFileManager()
+			return self._fileManager
+
+	def _getQuickOpen(self):
+		if self._quickOpen is None:
+			from . import palette
+			self._quickOpen = palette.QuickOpen(self._getFileManager, self._getFolderManager)
+		return self._quickOpen
+
+	# Runs without the managers: only the boot marker, the folder config and the session
+	# file are read, and the restore pipeline is imported when folders are to be opened.
 	def _checkAndOpenLastFolders(self):
 		try:
-			folder_manager = AbsoluteFolder.AbsoluteFolderManager()
-			folder_manager.loadConfig()
-			if folder_manager.shouldAutoOpenOnStartup() and folder_manager._lastOpenedFolders:
-				for i, folder_path in enumerate(folder_manager._lastOpenedFolders):
-					if folder_path and os.path.isdir(folder_path):
-						core.callLater(1000 + (i * 500), lambda p=folder_path: self._openSingleFolder(p))
+			self._ensureConfigMigrated()
+			from . import startupRestore
+			folders, settings = startupRestore.check()
+			self._autoOpenAtStartup = bool(settings.get("autoLoadLastFolder", False))
+			if folders:
+				from . import restore
+				self._restore = restore.RestorePipeline(
+					folders,
+					concurrency=restore.clampConcurrency(settings.get("restoreConcurrency", restore.DEFAULT_CONCURRENCY)),
+					onDone=self._onRestoreDone
+				)
+				self._restore.start()
+				return
 		except Exception as e:
 			logHandler.log.warning(f"Failed to check auto-open folders: {e}", exc_info=True)
+		self._startSessionSnapshots()
 
-	def _openSingleFolder(self, folder_path):
-		try:
-			if folder_path and os.path.isdir(folder_path):
-				os.startfile(folder_path)
-		except Exception as e:
-			logHandler.log.warning(f"Failed to open folder on startup: {e}", exc_info=True)
+	def _onRestoreDone(self, report):
+		self.lastRestoreReport = report
+		self._restore = None
+		# Only start recording once the previous session is back, so it is never
+		# overwritten by the still-empty desktop.
+		self._startSessionSnapshots()
+
+	def _startSessionSnapshots(self):
+		if self._session is not None:
+			return
+		from . import session
+		from . import startupRestore
+		self._session = session.SessionSnapshotter(
+			startupRestore.sessionStore(),
+			enabled=self._autoOpenEnabled
+		)
+		self._session.start()
+
+	# The folder manager holds the setting once it exists; until then, the value read at startup.
+	def _autoOpenEnabled(self):
+		folder_manager = self._folderManager
+		if folder_manager is not None:
+			return folder_manager._autoLoadLastFolder
+		return self._autoOpenAtStartup
 
 	@scriptHandler.script(
 		description=_("Open Absolute Folders (single tap) or Absolute Files (double tap)"),
@@ -85,19 +155,62 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			self._pending_call_id.cancel()
 			self._pending_call_id = None
 
+		if self._tap_count == 1:
+			from . import explorer
+			from . import prefetch
+			self._prefetch = prefetch.Prefetch(
+				(self._getFolderManager, self._getFileManager),
+				explorer.getExplorerHandles()
+			)
+
 		def execute_action():
+			explorerPaths = None
+			if self._prefetch is not None:
+				from . import prefetch
+				explorerPaths, self.lastOpenTiming = self._prefetch.result(prefetch.RESULT_TIMEOUT_S)
+				self._prefetch = None
+				logHandler.log.debug(
+					"Absolute manager prefetch: {workMs:.1f} ms of work, {hiddenMs:.1f} ms hidden "
+					"behind the tap window, {blockedMs:.1f} ms blocking".format(**self.lastOpenTiming)
+				)
 			if self._tap_count == 1:
-				manager = AbsoluteFolder.AbsoluteFolderManager()
-				manager.show()
+				self._getFolderManager().show(explorerPaths)
 			elif self._tap_count >= 2:
-				manager = AbsoluteFile.AbsoluteFileManager()
-				manager.show()
+				self._getFileManager().show(explorerPaths)
 			self._tap_count = 0
 			self._pending_call_id = None
 
 		self._pending_call_id = core.callLater(int(self._tap_threshold * 1000), execute_action)
 
+	@scriptHandler.script(
+		description=_("Quick open saved and recent files and folders"),
+		category=_("Absolute File and Folder"),
+		gesture="kb:windows+shift+backspace"
+	)
+	def script_quickOpen(self, gesture):
+		self._getQuickOpen().show()
+
 	def terminate(self):
 		if self._pending_call_id is not None:
 			self._pending_call_id.cancel()
+		if self._restore is not None:
+			self._restore.cancel()
+		if self._folderManager is not None:
+			self._folderManager.cancelOpening()
+		if self._session is not None:
+			self._session.stop()
+		dialogPool = _loadedModule("dialogPool")
+		if dialogPool is not None:
+			dialogPool.pool.flush()
+		persistence = _loadedModule("persistence")
+		if persistence is not None:
+			persistence.service.stop()
+		explorer = _loadedModule("explorer")
+		if explorer is not None:
+			explorer.resolver.stop()
+		if dialogPool is not None:
+			dialogPool.pool.destroyAll()
+		pathHealth = _loadedModule("pathHealth")
+		if pathHealth is not None:
+			pathHealth.cache.shutdown()
 		super().terminate()
\ No newline at end of file
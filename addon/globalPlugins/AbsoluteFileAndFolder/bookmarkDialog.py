@@ -0,0 +1,429 @@
+# bookmarkDialog.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Behaviour shared by the Absolute Files and Absolute Folders dialogs on top of a
+# bookmarkManager.BookmarkManager: the idle close timer, health refreshes, opening,
+# adding, renaming and removing bookmarks, and moving them in the custom order with one
+# save per burst of moves. Subclasses build the controls (listSaved, listRecent, tabs,
+# searchField, spinHistorySize) and the rows, and name their kind of item in messages.
+
+import os
+import abc
+import time
+import wx
+import ui
+import gui
+import addonHandler
+from . import bookmarks
+from . import pathHealth
+
+addonHandler.initTranslation()
+
+# Moves made within this time of each other are saved together.
+MOVE_SAVE_DELAY_MS = 800
+# Places moved by Alt+Page Up and Alt+Page Down.
+MOVE_PAGE = 10
+# Opening more items than this at once asks first.
+OPEN_CONFIRM_COUNT = 10
+
+
+# wx.Dialog has a metaclass of its own, so the abstract methods need one deriving from both.
+class _DialogMeta(abc.ABCMeta, type(wx.Dialog)):
+	pass
+
+
+class BookmarkDialog(wx.Dialog, metaclass=_DialogMeta):
+	title = ""
+	# Translated texts naming the kind of item; see AbsoluteFilesDialog for the keys.
+	messages = {}
+
+	def __init__(self, parent, manager):
+		super().__init__(parent, title=self.title, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER | wx.MAXIMIZE_BOX)
+		self.manager = manager
+		self._contextMenuOpen = False
+		self._healthUpdatePending = False
+		self._moveSave = None
+		self._selectionPending = False
+		self._initUI()
+		self._bindEvents()
+		pathHealth.cache.addListener(self._onHealthChanged)
+		self.Bind(wx.EVT_WINDOW_DESTROY, self._onDestroy)
+		self.updateFiles()
+		self._updateExtraLists()
+		self.timer = wx.Timer(self)
+		self.Bind(wx.EVT_TIMER, self.on_timeout, self.timer)
+		self.Bind(wx.EVT_ACTIVATE, self.on_activate)
+		self.timer.Start(15000)
+		wx.CallAfter(self.listSaved.SetFocus)
+
+	@abc.abstractmethod
+	def _initUI(self):
+		pass
+
+	@abc.abstractmethod
+	def _bindEvents(self):
+		pass
+
+	@abc.abstractmethod
+	def updateFiles(self, selectKey=None):
+		pass
+
+	# Puts the subclass's own controls back to the manager's settings when a pooled
+	# dialog is shown again.
+	@abc.abstractmethod
+	def _resetControls(self):
+		pass
+
+	# Key of the Saved rows as currently filtered; the rows are rebuilt when it changes.
+	@abc.abstractmethod
+	def _savedViewKey(self):
+		pass
+
+	# Whether the Saved list shows every bookmark in custom order, one row per position.
+	@abc.abstractmethod
+	def _showsFullOrder(self):
+		pass
+
+	# Opens the available paths and returns the ones opened; paths that fail are added
+	# to unavailable as (path, state).
+	@abc.abstractmethod
+	def _open(self, paths, unavailable):
+		pass
+
+	def _selectSortMode(self):
+		mode = self.manager._sortMode
+		if mode not in bookmarks.SORT_MODES:
+			mode = bookmarks.SORT_ASCENDING
+		self.sortCombo.SetSelection(bookmarks.SORT_MODES.index(mode))
+
+	# Called by the dialog pool before a hidden dialog is shown again.
+	def refresh(self):
+		self._selectSortMode()
+		self.searchField.ChangeValue("")
+		self.spinHistorySize.SetValue(self.manager._recent.capacity)
+		self.tabs.ChangeSelection(0)
+		self._contextMenuOpen = False
+		self._resetControls()
+		self.listSaved.clearSelection()
+		self.listRecent.clearSelection()
+		self.updateFiles()
+		self._updateExtraLists()
+		self.timer.Start(15000)
+		wx.CallAfter(self.listSaved.SetFocus)
+
+	# Other lists showing bookmarks, refreshed with the Saved list after changes.
+	def _updateExtraLists(self):
+		pass
+
+	def _play_close_beep(self):
+		try:
+			import winsound
+			winsound.Beep(100, 100)
+		except Exception:
+			pass
+
+	def _reset_timer(self):
+		if self.timer and not self._contextMenuOpen:
+			self.timer.Stop()
+			self.timer.Start(15000)
+
+	def _stop_timer(self):
+		if self.timer:
+			self.timer.Stop()
+
+	def on_activate(self, event):
+		if event.GetActive():
+			self._contextMenuOpen = False
+			self._reset_timer()
+		event.Skip()
+
+	def on_timeout(self, event):
+		if not self._contextMenuOpen:
+			self._play_close_beep()
+			self.Close()
+
+	def _onHealthChanged(self):
+		# Called from the checker threads; coalesce into one refresh on the GUI thread.
+		if not self._healthUpdatePending:
+			self._healthUpdatePending = True
+			wx.CallAfter(self._applyHealth)
+
+	# Only the status column changes, so the rows stay and the ones on screen are redrawn.
+	def _applyHealth(self):
+		self._healthUpdatePending = False
+		if self.IsShown():
+			if self.tabs.GetSelection() == 0:
+				self.listSaved.refreshVisible()
+			else:
+				self.listRecent.refreshVisible()
+			self._updateExtraLists()
+
+	# Status column of the lists, looked up only for the rows being drawn.
+	def _savedStatus(self, row):
+		return pathHealth.describe(pathHealth.cache.state(self.manager._bookmarks.path(row[2]), self.manager.kind))
+
+	def _recentStatus(self, row):
+		return pathHealth.describe(pathHealth.cache.state(row[2], self.manager.kind))
+
+	def _onDestroy(self, evt):
+		# Child windows send this too; only the dialog's own ends the health updates.
+		if evt.GetEventObject() is self:
+			pathHealth.cache.removeListener(self._onHealthChanged)
+		evt.Skip()
+
+	def on_close(self, event):
+		self._stop_timer()
+		self._saveMoves()
+		if event.CanVeto():
+			event.Veto()
+			self.Hide()
+		else:
+			event.Skip()
+
+	def flush(self):
+		self._saveMoves()
+
+	def onSearch(self, evt):
+		self._reset_timer()
+		self.updateFiles()
+
+	def onSortChanged(self, evt):
+		self._reset_timer()
+		idx = self.sortCombo.GetSelection()
+		self.manager._sortMode = bookmarks.SORT_MODES[idx]
+		self.manager.saveConfig()
+		self.updateFiles()
+
+	def onCharHook(self, evt):
+		if evt.GetKeyCode() == wx.WXK_ESCAPE:
+			self.Close()
+		else:
+			evt.Skip()
+		self._reset_timer()
+
+	def onKeyDown(self, evt):
+		self._reset_timer()
+		if evt.GetKeyCode() == wx.WXK_DELETE:
+			if self.tabs.GetSelection() == 0:
+				self.onRemove(None)
+		elif not (evt.AltDown() and self._moveByKey(evt.GetKeyCode())):
+			evt.Skip()
+
+	# Alt+Up/Down move the selected bookmarks one place, Alt+Page Up/Down by MOVE_PAGE and
+	# Alt+Home/End to the top or bottom of their group, in custom order only.
+	def _moveByKey(self, key):
+		if self.tabs.GetSelection() != 0 or self.manager._sortMode != bookmarks.SORT_CUSTOM:
+			return False
+		names = self.listSaved.selectedKeys()
+		if not names:
+			return False
+		offsets = {wx.WXK_UP: -1, wx.WXK_DOWN: 1, wx.WXK_PAGEUP: -MOVE_PAGE, wx.WXK_PAGEDOWN: MOVE_PAGE}
+		if key in offsets:
+			self.moveItems(names, offsets[key])
+		elif key in (wx.WXK_HOME, wx.WXK_END):
+			self.moveItemsToEdge(names, key == wx.WXK_END)
+		else:
+			return False
+		return True
+
+	# Paths of the selected rows on the current tab.
+	def _selectedPaths(self):
+		if self.tabs.GetSelection() == 0:
+			return [self.manager._bookmarks.path(name) for name in self.listSaved.selectedKeys()]
+		return self.listRecent.selectedKeys()
+
+	def onOpen(self, evt):
+		self._reset_timer()
+		paths = self._selectedPaths()
+		if not paths:
+			return
+		if len(paths) > OPEN_CONFIRM_COUNT:
+			if gui.messageBox(self.messages["openMany"].format(len(paths)), self.title, wx.YES_NO) != wx.YES:
+				return
+		available = []
+		unavailable = []
+		kind = self.manager.kind
+		# Every check is started first, so the paths share one timeout instead of
+		# waiting for theirs one after another.
+		pathHealth.cache.refresh(paths, kind)
+		deadline = time.monotonic() + pathHealth.cache.timeout
+		for path in paths:
+			state = pathHealth.cache.verify(path, kind, max(0.0, deadline - time.monotonic()))
+			if state != pathHealth.OK:
+				unavailable.append((path, state))
+			else:
+				available.append(path)
+		opened = self._open(available, unavailable) if available else []
+		if unavailable:
+			if len(paths) == 1:
+				path, state = unavailable[0]
+				ui.message(self.messages["unavailable"].format(pathHealth.describe(state), path))
+			else:
+				ui.message(self.messages["someUnavailable"].format(len(unavailable), len(paths)))
+			self.updateFiles()
+		if opened:
+			self.manager.addAllToRecent(opened)
+			self.Close()
+
+	def onAdd(self, evt):
+		self._reset_timer()
+		path = self.manager._newPath
+		if not path:
+			ui.message(self.messages["noPath"])
+			return
+		dlg = wx.TextEntryDialog(self, _("Enter display name"), self.title, os.path.basename(path))
+		if dlg.ShowModal() == wx.ID_OK:
+			name = dlg.GetValue().strip()
+			if name:
+				if name in self.manager._bookmarks:
+					gui.messageBox(_("This name already exists."), self.title, wx.OK | wx.ICON_WARNING)
+				else:
+					self.manager.addBookmark(name, path)
+					self.updateFiles(name)
+					self._updateExtraLists()
+		dlg.Destroy()
+
+	# Adds every item selected in Explorer at once, named after the items. The selection is
+	# read on the resolver worker and added back on the GUI thread.
+	def onAddSelected(self, evt):
+		self._reset_timer()
+		if self._selectionPending:
+			return
+		self._selectionPending = True
+		self.manager.selectedInExplorer(lambda paths: wx.CallAfter(self._addSelected, paths))
+
+	def _addSelected(self, paths):
+		self._selectionPending = False
+		if not self:
+			return
+		if not paths:
+			ui.message(self.messages["noSelection"])
+			return
+		added = self.manager.addBookmarks(paths)
+		if not added:
+			ui.message(self.messages["allSaved"])
+			return
+		self.updateFiles(added[0])
+		self._updateExtraLists()
+		skipped = len(paths) - len(added)
+		if skipped:
+			ui.message(self.messages["addedSkipped"].format(len(added), skipped))
+		else:
+			ui.message(self.messages["added"].format(len(added)))
+
+	def onEdit(self, evt):
+		self._reset_timer()
+		if self.tabs.GetSelection() != 0:
+			return
+		idx = self.listSaved.GetFirstSelected()
+		if idx == -1:
+			return
+		oldName = self.listSaved.GetItemText(idx, 0)
+		dlg = wx.TextEntryDialog(self, _("Rename"), self.title, oldName)
+		if dlg.ShowModal() == wx.ID_OK:
+			newName = dlg.GetValue().strip()
+			if newName and newName != oldName:
+				if newName in self.manager._bookmarks:
+					gui.messageBox(_("This name already exists."), self.title, wx.OK | wx.ICON_WARNING)
+				else:
+					self.manager.renameBookmark(oldName, newName)
+					self.updateFiles(newName)
+		dlg.Destroy()
+
+	def onRemove(self, evt):
+		self._reset_timer()
+		if self.tabs.GetSelection() != 0:
+			return
+		names = self.listSaved.selectedKeys()
+		if not names:
+			return
+		if len(names) == 1:
+			question = _("Remove {}?").format(names[0])
+		else:
+			question = _("Remove {} bookmarks?").format(len(names))
+		if gui.messageBox(question, self.title, wx.YES_NO) == wx.YES:
+			self.manager.removeBookmarks(names)
+			self.updateFiles()
+			self._updateExtraLists()
+
+	def onHistorySizeChanged(self, evt):
+		self._reset_timer()
+		self.manager.setHistoryCapacity(self.spinHistorySize.GetValue())
+		self.updateFiles()
+
+	def onClearRecent(self, evt):
+		self._reset_timer()
+		if gui.messageBox(_("Clear history?"), self.title, wx.YES_NO) == wx.YES:
+			self.manager.clearRecent()
+			self.updateFiles()
+
+	def onSetPinned(self, names, pinned):
+		self._reset_timer()
+		if self.manager.setPinned(names, pinned):
+			self.updateFiles()
+
+	def moveItem(self, targetName, offset):
+		self._applyMove(targetName, lambda: self.manager.moveBookmark(targetName, offset, save=False))
+
+	def moveItemTo(self, targetName, index):
+		self._applyMove(targetName, lambda: self.manager.moveBookmarkTo(targetName, index, save=False))
+
+	# Several bookmarks move as one block, saved with the other moves of the burst.
+	def moveItems(self, names, offset):
+		if len(names) == 1:
+			self.moveItem(names[0], offset)
+			return
+		self._reset_timer()
+		if self.tabs.GetSelection() != 0:
+			return
+		if self.manager.moveBookmarks(names, offset, save=False):
+			self._scheduleMoveSave()
+			self.updateFiles()
+
+	def moveItemsToEdge(self, names, bottom):
+		if len(names) == 1:
+			name = names[0]
+			self.moveItemTo(name, self.manager._bookmarks.groupPosition(name)[1] - 1 if bottom else 0)
+		else:
+			count = len(self.manager._bookmarks)
+			self.moveItems(names, count if bottom else -count)
+
+	def _applyMove(self, name, move):
+		self._reset_timer()
+		if self.tabs.GetSelection() != 0:
+			return
+		before = self._savedViewKey()
+		moved = move()
+		if moved is None:
+			return
+		self._scheduleMoveSave()
+		# A full custom order matches the rows one to one, so the rows are moved directly.
+		if not (self._showsFullOrder() and self.listSaved.moveRow(moved[0], moved[1], before, self._savedViewKey())):
+			self.updateFiles(name)
+
+	def _scheduleMoveSave(self):
+		if self._moveSave is None:
+			self._moveSave = wx.CallLater(MOVE_SAVE_DELAY_MS, self._saveMoves)
+		else:
+			self._moveSave.Restart(MOVE_SAVE_DELAY_MS)
+
+	def _saveMoves(self):
+		if self._moveSave is not None:
+			self._moveSave.Stop()
+			self._moveSave = None
+			self.manager.saveConfig()
+
+	def onMoveToPosition(self, name):
+		self._stop_timer()
+		index, count = self.manager._bookmarks.groupPosition(name)
+		dlg = wx.TextEntryDialog(self, _("Move {} to position (1 to {})").format(name, count), self.title, str(index + 1))
+		if dlg.ShowModal() == wx.ID_OK:
+			try:
+				position = int(dlg.GetValue().strip())
+			except ValueError:
+				gui.messageBox(_("Enter a position number."), self.title, wx.OK | wx.ICON_WARNING)
+			else:
+				self.moveItemTo(name, position - 1)
+		dlg.Destroy()
+		self._reset_timer()
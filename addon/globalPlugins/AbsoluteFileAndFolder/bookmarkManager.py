@@ -0,0 +1,323 @@
+# bookmarkManager.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Data side shared by the Absolute Files and Absolute Folders managers: the saved
+# bookmarks, the recent history with its frecency, their search indexes, the journal
+# stores they are kept in and the Explorer lookups. Subclasses name their config files,
+# say which paths they accept and keep any extra state through the hooks below.
+
+import os
+import abc
+import threading
+import gui
+import logHandler
+from . import bookmarks
+from . import dialogPool
+from . import explorer
+from . import frecency
+from . import history
+from . import journal
+from . import persistence
+from . import search
+
+
+class BookmarkManager(abc.ABC):
+	# pathHealth kind of the paths, which is also their key in a resolver result.
+	kind = None
+	# Key of the recent list in configs written before the history had its own file.
+	legacyRecentKey = None
+	# "file" or "folder", for log messages.
+	noun = None
+
+	def __init__(self):
+		self._bookmarks = bookmarks.BookmarkCollection()
+		self._recent = history.RecentHistory()
+		self._showPath = False
+		self._sortMode = "UPPERCASE"
+		self._newPath = ""
+		self._explorerWindow = None
+		self.dialog = None
+		self._frecency = frecency.FrecencyTracker()
+		self._store = journal.JournalStore(self._get_config_path())
+		self._historyStore = journal.JournalStore(self._get_history_path())
+		self._version = 0
+		# The prefetch worker and the GUI thread can both load; one at a time.
+		self._loadLock = threading.RLock()
+		self._savedSearch = search.TrigramIndex()
+		self._recentSearch = search.TrigramIndex()
+
+	@abc.abstractmethod
+	def _get_config_path(self):
+		pass
+
+	@abc.abstractmethod
+	def _get_history_path(self):
+		pass
+
+	# Whether path exists as the kind of item this manager keeps.
+	@abc.abstractmethod
+	def _accepts(self, path):
+		pass
+
+	@abc.abstractmethod
+	def _createDialog(self):
+		pass
+
+	# Reads the subclass's own settings from a loaded config.
+	def _loadData(self, data):
+		pass
+
+	# The subclass's own settings, stored next to the bookmarks.
+	def _configData(self):
+		return {}
+
+	# Index upkeep as bookmarks and recent paths come and go; the base keeps the search
+	# indexes and subclasses extend these for anything else keyed on them.
+	def _savedAdded(self, name, path):
+		self._savedSearch.add(name, name, path)
+
+	def _savedRenamed(self, oldName, newName, entry):
+		self._savedSearch.rename(oldName, newName, newName, entry.path)
+
+	def _savedRemoved(self, name, entry):
+		self._savedSearch.remove(name)
+
+	def _recentAdded(self, path):
+		self._recentSearch.add(path, os.path.basename(path), path)
+
+	def _recentDropped(self, paths):
+		for path in paths:
+			self._recentSearch.remove(path)
+
+	def _rebuildSavedIndexes(self):
+		self._savedSearch.rebuild((name, name, path) for name, path in self._bookmarks.items())
+
+	def _rebuildRecentIndexes(self):
+		self._recentSearch.rebuild((p, os.path.basename(p), p) for p in self._recent)
+
+	def _getCurrentPathsFromExplorer(self):
+		return explorer.resolver.resolve(explorer.getExplorerHandles())
+
+	# Reads the items selected in the Explorer window the dialog was opened from without
+	# waiting. callback gets the accepted paths on the resolver worker, or an empty list if
+	# the window is gone or the read timed out.
+	def selectedInExplorer(self, callback):
+		if self._explorerWindow is None:
+			callback([])
+			return
+		explorer.resolver.selectionAsync(
+			self._explorerWindow,
+			lambda paths: callback([path for path in paths or () if self._accepts(path)])
+		)
+
+	def loadConfig(self, force=False):
+		with self._loadLock:
+			try:
+				persistence.service.flush(self._store.path)
+				persistence.service.flush(self._historyStore.path)
+				if not force and not self._store.isStale() and not self._historyStore.isStale():
+					return
+				data = self._store.load()
+				self._version += 1
+				if data:
+					self._bookmarks.load(data.get("files", {}), data.get("order"), data.get("pinned", []))
+					self._showPath = data.get("showPath", False)
+					self._sortMode = data.get("sortMode", "UPPERCASE")
+					self._loadData(data)
+				self._loadHistory(data)
+				self._rebuildSavedIndexes()
+				self._rebuildRecentIndexes()
+			except Exception as e:
+				logHandler.log.warning(f"Failed to load {self.noun} config: {e}", exc_info=True)
+
+	def _loadHistory(self, data):
+		historyData = self._historyStore.load()
+		if historyData:
+			self._recent.setCapacity(historyData.get("capacity", history.DEFAULT_CAPACITY))
+			self._recent.load(historyData.get("recent", {}))
+			self._frecency.setCapacity(historyData.get("frecencyCap", frecency.DEFAULT_CAPACITY))
+			self._frecency.load(historyData.get("frecency", {}))
+		elif data and data.get(self.legacyRecentKey):
+			# History from before it moved out of the config file.
+			self._recent.loadList(data[self.legacyRecentKey])
+			self._frecency.load(data.get("frecency", {}))
+			self.saveHistory()
+
+	def saveConfig(self):
+		self._version += 1
+		saved = self._bookmarks.dump()
+		data = {
+			"files": saved["files"],
+			"order": saved["order"],
+			"pinned": saved["pinned"],
+			"showPath": self._showPath,
+			"sortMode": self._sortMode
+		}
+		data.update(self._configData())
+		persistence.service.markDirty(self._store.path, lambda: self._writeConfig(data))
+
+	def _writeConfig(self, data):
+		try:
+			self._store.save(data)
+		except Exception as e:
+			logHandler.log.error(f"Failed to save {self.noun} config: {e}", exc_info=True)
+
+	def saveHistory(self):
+		self._version += 1
+		data = {
+			"capacity": self._recent.capacity,
+			"recent": self._recent.dump(),
+			"frecencyCap": self._frecency.capacity,
+			"frecency": self._frecency.dump()
+		}
+		persistence.service.markDirty(self._historyStore.path, lambda: self._writeHistory(data))
+
+	def _writeHistory(self, data):
+		try:
+			self._historyStore.save(data)
+		except Exception as e:
+			logHandler.log.error(f"Failed to save {self.noun} history: {e}", exc_info=True)
+
+	def addToRecent(self, path):
+		self.addAllToRecent((path,))
+
+	# The bulk methods apply every item first and then save once.
+	def addAllToRecent(self, paths):
+		try:
+			added = False
+			for path in paths:
+				if not (path and self._accepts(path)):
+					continue
+				isNew = path not in self._recent
+				self._recentDropped(self._recent.touch(path))
+				self._frecency.visit(path)
+				if isNew:
+					self._recentAdded(path)
+				added = True
+			if added:
+				self.saveHistory()
+		except Exception as e:
+			logHandler.log.warning(f"Failed to add to recent {self.noun}s: {e}", exc_info=True)
+
+	def setHistoryCapacity(self, capacity):
+		self._recentDropped(self._recent.setCapacity(capacity))
+		self.saveHistory()
+
+	def removeRecent(self, path):
+		self.removeAllRecent((path,))
+
+	def removeAllRecent(self, paths):
+		removed = [path for path in paths if self._recent.remove(path)]
+		if removed:
+			self._recentDropped(removed)
+			for path in removed:
+				self._frecency.remove(path)
+			self.saveHistory()
+
+	def clearRecent(self):
+		self._recent.clear()
+		self._frecency.clear()
+		self._rebuildRecentIndexes()
+		self.saveHistory()
+
+	def addBookmark(self, name, path):
+		self._bookmarks.add(name, path)
+		self._savedAdded(name, path)
+		self.saveConfig()
+
+	# Saves every path not saved yet under its base name, numbered when the name is taken,
+	# and returns the new names.
+	def addBookmarks(self, paths):
+		added = []
+		for path in dict.fromkeys(paths):
+			if not path or self._bookmarks.hasPath(path):
+				continue
+			name = bookmarks.uniqueName(os.path.basename(path) or path, self._bookmarks)
+			self._bookmarks.add(name, path)
+			self._savedAdded(name, path)
+			added.append(name)
+		if added:
+			self.saveConfig()
+		return added
+
+	def renameBookmark(self, oldName, newName):
+		entry = self._bookmarks.rename(oldName, newName)
+		self._savedRenamed(oldName, newName, entry)
+		self.saveConfig()
+
+	def removeBookmark(self, name):
+		self.removeBookmarks((name,))
+
+	# Returns the names that were removed; saves only if there were any.
+	def removeBookmarks(self, names):
+		removed = []
+		for name in names:
+			entry = self._bookmarks.remove(name)
+			if entry is not None:
+				self._savedRemoved(name, entry)
+				removed.append(name)
+		if removed:
+			self.saveConfig()
+		return removed
+
+	# Returns the names whose pin state changed.
+	def setPinned(self, names, pinned):
+		changed = [name for name in names if self._bookmarks.setPinned(name, pinned)]
+		if changed:
+			self.saveConfig()
+		return changed
+
+	# Both moves return (old, new) positions or None. With save=False the caller saves
+	# once for a whole burst of moves through saveConfig.
+	def moveBookmark(self, name, offset, save=True):
+		return self._moved(self._bookmarks.move(name, offset), save)
+
+	def moveBookmarkTo(self, name, index, save=True):
+		return self._moved(self._bookmarks.moveTo(name, index), save)
+
+	# Moves the names together (see BookmarkCollection.moveMany); returns True if any moved.
+	def moveBookmarks(self, names, offset, save=True):
+		return self._moved(self._bookmarks.moveMany(names, offset), save)
+
+	def _moved(self, moved, save):
+		if moved:
+			if save:
+				self.saveConfig()
+			else:
+				self._version += 1
+		return moved
+
+	# Saved names in display order with their positions; frecency changes bump _version.
+	def savedView(self):
+		return self._bookmarks.view(self._sortMode, self._frecency.logScore, self._version)
+
+	# Indexes the search entries queued by a load on a worker, so the first keystroke in the
+	# dialog does not wait for it.
+	def prepareSearch(self):
+		indexes = [index for index in (self._savedSearch, self._recentSearch) if not index.isPrepared()]
+		if not indexes:
+			return
+
+		def run():
+			try:
+				for index in indexes:
+					index.prepare()
+			except Exception as e:
+				logHandler.log.warning(f"Failed to index {self.noun} search: {e}", exc_info=True)
+
+		threading.Thread(target=run, name="AbsoluteFileAndFolder search index", daemon=True).start()
+
+	def show(self, explorerPaths=None):
+		self.loadConfig()
+		self.prepareSearch()
+		if explorerPaths is None:
+			explorerPaths = self._getCurrentPathsFromExplorer()
+		path = explorerPaths[self.kind]
+		self._explorerWindow = explorerPaths.get("hwnd")
+		self._newPath = path if path and self._accepts(path) else ""
+		self.dialog = dialogPool.pool.get(self.kind, self._createDialog)
+		gui.mainFrame.prePopup()
+		self.dialog.Show()
+		self.dialog.CentreOnScreen()
+		gui.mainFrame.postPopup()
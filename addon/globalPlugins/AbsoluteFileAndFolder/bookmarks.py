@@ -0,0 +1,258 @@
+# bookmarks.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# GUI-free engine behind the Saved lists of both managers.
+# Entries are small __slots__ records held in a name index and a normalized-path index.
+# The custom order is kept as two indexed sequences, pinned then unpinned, that every
+# operation updates in place, so nothing re-filters the whole order: adjacent moves are
+# O(1) and any other move O(log n) (see sequence.py). Sorted views are cached per data
+# version and sort mode.
+
+import os
+from itertools import chain
+from . import sequence
+
+SORT_CUSTOM = "CUSTOM"
+SORT_ASCENDING = "UPPERCASE"
+SORT_DESCENDING = "LOWERCASE"
+SORT_FRECENCY = "FRECENCY"
+SORT_MODES = (SORT_CUSTOM, SORT_ASCENDING, SORT_DESCENDING, SORT_FRECENCY)
+
+
+def pathKey(path):
+	return os.path.normcase(os.path.normpath(path)) if path else ""
+
+
+# name if it is free in taken, otherwise the first free of "name (2)", "name (3)", ...
+def uniqueName(name, taken):
+	if name not in taken:
+		return name
+	number = 2
+	while "{} ({})".format(name, number) in taken:
+		number += 1
+	return "{} ({})".format(name, number)
+
+
+class Entry:
+	__slots__ = ("name", "path", "key", "pinned")
+
+	def __init__(self, name, path, pinned=False):
+		self.name = name
+		self.path = path
+		self.key = pathKey(path)
+		self.pinned = pinned
+
+
+class BookmarkCollection:
+	def __init__(self):
+		self._entries = {}
+		self._byPath = {}
+		self._pinned = sequence.OrderedSequence()
+		self._unpinned = sequence.OrderedSequence()
+		self.version = 0
+		self._viewCache = (None, [], {})
+
+	# files is {name: path}; order and pinned are name lists as stored in the config.
+	# Names missing from the order go last, and pinned names are gathered at the top.
+	def load(self, files, order=None, pinned=()):
+		self._entries = {}
+		self._byPath = {}
+		pinned = set(pinned)
+		names = list(dict.fromkeys(name for name in (order or ()) if name in files))
+		listed = set(names)
+		names.extend(name for name in files if name not in listed)
+		for name in names:
+			entry = self._entries[name] = Entry(name, files[name], name in pinned)
+			self._byPath.setdefault(entry.key, []).append(name)
+		self._pinned = sequence.OrderedSequence(name for name in names if name in pinned)
+		self._unpinned = sequence.OrderedSequence(name for name in names if name not in pinned)
+		self.version += 1
+
+	def dump(self):
+		return {
+			"files": {name: entry.path for name, entry in self._entries.items()},
+			"order": list(self),
+			"pinned": list(self._pinned)
+		}
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __contains__(self, name):
+		return name in self._entries
+
+	def __iter__(self):
+		return chain(self._pinned, self._unpinned)
+
+	def get(self, name):
+		return self._entries.get(name)
+
+	def path(self, name):
+		entry = self._entries.get(name)
+		return entry.path if entry is not None else None
+
+	def items(self):
+		entries = self._entries
+		return [(name, entries[name].path) for name in self]
+
+	def isPinned(self, name):
+		entry = self._entries.get(name)
+		return entry is not None and entry.pinned
+
+	def namesForPath(self, path):
+		return list(self._byPath.get(pathKey(path), ()))
+
+	def hasPath(self, path):
+		return pathKey(path) in self._byPath
+
+	def _group(self, entry):
+		return self._pinned if entry.pinned else self._unpinned
+
+	# Position in the custom order, pinned entries first.
+	def index(self, name):
+		entry = self._entries[name]
+		if entry.pinned:
+			return self._pinned.index(name)
+		return len(self._pinned) + self._unpinned.index(name)
+
+	# (index within the entry's group, size of that group)
+	def groupPosition(self, name):
+		group = self._group(self._entries[name])
+		return group.index(name), len(group)
+
+	def _unlinkPath(self, entry):
+		names = self._byPath.get(entry.key)
+		if names is not None:
+			names.remove(entry.name)
+			if not names:
+				del self._byPath[entry.key]
+
+	# Adding an existing name points it at the new path and keeps its place.
+	def add(self, name, path):
+		entry = self._entries.get(name)
+		if entry is None:
+			entry = self._entries[name] = Entry(name, path)
+			self._byPath.setdefault(entry.key, []).append(name)
+			self._unpinned.append(name)
+		else:
+			self._unlinkPath(entry)
+			entry.path = path
+			entry.key = pathKey(path)
+			self._byPath.setdefault(entry.key, []).append(name)
+		self.version += 1
+		return entry
+
+	def rename(self, oldName, newName):
+		entry = self._entries[oldName]
+		if newName == oldName:
+			return entry
+		if newName in self._entries:
+			raise ValueError(f"Bookmark {newName!r} already exists")
+		self._group(entry).rename(oldName, newName)
+		del self._entries[oldName]
+		self._entries[newName] = entry
+		names = self._byPath[entry.key]
+		names[names.index(oldName)] = newName
+		entry.name = newName
+		self.version += 1
+		return entry
+
+	def remove(self, name):
+		entry = self._entries.pop(name, None)
+		if entry is None:
+			return None
+		self._group(entry).remove(name)
+		self._unlinkPath(entry)
+		self.version += 1
+		return entry
+
+	# A newly pinned entry goes to the bottom of the pinned group and an unpinned one to
+	# the top of the rest, which keeps it next to where it was in the custom order.
+	def setPinned(self, name, pinned):
+		entry = self._entries.get(name)
+		if entry is None or entry.pinned == pinned:
+			return False
+		self._group(entry).remove(name)
+		entry.pinned = pinned
+		if pinned:
+			self._pinned.append(name)
+		else:
+			self._unpinned.insert(0, name)
+		self.version += 1
+		return True
+
+	def togglePin(self, name):
+		self.setPinned(name, not self.isPinned(name))
+		return self.isPinned(name)
+
+	# The move methods keep an entry inside its group and return (old, new) positions in
+	# the custom order, or None when it did not move.
+	def move(self, name, offset):
+		entry = self._entries.get(name)
+		if entry is None or not offset:
+			return None
+		group = self._group(entry)
+		old = self.index(name)
+		if offset in (-1, 1):
+			if not group.swap(name, offset):
+				return None
+			self.version += 1
+			return old, old + offset
+		return self.moveTo(name, group.index(name) + offset)
+
+	# index counts from the top of the entry's group and is clamped to it.
+	def moveTo(self, name, index):
+		entry = self._entries.get(name)
+		if entry is None:
+			return None
+		base = 0 if entry.pinned else len(self._pinned)
+		old, new = self._group(entry).move(name, index)
+		if old == new:
+			return None
+		self.version += 1
+		return base + old, base + new
+
+	# Moves several entries by offset as a block: each stays in its group, they keep their
+	# relative order, and they stop against the group's edge or a selected entry stopped
+	# there before them. Returns True if anything moved.
+	def moveMany(self, names, offset):
+		names = set(names)
+		moved = False
+		for group in (self._pinned, self._unpinned):
+			positions = sorted((group.index(name), name) for name in names if name in group)
+			if offset > 0:
+				positions.reverse()
+				limit = len(group) - 1
+			else:
+				limit = 0
+			for index, name in positions:
+				target = min(index + offset, limit) if offset > 0 else max(index + offset, limit)
+				if target != index:
+					group.move(name, target)
+					moved = True
+				limit = target - 1 if offset > 0 else target + 1
+		if moved:
+			self.version += 1
+		return moved
+
+	# score maps a path to a number, higher first; used by the frecency sort.
+	def ordered(self, sortMode, score=None):
+		unpinned = list(self._unpinned)
+		if sortMode == SORT_ASCENDING:
+			unpinned.sort(key=str.upper)
+		elif sortMode == SORT_DESCENDING:
+			unpinned.sort(key=str.lower, reverse=True)
+		elif sortMode == SORT_FRECENCY and score is not None:
+			entries = self._entries
+			unpinned.sort(key=lambda name: (-score(entries[name].path), name.upper()))
+		return list(self._pinned) + unpinned
+
+	# Returns (names, {name: position}). token covers state the collection cannot see,
+	# such as the frecency scores.
+	def view(self, sortMode, score=None, token=None):
+		key = (self.version, sortMode, token)
+		if self._viewCache[0] != key:
+			ordered = self.ordered(sortMode, score)
+			self._viewCache = (key, ordered, {name: i for i, name in enumerate(ordered)})
+		return self._viewCache[1], self._viewCache[2]
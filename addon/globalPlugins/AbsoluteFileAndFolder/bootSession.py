@@ -0,0 +1,91 @@
+# bootSession.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Tells whether this is the first NVDA start since Windows booted.
+# The boot identity is the wall-clock boot time, now minus GetTickCount64 (which keeps
+# counting through sleep and hibernate). It is kept in a tiny marker file with the uptime
+# it was seen at; later NVDA restarts in the same boot read it and usually write nothing.
+# Small differences from clock corrections are absorbed by a tolerance. The estimate
+# drifts on long uptimes, so the marker is saved again once it is off by half the
+# tolerance, before the drift can add up to a false new boot. An uptime lower than the
+# recorded one always means a new boot.
+
+import os
+import json
+import time
+import ctypes
+import logHandler
+
+DEFAULT_TOLERANCE = 120.0
+
+
+def getSystemUptime():
+	try:
+		kernel32 = ctypes.windll.kernel32
+		kernel32.GetTickCount64.argtypes = []
+		kernel32.GetTickCount64.restype = ctypes.c_ulonglong
+		return kernel32.GetTickCount64()
+	except Exception as e:
+		logHandler.log.warning(f"Failed to get system uptime: {e}", exc_info=True)
+		return 0
+
+
+def currentBootTime(uptime=getSystemUptime, clock=time.time):
+	uptimeMs = uptime()
+	if not uptimeMs:
+		return None
+	return clock() - uptimeMs / 1000.0
+
+
+class BootMarker:
+	def __init__(self, path, tolerance=DEFAULT_TOLERANCE, uptime=getSystemUptime, clock=time.time):
+		self.path = path
+		self.tolerance = tolerance
+		self._uptime = uptime
+		self._clock = clock
+		self._answer = None
+
+	# (bootTime, uptimeMs) of the marker; uptimeMs is 0 in markers written before it was kept.
+	def _read(self):
+		try:
+			with open(self.path, 'r', encoding='utf-8') as f:
+				data = json.load(f)
+			bootTime = data.get("bootTime")
+			uptimeMs = data.get("uptime", 0)
+		except (OSError, ValueError, AttributeError):
+			return None, 0
+		if not isinstance(bootTime, (int, float)):
+			return None, 0
+		return bootTime, uptimeMs if isinstance(uptimeMs, (int, float)) else 0
+
+	def _write(self, bootTime, uptimeMs):
+		tmpPath = self.path + ".tmp"
+		try:
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+			with open(tmpPath, 'w', encoding='utf-8') as f:
+				json.dump({"bootTime": bootTime, "uptime": uptimeMs}, f)
+			os.replace(tmpPath, self.path)
+		except Exception as e:
+			logHandler.log.warning(f"Failed to write boot marker: {e}", exc_info=True)
+
+	# legacyUptimeMs is the uptime older versions stored in AbsoluteFolders.json; it is
+	# only consulted when no marker exists yet.
+	def isFirstStartOfBoot(self, legacyUptimeMs=0):
+		if self._answer is not None:
+			return self._answer
+		uptimeMs = self._uptime()
+		bootTime = currentBootTime(lambda: uptimeMs, self._clock)
+		if bootTime is None:
+			self._answer = False
+			return False
+		recorded, recordedUptimeMs = self._read()
+		if recorded is None:
+			self._answer = bool(legacyUptimeMs) and uptimeMs < legacyUptimeMs
+			drift = 0.0
+		else:
+			drift = abs(bootTime - recorded)
+			self._answer = drift > self.tolerance or uptimeMs < recordedUptimeMs
+		if self._answer or recorded is None or drift > self.tolerance / 2:
+			self._write(bootTime, uptimeMs)
+		return self._answer
@@ -0,0 +1,138 @@
+# categories.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# File type categories for the Absolute Files filter.
+# The registry is a list of {"label", "rules"} entries stored with the file config. A rule
+# is either an extension (".log") or a glob matched against the file name ("*.config.json");
+# a bare word without dots or wildcards ("zip") is taken as the extension ".zip".
+# All rules are compiled into one matcher: a dict for plain extensions and a single
+# alternation regex for the globs, which take precedence as the more specific rules.
+# Each entry is classified once when it is added or loaded; the index keeps the members
+# of every category so switching the filter only touches the matching entries.
+
+import os
+import re
+import fnmatch
+
+ALL = None
+
+DEFAULT_CATEGORIES = (
+	("Audio", ('.mp3', '.wav', '.flac', '.m4a', '.ogg')),
+	("Video", ('.mp4', '.mkv', '.avi', '.mov')),
+	("Document", ('.pdf', '.docx', '.txt', '.xlsx', '.pptx')),
+	("Code", ('.py', '.cpp', '.java', '.js', '.html', '.css')),
+	("Exe", ('.exe', '.bat', '.cmd', '.msi')),
+)
+
+
+def defaultRegistry():
+	return [{"label": label, "rules": list(rules)} for label, rules in DEFAULT_CATEGORIES]
+
+
+# The registry as stored, cleaned: entries without a text label or with a repeated one are
+# dropped, and so are rules that are not text. Falls back to the defaults when the stored
+# value is not a list or nothing usable is left.
+def normalizeRegistry(registry):
+	if not isinstance(registry, (list, tuple)):
+		return defaultRegistry()
+	normalized = []
+	labels = set()
+	for entry in registry:
+		if not isinstance(entry, dict):
+			continue
+		label = entry.get("label")
+		rules = entry.get("rules", ())
+		if not isinstance(label, str) or not label.strip() or not isinstance(rules, (list, tuple)):
+			continue
+		label = label.strip()
+		if label in labels:
+			continue
+		labels.add(label)
+		normalized.append({"label": label, "rules": [normalizeRule(rule) for rule in rules if isinstance(rule, str) and rule.strip()]})
+	return normalized or defaultRegistry()
+
+
+# A bare word such as "zip" means the extension ".zip", not a file named "zip".
+def normalizeRule(rule):
+	rule = rule.strip()
+	if rule and "." not in rule and not any(c in rule for c in "*?["):
+		return "." + rule
+	return rule
+
+
+def _isExtensionRule(rule):
+	return rule.startswith(".") and rule.count(".") == 1 and not any(c in rule for c in "*?[")
+
+
+class CategoryMatcher:
+	def __init__(self, registry):
+		self.labels = []
+		self._extensions = {}
+		globs = []
+		for entry in registry:
+			label = entry.get("label", "").strip()
+			if not label or label in self.labels:
+				continue
+			self.labels.append(label)
+			for rule in entry.get("rules", ()):
+				rule = normalizeRule(rule).lower()
+				if not rule:
+					continue
+				if _isExtensionRule(rule):
+					self._extensions.setdefault(rule, label)
+				else:
+					pattern = "*" + rule if rule.startswith(".") else rule
+					globs.append((label, fnmatch.translate(pattern)))
+		self._globLabels = [label for label, pattern in globs]
+		self._globs = None
+		if globs:
+			self._globs = re.compile("|".join(f"(?P<g{i}>{pattern})" for i, (label, pattern) in enumerate(globs)))
+
+	def classify(self, path):
+		name = os.path.basename(path).lower()
+		if self._globs is not None:
+			match = self._globs.match(name)
+			if match:
+				return self._globLabels[int(match.lastgroup[1:])]
+		return self._extensions.get(os.path.splitext(name)[1])
+
+
+class CategoryIndex:
+	def __init__(self, matcher):
+		self.matcher = matcher
+		self._categoryOf = {}
+		self._members = {}
+
+	def rebuild(self, items, matcher=None):
+		if matcher is not None:
+			self.matcher = matcher
+		self._categoryOf = {}
+		self._members = {label: set() for label in self.matcher.labels}
+		for key, path in items:
+			self.add(key, path)
+
+	def add(self, key, path):
+		self.remove(key)
+		category = self.matcher.classify(path)
+		if category is not None:
+			self._categoryOf[key] = category
+			self._members.setdefault(category, set()).add(key)
+
+	def remove(self, key):
+		category = self._categoryOf.pop(key, None)
+		if category is not None:
+			self._members[category].discard(key)
+
+	def rename(self, oldKey, newKey):
+		category = self._categoryOf.pop(oldKey, None)
+		if category is not None:
+			self._members[category].discard(oldKey)
+			self._members[category].add(newKey)
+			self._categoryOf[newKey] = category
+
+	def members(self, category):
+		return self._members.get(category, set())
+
+	def count(self, category):
+		return len(self._members.get(category, ()))
@@ -0,0 +1,46 @@
+# dialogPool.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Keeps one dialog of each kind alive for the session.
+# Closing a pooled dialog only hides it; the next show refreshes its data instead of
+# rebuilding the notebook, lists and sizers.
+
+import wx
+
+
+class DialogPool:
+	def __init__(self):
+		self._dialogs = {}
+		self._classes = set()
+
+	def get(self, kind, factory):
+		dialog = self._dialogs.get(kind)
+		if dialog:
+			dialog.refresh()
+			return dialog
+		dialog = factory()
+		self._dialogs[kind] = dialog
+		self._classes.add(type(dialog))
+		return dialog
+
+	def liveWindowCount(self):
+		classes = tuple(self._classes)
+		if not classes:
+			return 0
+		return sum(1 for window in wx.GetTopLevelWindows() if isinstance(window, classes))
+
+	# Hands work the dialogs hold back, such as a burst of moves, to the persistence service.
+	def flush(self):
+		for dialog in self._dialogs.values():
+			if dialog:
+				dialog.flush()
+
+	def destroyAll(self):
+		for dialog in self._dialogs.values():
+			if dialog:
+				dialog.Destroy()
+		self._dialogs.clear()
+
+
+pool = DialogPool()
@@ -0,0 +1,379 @@
+# explorer.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import abc
+import time
+import ctypes
+import queue
+import threading
+import urllib.parse
+import api
+import logHandler
+
+DEFAULT_TIMEOUT_MS = 1500
+# Reading a large selection takes one COM call per item, so it gets longer.
+SELECTION_TIMEOUT_MS = 10000
+
+
+def getExplorerHandles():
+	fg = api.getForegroundObject()
+	if not fg or not fg.appModule or fg.appModule.appName != "explorer":
+		return []
+	handles = [fg.windowHandle]
+	focus = api.getFocusObject()
+	if focus and focus.appModule and focus.appModule.appName == "explorer" and focus.windowHandle not in handles:
+		handles.append(focus.windowHandle)
+	return handles
+
+
+# Counts visible Explorer folder windows without going through COM; None off Windows.
+def countExplorerWindows():
+	try:
+		user32 = ctypes.windll.user32
+		enumProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+	except AttributeError:
+		return None
+	className = ctypes.create_unicode_buffer(64)
+	count = 0
+
+	def visit(hwnd, lParam):
+		nonlocal count
+		if user32.IsWindowVisible(hwnd) and user32.GetClassNameW(hwnd, className, 64) and className.value == "CabinetWClass":
+			count += 1
+		return True
+
+	user32.EnumWindows(enumProc(visit), 0)
+	return count
+
+
+# (hwnd, title) of every visible Explorer folder window. Titles follow navigation, so an
+# unchanged signature means there is nothing new to ask COM about. None off Windows.
+def explorerWindowSignature():
+	try:
+		user32 = ctypes.windll.user32
+		enumProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+	except AttributeError:
+		return None
+	className = ctypes.create_unicode_buffer(64)
+	title = ctypes.create_unicode_buffer(512)
+	windows = []
+
+	def visit(hwnd, lParam):
+		if user32.IsWindowVisible(hwnd) and user32.GetClassNameW(hwnd, className, 64) and className.value == "CabinetWClass":
+			user32.GetWindowTextW(hwnd, title, 512)
+			windows.append((hwnd, title.value))
+		return True
+
+	user32.EnumWindows(enumProc(visit), 0)
+	return tuple(windows)
+
+
+def _locationPath(window):
+	if hasattr(window, "LocationURL") and window.LocationURL:
+		url = window.LocationURL
+		if url.startswith("file:///"):
+			return urllib.parse.unquote(url[8:]).replace("/", "\\")
+	return None
+
+
+def _windowPaths(window):
+	paths = {"file": None, "folder": None}
+	document = window.Document if hasattr(window, "Document") else None
+	if document:
+		try:
+			item = document.FocusedItem
+			if item and item.Path and os.path.isfile(item.Path):
+				paths["file"] = os.path.normpath(item.Path)
+		except Exception:
+			pass
+		try:
+			folder = document.Folder
+			if folder and hasattr(folder, "Self"):
+				path = folder.Self.Path
+				if path and os.path.isdir(path):
+					paths["folder"] = os.path.normpath(path)
+		except Exception:
+			pass
+	location = _locationPath(window)
+	if location:
+		if not paths["file"] and os.path.isfile(location):
+			paths["file"] = os.path.normpath(location)
+		if not paths["folder"] and os.path.isdir(location):
+			paths["folder"] = os.path.normpath(location)
+	if not paths["folder"] and hasattr(window, "LocationName") and window.LocationName:
+		possible_path = window.LocationName
+		if os.path.isabs(possible_path) and os.path.isdir(possible_path):
+			paths["folder"] = os.path.normpath(possible_path)
+	return paths
+
+
+# Every selected item of the window: SelectedItems() returns the whole set in one call,
+# leaving only the Path reads.
+# None once the deadline passes, so a huge selection cannot hold the worker for long.
+def _selectedPaths(window, deadline=None):
+	paths = []
+	for item in window.Document.SelectedItems():
+		if deadline is not None and time.monotonic() >= deadline:
+			return None
+		try:
+			path = item.Path
+		except Exception:
+			continue
+		if path:
+			paths.append(os.path.normpath(path))
+	return paths
+
+
+# What the resolver worker needs from Explorer. open and close run on the worker around
+# its lifetime; windows yields (hwnd, window) pairs that the other methods are given.
+class ExplorerProvider(abc.ABC):
+	def open(self):
+		pass
+
+	def close(self):
+		pass
+
+	@abc.abstractmethod
+	def windows(self):
+		pass
+
+	@abc.abstractmethod
+	def windowPaths(self, window):
+		pass
+
+	@abc.abstractmethod
+	def windowLocation(self, window):
+		pass
+
+	# Paths of the selected items, or None if they could not all be read by deadline.
+	@abc.abstractmethod
+	def windowSelection(self, window, deadline=None):
+		pass
+
+
+class ShellExplorerProvider(ExplorerProvider):
+	def __init__(self):
+		self._shell = None
+
+	# comtypes is imported here, on the resolver worker, rather than when NVDA loads.
+	def open(self):
+		import comtypes
+		comtypes.CoInitialize()
+
+	def close(self):
+		import comtypes
+		self._shell = None
+		comtypes.CoUninitialize()
+
+	def windows(self):
+		if self._shell is None:
+			from comtypes.client import CreateObject
+			self._shell = CreateObject("Shell.Application")
+		try:
+			windows = list(self._shell.Windows())
+		except Exception:
+			# The cached shell object can die with Explorer; recreate it on the next call.
+			self._shell = None
+			raise
+		for window in windows:
+			try:
+				if window:
+					yield window.hwnd, window
+			except Exception:
+				continue
+
+	def windowPaths(self, window):
+		return _windowPaths(window)
+
+	def windowLocation(self, window):
+		location = _locationPath(window)
+		if location:
+			return os.path.normpath(location)
+		try:
+			return os.path.normpath(window.Document.Folder.Self.Path)
+		except Exception:
+			return None
+
+	def windowSelection(self, window, deadline=None):
+		return _selectedPaths(window, deadline)
+
+
+class FakeExplorerProvider(ExplorerProvider):
+	def __init__(self, windows=None, delay=0):
+		self.windowMap = dict(windows or {})
+		self.delay = delay
+
+	def windows(self):
+		return iter(self.windowMap.items())
+
+	def windowPaths(self, window):
+		if self.delay:
+			time.sleep(self.delay)
+		return {"file": window.get("file"), "folder": window.get("folder")}
+
+	def windowLocation(self, window):
+		return window.get("folder")
+
+	def windowSelection(self, window, deadline=None):
+		if self.delay:
+			time.sleep(self.delay)
+		if deadline is not None and time.monotonic() >= deadline:
+			return None
+		return list(window.get("selection", ()))
+
+
+class _Request:
+	def __init__(self, handles, deadline, handler=None, callback=None):
+		self.handles = handles
+		self.deadline = deadline
+		self.handler = handler
+		self.callback = callback
+		self.result = {"file": None, "folder": None, "hwnd": None}
+		self.done = threading.Event()
+
+
+class ExplorerResolver:
+	def __init__(self, provider=None, timeoutMs=DEFAULT_TIMEOUT_MS):
+		self.provider = provider if provider is not None else ShellExplorerProvider()
+		self.timeoutMs = timeoutMs
+		self._requests = queue.Queue()
+		self._thread = None
+		self._lock = threading.Lock()
+
+	def _ensureWorker(self):
+		with self._lock:
+			if self._thread is None or not self._thread.is_alive():
+				self._thread = threading.Thread(target=self._run, name="AbsoluteFileAndFolder Explorer resolver", daemon=True)
+				self._thread.start()
+
+	# The result also names the window the paths came from, for a later selection().
+	def resolve(self, handles, timeoutMs=None):
+		result = {"file": None, "folder": None, "hwnd": None}
+		if not handles:
+			return result
+		timeout = (self.timeoutMs if timeoutMs is None else timeoutMs) / 1000.0
+		request = _Request(list(handles), time.monotonic() + timeout)
+		self._ensureWorker()
+		self._requests.put(request)
+		if not request.done.wait(timeout):
+			logHandler.log.debugWarning(f"Explorer lookup did not finish within {timeout * 1000:.0f} ms")
+		result.update(request.result)
+		return result
+
+	# Folder location of every open Explorer window as (hwnd, path) pairs, in window order.
+	def locations(self, timeoutMs=None):
+		timeout = (self.timeoutMs if timeoutMs is None else timeoutMs) / 1000.0
+		request = _Request(None, time.monotonic() + timeout, self._listLocations)
+		request.result = None
+		self._ensureWorker()
+		self._requests.put(request)
+		if not request.done.wait(timeout):
+			logHandler.log.debugWarning(f"Explorer window listing did not finish within {timeout * 1000:.0f} ms")
+			return None
+		return request.result
+
+	# Paths of every item selected in the Explorer window hwnd, read in a single request;
+	# None if the window is gone or the read did not finish in time.
+	def selection(self, hwnd, timeoutMs=SELECTION_TIMEOUT_MS):
+		timeout = timeoutMs / 1000.0
+		request = self.selectionAsync(hwnd, None, timeoutMs)
+		if not request.done.wait(timeout):
+			logHandler.log.debugWarning(f"Explorer selection did not finish within {timeout * 1000:.0f} ms")
+			return None
+		return request.result
+
+	# Queues the same read without waiting; callback is called on the worker with the
+	# result once the request is handled or has expired.
+	def selectionAsync(self, hwnd, callback, timeoutMs=SELECTION_TIMEOUT_MS):
+		request = _Request([hwnd], time.monotonic() + timeoutMs / 1000.0, self._readSelection, callback)
+		request.result = None
+		self._ensureWorker()
+		self._requests.put(request)
+		return request
+
+	def _run(self):
+		try:
+			self.provider.open()
+		except Exception as e:
+			logHandler.log.warning(f"Failed to initialize Explorer provider: {e}", exc_info=True)
+		try:
+			while True:
+				request = self._requests.get()
+				if request is None:
+					return
+				if time.monotonic() < request.deadline:
+					(request.handler or self._handle)(request)
+				request.done.set()
+				if request.callback is not None:
+					try:
+						request.callback(request.result)
+					except Exception as e:
+						logHandler.log.warning(f"Explorer request callback failed: {e}", exc_info=True)
+		finally:
+			try:
+				self.provider.close()
+			except Exception:
+				pass
+
+	def _handle(self, request):
+		try:
+			wanted = set(request.handles)
+			windows = {}
+			for hwnd, window in self.provider.windows():
+				if hwnd in wanted:
+					windows[hwnd] = window
+					if len(windows) == len(wanted):
+						break
+			for hwnd in request.handles:
+				window = windows.get(hwnd)
+				if window is None:
+					continue
+				try:
+					paths = self.provider.windowPaths(window)
+				except Exception:
+					continue
+				for key, path in paths.items():
+					if path and not request.result.get(key):
+						request.result[key] = path
+						if request.result["hwnd"] is None:
+							request.result["hwnd"] = hwnd
+				if request.result["file"] and request.result["folder"]:
+					break
+		except Exception as e:
+			logHandler.log.warning(f"Failed to get Explorer path: {e}", exc_info=True)
+
+	def _listLocations(self, request):
+		locations = []
+		try:
+			for hwnd, window in self.provider.windows():
+				try:
+					path = self.provider.windowLocation(window)
+				except Exception:
+					continue
+				if path:
+					locations.append((hwnd, path))
+			request.result = locations
+		except Exception as e:
+			logHandler.log.warning(f"Failed to list Explorer windows: {e}", exc_info=True)
+
+	def _readSelection(self, request):
+		try:
+			for hwnd, window in self.provider.windows():
+				if hwnd in request.handles:
+					request.result = self.provider.windowSelection(window, request.deadline)
+					return
+		except Exception as e:
+			logHandler.log.warning(f"Failed to read the Explorer selection: {e}", exc_info=True)
+
+	def stop(self):
+		with self._lock:
+			thread = self._thread
+			self._thread = None
+		if thread is not None and thread.is_alive():
+			self._requests.put(None)
+			thread.join(self.timeoutMs / 1000.0)
+
+
+resolver = ExplorerResolver()
@@ -0,0 +1,122 @@
+# frecency.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Open-frequency and recency ranking for opened paths.
+# Each visit adds exp(-rate * age) to a path's score. Instead of decaying every score on
+# every visit, a path stores log(sum(exp(rate * visitTime))): the ordering of these values
+# never changes with time, a visit is one logaddexp, and the decayed score at any moment
+# is exp(logScore - rate * now). A min-heap of (logScore, path) finds the weakest path to
+# evict once the capacity is reached, so a visit is O(log n). Entries outdated by a later
+# visit or a removal stay in the heap until they surface or the heap is compacted.
+
+import heapq
+import math
+import time
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_HALF_LIFE_DAYS = 14
+
+
+def _logAddExp(a, b):
+	if a < b:
+		a, b = b, a
+	return a + math.log1p(math.exp(b - a))
+
+
+class FrecencyTracker:
+	def __init__(self, capacity=DEFAULT_CAPACITY, halfLifeDays=DEFAULT_HALF_LIFE_DAYS):
+		self.capacity = max(1, int(capacity))
+		self._rate = math.log(2) / (halfLifeDays * 86400.0)
+		# path -> [logScore, visits, lastVisit]
+		self._entries = {}
+		self._heap = []
+
+	def __len__(self):
+		return len(self._entries)
+
+	def __contains__(self, path):
+		return path in self._entries
+
+	def load(self, data):
+		self._entries = {}
+		for path, values in (data or {}).items():
+			try:
+				logScore, visits, lastVisit = values
+				self._entries[path] = [float(logScore), int(visits), float(lastVisit)]
+			except (TypeError, ValueError):
+				continue
+		self._rebuildHeap()
+		self._trim()
+
+	def dump(self):
+		return {path: list(entry) for path, entry in self._entries.items()}
+
+	def _rebuildHeap(self):
+		self._heap = [(entry[0], path) for path, entry in self._entries.items()]
+		heapq.heapify(self._heap)
+
+	def _isCurrent(self, item):
+		entry = self._entries.get(item[1])
+		return entry is not None and entry[0] == item[0]
+
+	def _trim(self):
+		evicted = []
+		while len(self._entries) > self.capacity:
+			item = heapq.heappop(self._heap)
+			if self._isCurrent(item):
+				del self._entries[item[1]]
+				evicted.append(item[1])
+		# Outdated entries are dropped once they make up half the heap.
+		if len(self._heap) > 2 * len(self._entries) + 16:
+			self._rebuildHeap()
+		return evicted
+
+	def setCapacity(self, capacity):
+		self.capacity = max(1, int(capacity))
+		return self._trim()
+
+	def visit(self, path, now=None):
+		if now is None:
+			now = time.time()
+		point = self._rate * now
+		entry = self._entries.get(path)
+		if entry is None:
+			entry = self._entries[path] = [point, 1, now]
+		else:
+			entry[0] = _logAddExp(entry[0], point)
+			entry[1] += 1
+			entry[2] = now
+		heapq.heappush(self._heap, (entry[0], path))
+		return self._trim()
+
+	def remove(self, path):
+		if self._entries.pop(path, None) is not None:
+			self._trim()
+
+	def clear(self):
+		self._entries = {}
+		self._heap = []
+
+	# Sort key: larger means more frecent; paths never opened sort last.
+	def logScore(self, path):
+		entry = self._entries.get(path)
+		return entry[0] if entry is not None else -math.inf
+
+	def score(self, path, now=None):
+		entry = self._entries.get(path)
+		if entry is None:
+			return 0.0
+		if now is None:
+			now = time.time()
+		return math.exp(entry[0] - self._rate * now)
+
+	def visits(self, path):
+		entry = self._entries.get(path)
+		return entry[1] if entry is not None else 0
+
+	# Most frecent paths first; O(n log k).
+	def top(self, k=None):
+		ranked = ((-entry[0], path) for path, entry in self._entries.items())
+		ranked = sorted(ranked) if k is None else heapq.nsmallest(k, ranked)
+		return [path for negScore, path in ranked]
@@ -0,0 +1,83 @@
+# history.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Recent-open history kept as an LRU over an OrderedDict, most recent first.
+# Moving a path to the front and evicting the oldest one are both O(1). Each path keeps
+# the stamp of its last open; the stamps alone rebuild the order on load, so the history
+# file is a dict and the journal only appends the paths that changed.
+
+import time
+from collections import OrderedDict
+
+DEFAULT_CAPACITY = 20
+MIN_CAPACITY = 20
+MAX_CAPACITY = 5000
+
+
+def clampCapacity(capacity):
+	try:
+		capacity = int(capacity)
+	except (TypeError, ValueError):
+		return DEFAULT_CAPACITY
+	return max(MIN_CAPACITY, min(MAX_CAPACITY, capacity))
+
+
+class RecentHistory:
+	def __init__(self, capacity=DEFAULT_CAPACITY):
+		self.capacity = clampCapacity(capacity)
+		self._paths = OrderedDict()
+		self._lastStamp = 0.0
+
+	def __len__(self):
+		return len(self._paths)
+
+	def __iter__(self):
+		return iter(self._paths)
+
+	def __contains__(self, path):
+		return path in self._paths
+
+	def _stamp(self):
+		# Stamps must be strictly increasing or two opens in the same clock tick would
+		# come back in the wrong order after a reload.
+		self._lastStamp = max(time.time(), self._lastStamp + 1e-6)
+		return self._lastStamp
+
+	def load(self, stamps):
+		ordered = sorted((stamp, path) for path, stamp in (stamps or {}).items() if isinstance(stamp, (int, float)))
+		self._paths = OrderedDict((path, stamp) for stamp, path in reversed(ordered))
+		self._lastStamp = ordered[-1][0] if ordered else 0.0
+		return self._trim()
+
+	def loadList(self, paths):
+		self._paths = OrderedDict()
+		self._lastStamp = 0.0
+		for path in reversed(paths):
+			if path:
+				self.touch(path)
+		return self._trim()
+
+	def dump(self):
+		return dict(self._paths)
+
+	def _trim(self):
+		evicted = []
+		while len(self._paths) > self.capacity:
+			evicted.append(self._paths.popitem(last=True)[0])
+		return evicted
+
+	def setCapacity(self, capacity):
+		self.capacity = clampCapacity(capacity)
+		return self._trim()
+
+	def touch(self, path):
+		self._paths[path] = self._stamp()
+		self._paths.move_to_end(path, last=False)
+		return self._trim()
+
+	def remove(self, path):
+		return self._paths.pop(path, None) is not None
+
+	def clear(self):
+		self._paths = OrderedDict()
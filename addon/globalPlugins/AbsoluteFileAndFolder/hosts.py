@@ -0,0 +1,193 @@
+# hosts.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Per-server circuit breaker for UNC paths.
+# The first check against a server probes its share root once with a short deadline and
+# every other check for that server waits on the same probe. A failed probe, or repeated
+# unreachable results, opens the breaker: checks for that server are answered as
+# unreachable without touching the network until a background re-probe succeeds.
+# Re-probes back off from the retry delay up to the maximum.
+
+import os
+import re
+import time
+import threading
+import logHandler
+
+DEFAULT_DEADLINE = 1.0
+DEFAULT_THRESHOLD = 3
+DEFAULT_HOST_TTL = 60.0
+DEFAULT_RETRY_DELAY = 15.0
+MAX_RETRY_DELAY = 300.0
+
+_SEPARATORS = re.compile(r"[\\/]+")
+
+
+def splitHost(path):
+	if not path:
+		return None, None
+	if path[:8].upper() == "\\\\?\\UNC\\":
+		path = "\\\\" + path[8:]
+	elif path.startswith(("\\\\?\\", "\\\\.\\")):
+		return None, None
+	if not path.startswith(("\\\\", "//")):
+		return None, None
+	parts = _SEPARATORS.split(path.lstrip("\\/"))
+	if len(parts) < 2 or not parts[0] or not parts[1]:
+		return None, None
+	return parts[0].lower(), "\\\\{}\\{}\\".format(parts[0], parts[1])
+
+
+def probeRoot(root):
+	try:
+		os.stat(root)
+		return True
+	except OSError:
+		return False
+
+
+class _Host:
+	__slots__ = ("root", "open", "failures", "verifiedAt", "probe", "probeOk", "retryDelay", "timer")
+
+	def __init__(self, root):
+		self.root = root
+		self.open = False
+		self.failures = 0
+		self.verifiedAt = None
+		self.probe = None
+		self.probeOk = False
+		self.retryDelay = DEFAULT_RETRY_DELAY
+		self.timer = None
+
+
+class HostCircuitBreaker:
+	def __init__(
+		self,
+		probe=probeRoot,
+		deadline=DEFAULT_DEADLINE,
+		threshold=DEFAULT_THRESHOLD,
+		hostTtl=DEFAULT_HOST_TTL,
+		retryDelay=DEFAULT_RETRY_DELAY,
+		maxRetryDelay=MAX_RETRY_DELAY,
+		clock=time.monotonic
+	):
+		self._probe = probe
+		self.deadline = deadline
+		self.threshold = threshold
+		self.hostTtl = hostTtl
+		self.retryDelay = retryDelay
+		self.maxRetryDelay = maxRetryDelay
+		self._clock = clock
+		self._hosts = {}
+		self._lock = threading.Lock()
+		self._stopped = False
+		self.onRecovered = None
+
+	def isOpen(self, host):
+		with self._lock:
+			state = self._hosts.get(host)
+			return state is not None and state.open
+
+	def openHosts(self):
+		with self._lock:
+			return sorted(host for host, state in self._hosts.items() if state.open)
+
+	def _startProbe(self, state):
+		state.probe = threading.Event()
+		state.probeOk = False
+		event = state.probe
+		root = state.root
+
+		def run():
+			ok = False
+			try:
+				ok = bool(self._probe(root))
+			except Exception:
+				ok = False
+			with self._lock:
+				if state.probe is event:
+					state.probeOk = ok
+			event.set()
+
+		threading.Thread(target=run, name="AbsoluteFileAndFolder host probe", daemon=True).start()
+		return event
+
+	# Called from checker threads before a path on this host is stat'ed.
+	def allow(self, host, root):
+		with self._lock:
+			state = self._hosts.get(host)
+			if state is None:
+				state = self._hosts[host] = _Host(root)
+			if state.open:
+				return False
+			if state.verifiedAt is not None and self._clock() - state.verifiedAt < self.hostTtl:
+				return True
+			event = state.probe if state.probe is not None and not state.probe.is_set() else self._startProbe(state)
+		event.wait(self.deadline)
+		with self._lock:
+			if state.open:
+				return False
+			if event.is_set() and state.probeOk:
+				state.verifiedAt = self._clock()
+				state.failures = 0
+				return True
+			self._trip(host, state)
+			return False
+
+	def record(self, host, reachable):
+		with self._lock:
+			state = self._hosts.get(host)
+			if state is None or state.open:
+				return
+			if reachable:
+				state.failures = 0
+				return
+			state.failures += 1
+			if state.failures >= self.threshold:
+				self._trip(host, state)
+
+	def _trip(self, host, state):
+		if state.open:
+			return
+		state.open = True
+		state.verifiedAt = None
+		state.retryDelay = self.retryDelay
+		logHandler.log.debug(f"Network host {host} is unreachable; pausing checks against it")
+		self._scheduleRetry(host, state)
+
+	def _scheduleRetry(self, host, state):
+		if self._stopped:
+			return
+		state.timer = threading.Timer(state.retryDelay, self._reprobe, args=(host, state))
+		state.timer.daemon = True
+		state.timer.start()
+
+	def _reprobe(self, host, state):
+		with self._lock:
+			if self._stopped or not state.open:
+				return
+			event = self._startProbe(state)
+		event.wait(self.deadline)
+		with self._lock:
+			if self._stopped:
+				return
+			if not (event.is_set() and state.probeOk):
+				state.retryDelay = min(state.retryDelay * 2, self.maxRetryDelay)
+				self._scheduleRetry(host, state)
+				return
+			state.open = False
+			state.failures = 0
+			state.verifiedAt = self._clock()
+			state.timer = None
+			callback = self.onRecovered
+		logHandler.log.debug(f"Network host {host} is reachable again")
+		if callback is not None:
+			callback(host)
+
+	def stop(self):
+		with self._lock:
+			self._stopped = True
+			timers = [state.timer for state in self._hosts.values() if state.timer is not None]
+		for timer in timers:
+			timer.cancel()
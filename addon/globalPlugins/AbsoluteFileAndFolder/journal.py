@@ -0,0 +1,164 @@
+# journal.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Append-only storage for the manager config files.
+# The JSON file keeps its existing layout and acts as the snapshot, every save appends
+# only the changed keys to "<file>.log", and the log is folded back into the snapshot
+# on a background thread once it grows past the compaction threshold.
+
+import os
+import json
+import threading
+import logHandler
+
+COMPACT_THRESHOLD = 64 * 1024
+
+
+def _clone(value):
+	if isinstance(value, dict):
+		return {k: _clone(v) for k, v in value.items()}
+	if isinstance(value, (list, tuple, set)):
+		return [_clone(v) for v in value]
+	return value
+
+
+def _diff(state, data):
+	records = []
+	for key, value in data.items():
+		old = state.get(key)
+		if isinstance(old, dict) and isinstance(value, dict):
+			changed = {k: v for k, v in value.items() if k not in old or old[k] != v}
+			removed = [k for k in old if k not in value]
+			if changed:
+				records.append({"put": key, "items": changed})
+			if removed:
+				records.append({"drop": key, "names": removed})
+		elif key not in state or old != value:
+			records.append({"set": key, "value": value})
+	return records
+
+
+def _apply(state, record):
+	if "set" in record:
+		state[record["set"]] = record["value"]
+	elif "put" in record:
+		target = state.get(record["put"])
+		if not isinstance(target, dict):
+			target = state[record["put"]] = {}
+		target.update(record["items"])
+	elif "drop" in record:
+		target = state.get(record["drop"])
+		if isinstance(target, dict):
+			for name in record["names"]:
+				target.pop(name, None)
+
+
+class JournalStore:
+	def __init__(self, path, compactThreshold=COMPACT_THRESHOLD):
+		self.path = path
+		self.logPath = path + ".log"
+		self._compactingPath = path + ".log.compacting"
+		self.compactThreshold = compactThreshold
+		self._state = {}
+		self._logSize = 0
+		self._lock = threading.RLock()
+		self._compactThread = None
+		self._signature = None
+
+	def _stat(self):
+		signature = []
+		for path in (self.path, self._compactingPath, self.logPath):
+			try:
+				st = os.stat(path)
+				signature.append((st.st_mtime_ns, st.st_size))
+			except OSError:
+				signature.append(None)
+		return tuple(signature)
+
+	def isStale(self):
+		with self._lock:
+			return self._signature is None or self._stat() != self._signature
+
+	def _replay(self, state, path):
+		if not os.path.isfile(path):
+			return
+		with open(path, 'r', encoding='utf-8') as f:
+			for line in f:
+				line = line.strip()
+				if not line:
+					continue
+				try:
+					_apply(state, json.loads(line))
+				except ValueError:
+					# A torn last line from an interrupted write; everything before it is intact.
+					logHandler.log.warning(f"Skipping unreadable journal record in {path}")
+
+	def load(self):
+		self.wait()
+		with self._lock:
+			state = {}
+			if os.path.isfile(self.path):
+				with open(self.path, 'r', encoding='utf-8') as f:
+					state = json.load(f)
+			self._replay(state, self._compactingPath)
+			self._replay(state, self.logPath)
+			self._state = state
+			self._logSize = os.path.getsize(self.logPath) if os.path.isfile(self.logPath) else 0
+			self._signature = self._stat()
+			return _clone(state)
+
+	def save(self, data):
+		with self._lock:
+			records = _diff(self._state, data)
+			if not records:
+				return False
+			payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+			with open(self.logPath, 'a', encoding='utf-8') as f:
+				f.write(payload)
+			for record in records:
+				_apply(self._state, _clone(record))
+			self._logSize += len(payload.encode('utf-8'))
+			if self._logSize >= self.compactThreshold:
+				self.compact()
+			self._signature = self._stat()
+			return True
+
+	def compact(self, wait=False):
+		with self._lock:
+			if self._compactThread and self._compactThread.is_alive():
+				return
+			if os.path.isfile(self.logPath):
+				if os.path.isfile(self._compactingPath):
+					# A previous compaction failed; keep its records in front of the new ones.
+					with open(self.logPath, 'r', encoding='utf-8') as src, open(self._compactingPath, 'a', encoding='utf-8') as dst:
+						dst.write(src.read())
+					os.remove(self.logPath)
+				else:
+					os.replace(self.logPath, self._compactingPath)
+			self._logSize = 0
+			snapshot = _clone(self._state)
+			self._compactThread = threading.Thread(target=self._writeSnapshot, args=(snapshot,), daemon=True)
+			self._compactThread.start()
+			self._signature = self._stat()
+		if wait:
+			self.wait()
+
+	def _writeSnapshot(self, snapshot):
+		tmpPath = self.path + ".tmp"
+		try:
+			with open(tmpPath, 'w', encoding='utf-8') as f:
+				json.dump(snapshot, f, ensure_ascii=False, indent=2)
+			with self._lock:
+				os.replace(tmpPath, self.path)
+				if os.path.isfile(self._compactingPath):
+					os.remove(self._compactingPath)
+				self._signature = self._stat()
+		except Exception as e:
+			logHandler.log.error(f"Failed to compact {self.path}: {e}", exc_info=True)
+
+	def wait(self):
+		thread = self._compactThread
+		if thread and thread is not threading.current_thread():
+			thread.join()
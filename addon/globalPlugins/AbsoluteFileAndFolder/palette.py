@@ -0,0 +1,272 @@
+# palette.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Quick-open palette over saved and recent files and folders of both managers.
+# Typing searches the managers' own saved and recent indexes, which they keep up to date
+# as entries come and go, and merges the matches by (kind, path) so each path is listed
+# once. Results are ranked by match quality plus a usage bonus for saved, recently opened
+# and frequently opened entries. Only recent and frecent paths need a bonus worked out;
+# those are collected again when either manager's data version changes.
+
+import os
+import time
+from itertools import chain, islice
+import wx
+import gui
+import ui
+import addonHandler
+import logHandler
+from . import dialogPool
+from . import pathHealth
+from . import search
+from . import virtualList
+
+addonHandler.initTranslation()
+
+TITLE = _("Quick Open")
+RESULT_LIMIT = search.RESULT_LIMIT
+SAVED_BONUS = 0.25
+RECENT_BONUS = 0.75
+FRECENCY_BONUS = 1.0
+
+KIND_FILE = pathHealth.KIND_FILE
+KIND_FOLDER = pathHealth.KIND_FOLDER
+
+
+def _baseName(path):
+	return os.path.basename(path.rstrip("\\/")) or path
+
+
+class PaletteIndex:
+	def __init__(self):
+		self._managers = ()
+		# Extra usage of recent and frecent paths by (kind, normcase(path)); saved paths
+		# not in it get SAVED_BONUS.
+		self._usage = {}
+		self._byUsage = []
+		# Entries of the rows last shown, by key.
+		self._entries = {}
+		self._versions = None
+
+	def entry(self, key):
+		return self._entries.get(key)
+
+	def _collectUsage(self, manager, usage):
+		kind = manager.kind
+		recent = manager._recent
+		count = len(recent)
+		for position, path in enumerate(recent):
+			if path:
+				key = (kind, os.path.normcase(path))
+				usage[key] = usage.get(key, 0.0) + RECENT_BONUS * (count - position) / count
+		now = time.time()
+		for path in manager._frecency.top():
+			if path:
+				key = (kind, os.path.normcase(path))
+				score = manager._frecency.score(path, now)
+				usage[key] = usage.get(key, 0.0) + FRECENCY_BONUS * score / (1.0 + score)
+
+	def update(self, fileManager, folderManager):
+		versions = (id(fileManager), fileManager._version, id(folderManager), folderManager._version)
+		if versions == self._versions:
+			return False
+		self._managers = (folderManager, fileManager)
+		usage = {}
+		for manager in self._managers:
+			self._collectUsage(manager, usage)
+		self._usage = usage
+		self._byUsage = None
+		self._versions = versions
+		return True
+
+	def _entry(self, manager, path, name=None):
+		kind = manager.kind
+		key = (kind, os.path.normcase(path))
+		saved = manager._bookmarks.namesForPath(path)
+		bonus = SAVED_BONUS if saved else 0.0
+		return key, {"kind": kind, "name": name or (saved[0] if saved else _baseName(path)), "path": path, "usage": bonus + self._usage.get(key, 0.0)}
+
+	# With no query: the most used entries, then other saved ones in the order kept.
+	def _mostUsed(self, limit):
+		if self._byUsage is None:
+			entries = {}
+			for manager in self._managers:
+				for path in chain(manager._recent, manager._frecency.top()):
+					if path and (manager.kind, os.path.normcase(path)) not in entries:
+						key, entry = self._entry(manager, path)
+						entries[key] = entry
+			self._byUsage = sorted(entries.items(), key=lambda item: -item[1]["usage"])
+		ranked = dict(self._byUsage[:limit])
+		for manager in self._managers:
+			for name, path in islice(manager._bookmarks.items(), limit):
+				if len(ranked) >= limit:
+					break
+				if path:
+					key, entry = self._entry(manager, path, name)
+					ranked.setdefault(key, entry)
+		return ranked
+
+	def search(self, query, limit=RESULT_LIMIT):
+		if not query.strip():
+			ranked = self._mostUsed(limit)
+			self._entries = ranked
+			return list(ranked)
+		scores = {}
+		entries = {}
+		for manager in self._managers:
+			matches = [(score, manager._bookmarks.path(name), name) for score, name in manager._savedSearch.scored(query, limit)]
+			matches.extend((score, path, None) for score, path in manager._recentSearch.scored(query, limit))
+			for score, path, name in matches:
+				if not path:
+					continue
+				key, entry = self._entry(manager, path, name)
+				score += entry["usage"]
+				if score > scores.get(key, -1.0):
+					scores[key] = score
+					entries.setdefault(key, entry)
+		ranked = sorted(scores, key=lambda key: -scores[key])[:limit]
+		self._entries = {key: entries[key] for key in ranked}
+		return ranked
+
+
+class QuickOpen:
+	def __init__(self, getFileManager, getFolderManager):
+		self._getFileManager = getFileManager
+		self._getFolderManager = getFolderManager
+		self.index = PaletteIndex()
+		self.dialog = None
+
+	def refreshIndex(self):
+		fileManager = self._getFileManager()
+		folderManager = self._getFolderManager()
+		for manager in (fileManager, folderManager):
+			manager.loadConfig()
+			manager.prepareSearch()
+		self.index.update(fileManager, folderManager)
+
+	def open(self, key):
+		entry = self.index.entry(key)
+		if entry is None:
+			return False
+		path = entry["path"]
+		state = pathHealth.cache.verify(path, entry["kind"])
+		if state == pathHealth.OK:
+			try:
+				os.startfile(path)
+			except OSError as e:
+				logHandler.log.warning(f"Failed to open {path}: {e}", exc_info=True)
+				state = pathHealth.UNREACHABLE
+		if state != pathHealth.OK:
+			ui.message(_("{} is {}").format(path, pathHealth.describe(state)))
+			return False
+		if entry["kind"] == KIND_FILE:
+			self._getFileManager().addToRecent(path)
+		else:
+			folderManager = self._getFolderManager()
+			folderManager.addToRecent(path)
+			folderManager.rememberOpened([path])
+		return True
+
+	def show(self):
+		try:
+			self.refreshIndex()
+		except Exception as e:
+			logHandler.log.warning(f"Failed to prepare quick open: {e}", exc_info=True)
+			return
+		self.dialog = dialogPool.pool.get("palette", lambda: QuickOpenDialog(gui.mainFrame, self))
+		gui.mainFrame.prePopup()
+		self.dialog.Show()
+		self.dialog.CentreOnScreen()
+		gui.mainFrame.postPopup()
+
+
+class QuickOpenDialog(wx.Dialog):
+	def __init__(self, parent, quickOpen):
+		super().__init__(parent, title=TITLE, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+		self.quickOpen = quickOpen
+		self._kindLabels = {KIND_FILE: _("File"), KIND_FOLDER: _("Folder")}
+		self._initUI()
+		self._bindEvents()
+		self.updateResults()
+		wx.CallAfter(self.searchField.SetFocus)
+
+	def refresh(self):
+		self.searchField.ChangeValue("")
+		self.listResults.clearSelection()
+		self.updateResults()
+		wx.CallAfter(self.searchField.SetFocus)
+
+	# The palette saves nothing itself; see DialogPool.flush.
+	def flush(self):
+		pass
+
+	def _initUI(self):
+		mainSizer = wx.BoxSizer(wx.VERTICAL)
+		searchSizer = wx.BoxSizer(wx.HORIZONTAL)
+		searchSizer.Add(wx.StaticText(self, label=_("&Search:")), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+		self.searchField = wx.TextCtrl(self, style=wx.TE_PROCESS_ENTER)
+		searchSizer.Add(self.searchField, 1, wx.EXPAND)
+		mainSizer.Add(searchSizer, 0, wx.EXPAND | wx.ALL, 5)
+
+		self.resultsModel = virtualList.VirtualListModel()
+		self.listResults = virtualList.VirtualListCtrl(self, self.resultsModel, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
+		self.listResults.InsertColumn(0, _("Name"), width=250)
+		self.listResults.InsertColumn(1, _("Path"), width=400)
+		self.listResults.InsertColumn(2, _("Type"), width=80)
+		mainSizer.Add(self.listResults, 1, wx.EXPAND | wx.ALL, 5)
+
+		self.SetSizer(mainSizer)
+		self.SetMinSize((700, 450))
+		self.Fit()
+
+	def _bindEvents(self):
+		self.searchField.Bind(wx.EVT_TEXT, lambda e: self.updateResults())
+		self.searchField.Bind(wx.EVT_TEXT_ENTER, self.onOpenTop)
+		self.searchField.Bind(wx.EVT_KEY_DOWN, self.onSearchKeyDown)
+		self.listResults.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onOpenSelected)
+		self.Bind(wx.EVT_CHAR_HOOK, self.onCharHook)
+		self.Bind(wx.EVT_CLOSE, self.on_close)
+
+	def on_close(self, event):
+		if event.CanVeto():
+			event.Veto()
+			self.Hide()
+		else:
+			event.Skip()
+
+	def onCharHook(self, evt):
+		if evt.GetKeyCode() == wx.WXK_ESCAPE:
+			self.Close()
+		else:
+			evt.Skip()
+
+	def onSearchKeyDown(self, evt):
+		if evt.GetKeyCode() == wx.WXK_DOWN and self.resultsModel.rows:
+			self.listResults.SetFocus()
+		else:
+			evt.Skip()
+
+	def _buildRows(self, query):
+		index = self.quickOpen.index
+		rows = []
+		for key in index.search(query):
+			entry = index.entry(key)
+			rows.append((entry["name"], entry["path"], key, self._kindLabels[entry["kind"]]))
+		return rows
+
+	def updateResults(self):
+		query = self.searchField.GetValue().strip()
+		key = (self.quickOpen.index._versions, query)
+		self.listResults.sync(key, lambda: self._buildRows(query))
+
+	def _openKey(self, key):
+		if key is not None and self.quickOpen.open(key):
+			self.Close()
+
+	def onOpenTop(self, evt):
+		rows = self.resultsModel.rows
+		self._openKey(rows[0][2] if rows else None)
+
+	def onOpenSelected(self, evt):
+		self._openKey(self.listResults.selectedKey())
@@ -0,0 +1,249 @@
+# pathHealth.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Cached existence checks for saved and recent paths.
+# A stat on an offline network share or a sleeping drive can hang for seconds, so checks
+# run on a small thread pool and callers only read the cached state. Results expire after
+# a TTL and are rechecked on the next read. A check that has not answered within the
+# per-stat timeout is reported as unreachable until it does; a path last seen missing or
+# unreachable whose recheck is still running is reported as stale.
+# UNC paths go through a per-server circuit breaker (see hosts.py): while a server is
+# down its paths are answered as unreachable without another stat.
+
+import os
+import stat
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import addonHandler
+import logHandler
+from . import hosts
+
+addonHandler.initTranslation()
+
+OK = "ok"
+MISSING = "missing"
+UNREACHABLE = "unreachable"
+STALE = "stale"
+UNKNOWN = "unknown"
+
+KIND_FILE = "file"
+KIND_FOLDER = "folder"
+
+DEFAULT_TTL = 30.0
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_WORKERS = 4
+
+
+def probe(path, kind):
+	try:
+		st = os.stat(path)
+	except (FileNotFoundError, NotADirectoryError):
+		return MISSING
+	except OSError:
+		return UNREACHABLE
+	if stat.S_ISDIR(st.st_mode) == (kind == KIND_FOLDER):
+		return OK
+	return MISSING
+
+
+def describe(state):
+	if state == MISSING:
+		return _("missing")
+	if state == UNREACHABLE:
+		return _("unreachable")
+	if state == STALE:
+		return _("missing, checking again")
+	return ""
+
+
+class _Entry:
+	__slots__ = ("state", "checkedAt", "pendingSince", "done")
+
+	def __init__(self):
+		self.state = UNKNOWN
+		self.checkedAt = 0.0
+		self.pendingSince = None
+		self.done = threading.Event()
+
+
+class PathHealthCache:
+	def __init__(self, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT, workers=DEFAULT_WORKERS, probe=probe, clock=time.monotonic, breaker=None):
+		self.ttl = ttl
+		self.timeout = timeout
+		self.workers = workers
+		self._probe = probe
+		self._clock = clock
+		self._entries = {}
+		# Reentrant: a probe that finishes before add_done_callback runs calls _finish inline.
+		self._lock = threading.RLock()
+		self._executor = None
+		self._timeoutTimer = None
+		self._lastTimeoutCheck = 0.0
+		self._listeners = []
+		self.breaker = breaker if breaker is not None else hosts.HostCircuitBreaker()
+		self.breaker.onRecovered = self._onHostRecovered
+
+	def addListener(self, callback):
+		if callback not in self._listeners:
+			self._listeners.append(callback)
+
+	def removeListener(self, callback):
+		if callback in self._listeners:
+			self._listeners.remove(callback)
+
+	def _notify(self):
+		for callback in list(self._listeners):
+			try:
+				callback()
+			except Exception as e:
+				logHandler.log.warning(f"Path health listener failed: {e}", exc_info=True)
+
+	def _pool(self):
+		if self._executor is None:
+			self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="AbsoluteFileAndFolder path health")
+		return self._executor
+
+	def _schedule(self, key, entry, now):
+		if entry is None:
+			entry = self._entries[key] = _Entry()
+		host, root = hosts.splitHost(key[0])
+		if host is not None and self.breaker.isOpen(host):
+			entry.state = UNREACHABLE
+			entry.checkedAt = now
+			entry.pendingSince = None
+			entry.done.set()
+			return entry
+		entry.pendingSince = now
+		entry.done.clear()
+		future = self._pool().submit(self._check, key[0], key[1], host, root)
+		future.add_done_callback(lambda f, key=key: self._finish(key, f))
+		if self._timeoutTimer is None:
+			self._startTimer(self.timeout)
+		return entry
+
+	def _check(self, path, kind, host, root):
+		if host is None:
+			return self._probe(path, kind)
+		if not self.breaker.allow(host, root):
+			return UNREACHABLE
+		state = self._probe(path, kind)
+		self.breaker.record(host, state != UNREACHABLE)
+		return state
+
+	def _onHostRecovered(self, host):
+		with self._lock:
+			for key in [key for key in self._entries if hosts.splitHost(key[0])[0] == host]:
+				entry = self._entries[key]
+				if entry.pendingSince is None:
+					del self._entries[key]
+		self._notify()
+
+	def _startTimer(self, delay):
+		# Wakes listeners when pending checks pass the timeout so they show as unreachable.
+		self._timeoutTimer = threading.Timer(delay + 0.05, self._onTimeout)
+		self._timeoutTimer.daemon = True
+		self._timeoutTimer.start()
+
+	def _onTimeout(self):
+		with self._lock:
+			now = self._clock()
+			deadlines = [(e.pendingSince + self.timeout, key) for key, e in self._entries.items() if e.pendingSince is not None]
+			expired = [key for deadline, key in deadlines if self._lastTimeoutCheck < deadline <= now]
+			waiting = [deadline for deadline, key in deadlines if deadline > now]
+			self._lastTimeoutCheck = now
+			self._timeoutTimer = None
+			if waiting and self._executor is not None:
+				self._startTimer(min(waiting) - now)
+		for path, kind in expired:
+			# A stat stuck past the timeout counts against its server straight away.
+			host = hosts.splitHost(path)[0]
+			if host is not None:
+				self.breaker.record(host, False)
+		if expired:
+			self._notify()
+
+	def _finish(self, key, future):
+		try:
+			state = future.result()
+		except Exception:
+			state = UNREACHABLE
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return
+			timedOut = entry.pendingSince is not None and self._clock() - entry.pendingSince > self.timeout
+			changed = timedOut or entry.state != state
+			entry.state = state
+			entry.checkedAt = self._clock()
+			entry.pendingSince = None
+			entry.done.set()
+		if changed:
+			self._notify()
+
+	def _read(self, entry, now):
+		if entry.pendingSince is not None:
+			if now - entry.pendingSince > self.timeout:
+				return UNREACHABLE
+			if entry.state in (MISSING, UNREACHABLE):
+				return STALE
+		return entry.state
+
+	def _lookup(self, path, kind):
+		key = (path, kind)
+		now = self._clock()
+		entry = self._entries.get(key)
+		if entry is None or (entry.pendingSince is None and now - entry.checkedAt > self.ttl):
+			entry = self._schedule(key, entry, now)
+		return entry, now
+
+	def state(self, path, kind):
+		if not path:
+			return MISSING
+		with self._lock:
+			entry, now = self._lookup(path, kind)
+			return self._read(entry, now)
+
+	def refresh(self, paths, kind):
+		with self._lock:
+			for path in paths:
+				if path:
+					self._lookup(path, kind)
+
+	# Waits at most the timeout for a pending check; for paths about to be opened.
+	def verify(self, path, kind, timeout=None):
+		if not path:
+			return MISSING
+		with self._lock:
+			entry, now = self._lookup(path, kind)
+			pending = entry.pendingSince is not None
+		if pending:
+			entry.done.wait(self.timeout if timeout is None else timeout)
+		with self._lock:
+			state = self._read(entry, self._clock())
+		return MISSING if state == STALE else state
+
+	def invalidate(self, path=None):
+		with self._lock:
+			if path is None:
+				self._entries = {}
+			else:
+				for kind in (KIND_FILE, KIND_FOLDER):
+					self._entries.pop((path, kind), None)
+
+	def shutdown(self):
+		with self._lock:
+			executor = self._executor
+			self._executor = None
+			timer = self._timeoutTimer
+			self._timeoutTimer = None
+			self._listeners = []
+		self.breaker.stop()
+		if timer is not None:
+			timer.cancel()
+		if executor is not None:
+			executor.shutdown(wait=False)
+
+
+cache = PathHealthCache()
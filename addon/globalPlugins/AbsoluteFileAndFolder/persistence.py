@@ -0,0 +1,106 @@
+# persistence.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Debounced writer shared by both managers.
+# Managers report dirty state with a write callback; callbacks for the same key that
+# arrive within the merge window collapse into one call made on a worker thread.
+
+import time
+import threading
+import logHandler
+
+DEFAULT_WINDOW_MS = 500
+
+
+class PersistenceService:
+	def __init__(self, windowMs=DEFAULT_WINDOW_MS):
+		self.windowMs = windowMs
+		self._pending = {}
+		self._deadlines = {}
+		self._cond = threading.Condition()
+		self._writeLock = threading.Lock()
+		self._thread = None
+		self._running = False
+		self.requestedWrites = 0
+		self.performedWrites = 0
+
+	@property
+	def coalescedWrites(self):
+		with self._cond:
+			return self.requestedWrites - self.performedWrites - len(self._pending)
+
+	def markDirty(self, key, write):
+		with self._cond:
+			self.requestedWrites += 1
+			if key not in self._pending:
+				self._deadlines[key] = time.monotonic() + self.windowMs / 1000.0
+			self._pending[key] = write
+			if not self._running:
+				self._running = True
+				self._thread = threading.Thread(target=self._run, name="AbsoluteFileAndFolder persistence", daemon=True)
+				self._thread.start()
+			self._cond.notify()
+
+	def isPending(self, key):
+		with self._cond:
+			return key in self._pending
+
+	def _takeDue(self, now):
+		due = [key for key, deadline in self._deadlines.items() if deadline <= now]
+		writes = [self._pending.pop(key) for key in due]
+		for key in due:
+			del self._deadlines[key]
+		return writes
+
+	def _run(self):
+		while True:
+			with self._cond:
+				while self._running:
+					now = time.monotonic()
+					if any(deadline <= now for deadline in self._deadlines.values()):
+						break
+					timeout = min(self._deadlines.values()) - now if self._deadlines else None
+					self._cond.wait(timeout)
+				else:
+					return
+			# Writes are taken and performed under one lock so a concurrent flush can never
+			# be overtaken by an older payload for the same key.
+			with self._writeLock:
+				with self._cond:
+					writes = self._takeDue(time.monotonic())
+				self._perform(writes)
+
+	def _perform(self, writes):
+		for write in writes:
+			try:
+				write()
+			except Exception as e:
+				logHandler.log.error(f"Deferred config write failed: {e}", exc_info=True)
+		with self._cond:
+			self.performedWrites += len(writes)
+
+	def flush(self, key=None):
+		with self._writeLock:
+			with self._cond:
+				if key is None:
+					keys = list(self._pending)
+				else:
+					keys = [key] if key in self._pending else []
+				writes = [self._pending.pop(k) for k in keys]
+				for k in keys:
+					del self._deadlines[k]
+			self._perform(writes)
+
+	def stop(self):
+		with self._cond:
+			self._running = False
+			self._cond.notify()
+		thread = self._thread
+		if thread and thread is not threading.current_thread():
+			thread.join()
+		self._thread = None
+		self.flush()
+
+
+service = PersistenceService()
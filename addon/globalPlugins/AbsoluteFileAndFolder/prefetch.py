@@ -0,0 +1,54 @@
+# prefetch.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Speculative work started on the first tap of the open gesture.
+# While the plugin waits to see whether a second tap follows, a worker loads both
+# managers and resolves the Explorer selection, so whichever dialog is chosen can open
+# with its data ready.
+
+import time
+import threading
+import logHandler
+from . import explorer
+
+# Longest the GUI thread waits for the prefetch once the tap window is over; past it the
+# dialog loads on its own.
+RESULT_TIMEOUT_S = 2.0
+
+
+class Prefetch:
+	def __init__(self, managerGetters, handles):
+		self.startedAt = time.perf_counter()
+		self.finishedAt = None
+		self.explorerPaths = None
+		self._managerGetters = managerGetters
+		self._handles = handles
+		self._thread = threading.Thread(target=self._run, name="AbsoluteFileAndFolder prefetch", daemon=True)
+		self._thread.start()
+
+	def _run(self):
+		try:
+			for getManager in self._managerGetters:
+				getManager().loadConfig()
+			self.explorerPaths = explorer.resolver.resolve(self._handles)
+		except Exception as e:
+			logHandler.log.warning(f"Prefetch failed: {e}", exc_info=True)
+		finally:
+			self.finishedAt = time.perf_counter()
+
+	# Returns (explorerPaths, timing); explorerPaths is None if the work did not finish
+	# within timeout.
+	def result(self, timeout=None):
+		requestedAt = time.perf_counter()
+		self._thread.join(timeout)
+		readyAt = time.perf_counter()
+		finishedAt = self.finishedAt if self.finishedAt is not None else readyAt
+		timing = {
+			"workMs": (finishedAt - self.startedAt) * 1000,
+			"hiddenMs": (min(finishedAt, requestedAt) - self.startedAt) * 1000,
+			"blockedMs": (readyAt - requestedAt) * 1000,
+		}
+		if self._thread.is_alive():
+			return None, timing
+		return self.explorerPaths, timing
@@ -0,0 +1,166 @@
+# restore.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Restores the auto-open folders after a restart.
+# All folders are validated at once through the path-health cache, then opened with at
+# most `concurrency` windows still waiting to appear: the next folder is opened as soon
+# as Explorer shows a window for an earlier one, so pacing follows the machine instead
+# of a fixed stagger. Missing or unreachable folders are skipped without delaying the
+# others, and a timing report is produced at the end. Opening several folders from the
+# dialog goes through the same pipeline.
+
+import os
+import time
+import threading
+import wx
+import logHandler
+from . import explorer
+from . import pathHealth
+
+DEFAULT_CONCURRENCY = 3
+MAX_CONCURRENCY = 10
+POLL_INTERVAL = 0.05
+# How long one open may hold a slot before the next folder goes ahead anyway.
+WINDOW_TIMEOUT = 5.0
+# Pacing used when Explorer windows cannot be counted.
+FALLBACK_INTERVAL = 0.5
+
+
+def clampConcurrency(value):
+	try:
+		value = int(value)
+	except (TypeError, ValueError):
+		return DEFAULT_CONCURRENCY
+	return max(1, min(MAX_CONCURRENCY, value))
+
+
+# Opens on the GUI thread and waits for it there, so a failure reaches the pipeline
+# instead of being lost in wx.CallAfter. An open still queued after the window timeout
+# is counted as opened.
+def _openOnMainThread(path):
+	done = threading.Event()
+	errors = []
+
+	def run():
+		try:
+			os.startfile(path)
+		except OSError as e:
+			errors.append(e)
+		finally:
+			done.set()
+
+	wx.CallAfter(run)
+	done.wait(WINDOW_TIMEOUT)
+	if errors:
+		raise errors[0]
+
+
+class RestorePipeline:
+	def __init__(
+		self,
+		paths,
+		concurrency=DEFAULT_CONCURRENCY,
+		opener=_openOnMainThread,
+		windowCounter=explorer.countExplorerWindows,
+		healthCache=None,
+		onDone=None,
+		clock=time.monotonic,
+		action="Restored"
+	):
+		self.paths = [p for p in dict.fromkeys(paths) if p]
+		self.concurrency = clampConcurrency(concurrency)
+		self._opener = opener
+		self._windowCounter = windowCounter
+		self._cache = healthCache if healthCache is not None else pathHealth.cache
+		self._onDone = onDone
+		self._clock = clock
+		# Verb of the summary logged at the end, e.g. "Opened" for folders opened from the dialog.
+		self.action = action
+		self._cancelled = threading.Event()
+		self._thread = None
+		self.report = None
+
+	def start(self):
+		# Checks are queued right away so they overlap with the rest of startup.
+		self._cache.refresh(self.paths, pathHealth.KIND_FOLDER)
+		self._thread = threading.Thread(target=self._run, name="AbsoluteFileAndFolder restore", daemon=True)
+		self._thread.start()
+
+	def cancel(self):
+		self._cancelled.set()
+
+	def wait(self, timeout=None):
+		if self._thread is not None:
+			self._thread.join(timeout)
+
+	def _countWindows(self):
+		try:
+			return self._windowCounter()
+		except Exception:
+			return None
+
+	def _validate(self):
+		states = {}
+		for path in self.paths:
+			if self._cancelled.is_set():
+				break
+			states[path] = self._cache.verify(path, pathHealth.KIND_FOLDER)
+		return states
+
+	# Waits until fewer than `limit` opened folders are still without a window.
+	def _waitForWindows(self, opened, baseline, lastOpenAt, limit):
+		while not self._cancelled.is_set():
+			elapsed = self._clock() - lastOpenAt
+			count = self._countWindows()
+			if count is None:
+				if elapsed >= FALLBACK_INTERVAL:
+					return
+			elif opened - max(0, count - baseline) < limit or elapsed >= WINDOW_TIMEOUT:
+				return
+			time.sleep(POLL_INTERVAL)
+
+	def _run(self):
+		started = self._clock()
+		report = {"requested": len(self.paths), "opened": [], "skipped": {}, "cancelled": False}
+		try:
+			states = self._validate()
+			validated = self._clock()
+			report["validateMs"] = (validated - started) * 1000
+			baseline = self._countWindows() or 0
+			opened = 0
+			lastOpenAt = validated
+			for path in self.paths:
+				state = states.get(path)
+				if state != pathHealth.OK:
+					if state is not None:
+						report["skipped"][path] = state
+					continue
+				if opened:
+					self._waitForWindows(opened, baseline, lastOpenAt, self.concurrency)
+				if self._cancelled.is_set():
+					break
+				try:
+					self._opener(path)
+				except Exception as e:
+					logHandler.log.warning(f"Failed to open folder {path}: {e}", exc_info=True)
+					report["skipped"][path] = "error"
+					continue
+				opened += 1
+				lastOpenAt = self._clock()
+				report["opened"].append(path)
+			if opened and not self._cancelled.is_set() and self._countWindows() is not None:
+				self._waitForWindows(opened, baseline, lastOpenAt, 1)
+		except Exception as e:
+			logHandler.log.warning(f"Folder restore failed: {e}", exc_info=True)
+		report["cancelled"] = self._cancelled.is_set()
+		report["totalMs"] = (self._clock() - started) * 1000
+		self.report = report
+		logHandler.log.info(
+			"{} {} of {} folders in {:.0f} ms ({:.0f} ms validating, {} skipped)".format(
+				self.action, len(report["opened"]), report["requested"], report["totalMs"],
+				report.get("validateMs", 0), len(report["skipped"])
+			)
+		)
+		if self._onDone is not None:
+			self._onDone(report)
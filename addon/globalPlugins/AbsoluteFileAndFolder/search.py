@@ -0,0 +1,315 @@
+# search.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Type-ahead search over saved and recent entries.
+# Names and the last two path components ("tails") are split into trigrams; each trigram
+# maps to a posting list of integer entry ids, kept in id order, one map for names and
+# one for tails. Matches come in tiers: names starting with the query (read off a sorted
+# name list), names containing it and tails containing it; when nothing contains it,
+# entries sharing most of its trigrams, so small typos still match. Substring tiers only
+# check the entries on the rarest posting list, and every tier stops once the limit is
+# filled, so a keystroke costs about the same at any size. Prefix matches come in name order; in the
+# other tiers shorter names come first.
+# One- and two-character queries match word starts only.
+# Building is deferred: rebuild only queues the entries, which are indexed by the first
+# search or by prepare on a worker. Removal only tombstones the id; posting lists are
+# compacted once half of them are dead.
+
+import os
+import re
+import bisect
+import threading
+from collections import Counter, defaultdict
+
+MIN_GRAM_RATIO = 0.6
+# Type-ahead lists show at most this many matches.
+RESULT_LIMIT = 200
+# Ids whose trigrams are counted at once when looking for near matches; the window
+# doubles until enough are found.
+FUZZY_WINDOW = 1024
+_COMPACT_MIN_DEAD = 1024
+_WORD_SPLIT = re.compile(r"[\s\\/_.\-]+")
+_LAST = "\U0010ffff"
+
+PREFIX_SCORE = 4.0
+NAME_SCORE = 3.0
+PATH_SCORE = 2.0
+
+
+def normalize(text):
+	return text.casefold() if text else ""
+
+
+def _trigrams(text):
+	padded = f" {text} "
+	return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _tail(path):
+	head, last = os.path.split(path.rstrip("\\/"))
+	return os.path.join(os.path.basename(head), last)
+
+
+# The ids of a posting list from start up to end.
+def _between(bucket, start, end):
+	return bucket[bisect.bisect_left(bucket, start):bisect.bisect_left(bucket, end)]
+
+
+def _holds(bucket, entryId):
+	position = bisect.bisect_left(bucket, entryId)
+	return position < len(bucket) and bucket[position] == entryId
+
+
+class TrigramIndex:
+	def __init__(self):
+		self._lock = threading.RLock()
+		# Held while prepare builds, so a search waits for a build already running.
+		self._buildLock = threading.Lock()
+		self._clear()
+		# Entries queued by rebuild and not indexed yet; None once they are.
+		self._pending = None
+
+	def _clear(self):
+		self._ids = {}
+		self._keys = []
+		self._names = []
+		self._paths = []
+		self._nameGrams = defaultdict(list)
+		self._tailGrams = defaultdict(list)
+		self._starts = defaultdict(list)
+		self._byName = []
+		self._dead = 0
+
+	def __len__(self):
+		with self._lock:
+			return len(self._ids) if self._pending is None else len(self._pending)
+
+	def isPrepared(self):
+		return self._pending is None
+
+	# Queues items, (key, name, path) triples, in place of everything indexed so far.
+	def rebuild(self, items):
+		pending = {key: (name, path) for key, name, path in items}
+		with self._lock:
+			self._clear()
+			self._pending = pending
+
+	# Indexes the queued entries now rather than on the next search. Safe to call from a
+	# worker: the build runs outside the lock and changes made meanwhile are applied to
+	# its result before it replaces the empty index.
+	def prepare(self):
+		with self._buildLock:
+			with self._lock:
+				pending = self._pending
+				if pending is None:
+					return
+				snapshot = dict(pending)
+			built = TrigramIndex()
+			built._indexAll(snapshot)
+			with self._lock:
+				if self._pending is not pending:
+					# rebuild queued other entries in the meantime.
+					return
+				for attribute in ("_ids", "_keys", "_names", "_paths", "_nameGrams", "_tailGrams", "_starts", "_byName", "_dead"):
+					setattr(self, attribute, getattr(built, attribute))
+				self._pending = None
+				for key in snapshot.keys() - pending.keys():
+					self._remove(key)
+				for key, entry in pending.items():
+					if snapshot.get(key) != entry:
+						self._add(key, *entry)
+
+	def _indexAll(self, entries):
+		for key, (name, path) in entries.items():
+			self._index(key, name, path)
+		self._sortNames()
+
+	def add(self, key, name, path=""):
+		with self._lock:
+			if self._pending is not None:
+				self._pending.pop(key, None)
+				self._pending[key] = (name, path)
+			else:
+				self._add(key, name, path)
+
+	def _add(self, key, name, path):
+		self._remove(key)
+		name = self._index(key, name, path)
+		bisect.insort(self._byName, (name, self._ids[key]))
+
+	def _index(self, key, name, path):
+		entryId = len(self._keys)
+		self._ids[key] = entryId
+		self._keys.append(key)
+		name = normalize(name)
+		path = normalize(path)
+		tail = normalize(_tail(path))
+		self._names.append(name)
+		self._paths.append(path)
+		for postings, grams in (
+			(self._nameGrams, _trigrams(name)),
+			(self._tailGrams, _trigrams(tail)),
+			(self._starts, {word[:size] for word in name.split() + _WORD_SPLIT.split(tail) if word for size in (1, 2)})
+		):
+			for gram in grams:
+				postings[gram].append(entryId)
+		return name
+
+	def remove(self, key):
+		with self._lock:
+			if self._pending is not None:
+				self._pending.pop(key, None)
+			else:
+				self._remove(key)
+
+	def _remove(self, key):
+		entryId = self._ids.pop(key, None)
+		if entryId is None:
+			return
+		self._keys[entryId] = None
+		byName = self._byName
+		position = bisect.bisect_left(byName, (self._names[entryId], entryId))
+		if position < len(byName) and byName[position][1] == entryId:
+			del byName[position]
+		self._dead += 1
+		if self._dead >= _COMPACT_MIN_DEAD and self._dead * 2 > len(self._keys):
+			self._compact()
+
+	def rename(self, oldKey, newKey, name, path=""):
+		with self._lock:
+			self.remove(oldKey)
+			self.add(newKey, name, path)
+
+	def _compact(self):
+		live = {key: (self._names[i], self._paths[i]) for i, key in enumerate(self._keys) if key is not None}
+		self._clear()
+		self._indexAll(live)
+
+	def _sortNames(self):
+		self._byName = sorted((name, i) for i, name in enumerate(self._names) if self._keys[i] is not None)
+
+	# Ids of the names starting with prefix, in name order.
+	def _prefixed(self, prefix):
+		byName = self._byName
+		start = bisect.bisect_left(byName, (prefix,))
+		end = bisect.bisect_left(byName, (prefix + _LAST,), start)
+		for position in range(start, end):
+			yield byName[position][1]
+
+	# The shortest posting list holding every trigram of query, or an empty one when a
+	# trigram is not indexed at all.
+	def _rarest(self, postings, query):
+		rarest = None
+		for i in range(len(query) - 2):
+			bucket = postings.get(query[i:i + 3])
+			if not bucket:
+				return ()
+			if rarest is None or len(bucket) < len(rarest):
+				rarest = bucket
+		return rarest
+
+	# Adds the ids of candidates passing test to matches until need of them are found.
+	def _collect(self, candidates, test, matches, need, accept):
+		keys = self._keys
+		for i in candidates:
+			if i in matches or keys[i] is None or not test(i) or not accept(keys[i]):
+				continue
+			matches[i] = None
+			need -= 1
+			if need == 0:
+				break
+		return need
+
+	# Entries sharing at least MIN_GRAM_RATIO of the query's trigrams, as id: hits. A near
+	# match misses at most len(grams) - needed trigrams, so it holds one of the rarest
+	# len(grams) - needed + 1; only those are counted in full, the common trigrams are
+	# just looked up for them. Ids are taken a window at a time until need are found.
+	def _nearMatches(self, query, matches, need, accept):
+		grams = _trigrams(query)
+		needed = max(1, int(len(grams) * MIN_GRAM_RATIO))
+		lists = sorted(
+			([bucket for bucket in (self._nameGrams.get(gram), self._tailGrams.get(gram)) if bucket] for gram in grams),
+			key=lambda buckets: sum(map(len, buckets))
+		)
+		rare = lists[:len(grams) - needed + 1]
+		common = lists[len(grams) - needed + 1:]
+		keys = self._keys
+		found = {}
+		start = 0
+		window = FUZZY_WINDOW
+		while start < len(keys) and len(found) < need:
+			end = start + window
+			counts = Counter()
+			for buckets in rare:
+				counts.update(set().union(*(_between(bucket, start, end) for bucket in buckets)))
+			candidates = set(counts)
+			for buckets in common:
+				hit = set()
+				for bucket in buckets:
+					part = _between(bucket, start, end)
+					if len(candidates) * 10 < len(part):
+						hit.update(i for i in candidates if _holds(part, i))
+					else:
+						hit.update(candidates.intersection(part))
+				counts.update(hit)
+			for i, hits in counts.items():
+				if hits >= needed and i not in matches and keys[i] is not None and accept(keys[i]):
+					found[i] = hits
+			start = end
+			window *= 2
+		return found, len(grams)
+
+	# Returns (score, key) pairs, best match first; higher scores are better matches.
+	# Stops looking once limit matches are found; within only keeps keys it contains.
+	def scored(self, query, limit=None, within=None):
+		query = normalize(query).strip()
+		if not query:
+			return None
+		self.prepare()
+		with self._lock:
+			if self._pending is not None:
+				# Queued again since prepare returned.
+				pending = self._pending
+				self._pending = None
+				self._indexAll(pending)
+			return self._scored(query, limit or len(self._keys) or 1, within)
+
+	def _scored(self, query, limit, within):
+		accept = (lambda key: True) if within is None else within.__contains__
+		names = self._names
+		keys = self._keys
+		matches = {}
+		ranked = []
+		need = self._collect(self._prefixed(query), lambda i: True, matches, limit, accept)
+		ranked.extend((PREFIX_SCORE, keys[i]) for i in matches)
+		if len(query) < 3:
+			# Too short for trigrams: other word starts follow, in the order entries were added.
+			if need:
+				first = len(matches)
+				self._collect(self._starts.get(query, ()), lambda i: True, matches, need, accept)
+				ranked.extend((1.0, keys[i]) for i in list(matches)[first:])
+			return ranked
+		tiers = (
+			(NAME_SCORE, self._nameGrams, lambda i: query in names[i]),
+			(PATH_SCORE, self._tailGrams, lambda i: query in self._paths[i])
+		)
+		for score, postings, test in tiers:
+			if not need:
+				break
+			first = len(matches)
+			need = self._collect(self._rarest(postings, query), test, matches, need, accept)
+			found = list(matches)[first:]
+			found.sort(key=lambda i: (len(names[i]), names[i]))
+			ranked.extend((score, keys[i]) for i in found)
+		if not matches:
+			found, total = self._nearMatches(query, matches, need, accept)
+			near = sorted(found, key=lambda i: (-found[i], len(names[i]), names[i]))[:need]
+			ranked.extend((found[i] / total, keys[i]) for i in near)
+		return ranked
+
+	def search(self, query, limit=None, within=None):
+		ranked = self.scored(query, limit, within)
+		if ranked is None:
+			return None
+		return [key for score, key in ranked]
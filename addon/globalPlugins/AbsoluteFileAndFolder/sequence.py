@@ -0,0 +1,258 @@
+# sequence.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Indexed sequence of unique names for the custom bookmark order.
+# Names sit in an implicit treap (a randomized balanced tree ordered by position, with
+# subtree sizes) so finding, inserting, removing or moving a name to any position is
+# O(log n). Every node is also linked to its neighbours, which makes iteration linear
+# and lets an adjacent swap exchange two labels in O(1).
+
+import random
+
+
+class _Node:
+	__slots__ = ("name", "priority", "size", "left", "right", "parent", "prev", "next")
+
+	def __init__(self, name, priority):
+		self.name = name
+		self.priority = priority
+		self.size = 1
+		self.left = None
+		self.right = None
+		self.parent = None
+		self.prev = None
+		self.next = None
+
+
+def _size(node):
+	return node.size if node is not None else 0
+
+
+def _update(node):
+	node.size = 1 + _size(node.left) + _size(node.right)
+	if node.left is not None:
+		node.left.parent = node
+	if node.right is not None:
+		node.right.parent = node
+
+
+class OrderedSequence:
+	def __init__(self, names=(), rng=None):
+		self._random = rng or random.Random()
+		self._nodes = {}
+		self._root = None
+		self._head = None
+		self._tail = None
+		self.extend(names)
+
+	def __len__(self):
+		return len(self._nodes)
+
+	def __contains__(self, name):
+		return name in self._nodes
+
+	def __iter__(self):
+		node = self._head
+		while node is not None:
+			yield node.name
+			node = node.next
+
+	def __getitem__(self, index):
+		if index < 0:
+			index += len(self._nodes)
+		if not 0 <= index < len(self._nodes):
+			raise IndexError("sequence index out of range")
+		node = self._root
+		while True:
+			leftSize = _size(node.left)
+			if index < leftSize:
+				node = node.left
+			elif index == leftSize:
+				return node.name
+			else:
+				index -= leftSize + 1
+				node = node.right
+
+	def _split(self, node, count):
+		# Returns (first `count` nodes, the rest); both roots come back detached.
+		if node is None:
+			return None, None
+		leftSize = _size(node.left)
+		if count <= leftSize:
+			left, node.left = self._split(node.left, count)
+			_update(node)
+			node.parent = None
+			if left is not None:
+				left.parent = None
+			return left, node
+		node.right, right = self._split(node.right, count - leftSize - 1)
+		_update(node)
+		node.parent = None
+		if right is not None:
+			right.parent = None
+		return node, right
+
+	def _merge(self, left, right):
+		if left is None:
+			return right
+		if right is None:
+			return left
+		if left.priority > right.priority:
+			left.right = self._merge(left.right, right)
+			_update(left)
+			left.parent = None
+			return left
+		right.left = self._merge(left, right.left)
+		_update(right)
+		right.parent = None
+		return right
+
+	def _link(self, node, prev, next):
+		node.prev = prev
+		node.next = next
+		if prev is None:
+			self._head = node
+		else:
+			prev.next = node
+		if next is None:
+			self._tail = node
+		else:
+			next.prev = node
+
+	def _unlink(self, node):
+		if node.prev is None:
+			self._head = node.next
+		else:
+			node.prev.next = node.next
+		if node.next is None:
+			self._tail = node.prev
+		else:
+			node.next.prev = node.prev
+		node.prev = node.next = None
+
+	def _nodeIndex(self, node):
+		index = _size(node.left)
+		while node.parent is not None:
+			if node is node.parent.right:
+				index += _size(node.parent.left) + 1
+			node = node.parent
+		return index
+
+	def _neighbours(self, index):
+		# The nodes that will sit before and after a node inserted at index.
+		if index >= _size(self._root):
+			return self._tail, None
+		node = self._root
+		while True:
+			leftSize = _size(node.left)
+			if index < leftSize:
+				node = node.left
+			elif index == leftSize:
+				return node.prev, node
+			else:
+				index -= leftSize + 1
+				node = node.right
+
+	def _attach(self, node, index):
+		prev, next = self._neighbours(index)
+		self._link(node, prev, next)
+		left, right = self._split(self._root, index)
+		self._root = self._merge(self._merge(left, node), right)
+
+	def _detach(self, node):
+		index = self._nodeIndex(node)
+		left, rest = self._split(self._root, index)
+		middle, right = self._split(rest, 1)
+		self._root = self._merge(left, right)
+		self._unlink(node)
+		node.left = node.right = node.parent = None
+		node.size = 1
+		return index
+
+	def extend(self, names):
+		# Appends in O(k): the new nodes are built into a treap by a stack pass and merged once.
+		# Every name is checked first so a duplicate leaves the sequence untouched.
+		names = list(names)
+		seen = set()
+		for name in names:
+			if name in self._nodes or name in seen:
+				raise ValueError(f"{name!r} is already in the sequence")
+			seen.add(name)
+		stack = []
+		nodes = []
+		for name in names:
+			node = self._nodes[name] = _Node(name, self._random.random())
+			last = None
+			while stack and stack[-1].priority < node.priority:
+				last = stack.pop()
+			node.left = last
+			if stack:
+				stack[-1].right = node
+			stack.append(node)
+			nodes.append(node)
+		if not nodes:
+			return
+		# Children before parents, so every subtree size is known when its parent is updated.
+		order = []
+		pending = [stack[0]]
+		while pending:
+			node = pending.pop()
+			order.append(node)
+			if node.left is not None:
+				pending.append(node.left)
+			if node.right is not None:
+				pending.append(node.right)
+		for node in reversed(order):
+			_update(node)
+		stack[0].parent = None
+		prev = self._tail
+		for node in nodes:
+			self._link(node, prev, None)
+			prev = node
+		self._root = self._merge(self._root, stack[0])
+
+	def append(self, name):
+		self.insert(len(self._nodes), name)
+
+	def insert(self, index, name):
+		if name in self._nodes:
+			raise ValueError(f"{name!r} is already in the sequence")
+		node = self._nodes[name] = _Node(name, self._random.random())
+		self._attach(node, max(0, min(index, len(self._nodes) - 1)))
+
+	def remove(self, name):
+		self._detach(self._nodes.pop(name))
+
+	def index(self, name):
+		return self._nodeIndex(self._nodes[name])
+
+	def rename(self, oldName, newName):
+		if newName in self._nodes:
+			raise ValueError(f"{newName!r} is already in the sequence")
+		node = self._nodes.pop(oldName)
+		node.name = newName
+		self._nodes[newName] = node
+
+	# Exchanges a name with its neighbour before (-1) or after (1); returns False at an end.
+	def swap(self, name, direction):
+		node = self._nodes[name]
+		other = node.next if direction > 0 else node.prev
+		if other is None:
+			return False
+		node.name, other.name = other.name, node.name
+		self._nodes[node.name] = node
+		self._nodes[other.name] = other
+		return True
+
+	# Moves a name to index (clamped to the sequence) and returns (old index, new index).
+	def move(self, name, index):
+		node = self._nodes[name]
+		index = max(0, min(index, len(self._nodes) - 1))
+		old = self._detach(node)
+		self._attach(node, index)
+		return old, index
+
+	def clear(self):
+		self._nodes = {}
+		self._root = self._head = self._tail = None
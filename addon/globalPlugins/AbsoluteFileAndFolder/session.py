@@ -0,0 +1,99 @@
+# session.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Periodic snapshot of the folders open in Explorer, restored after a restart when the
+# auto-open list is empty.
+# Every tick first takes a cheap signature of the Explorer windows (handles and titles,
+# no COM). Only when it changed are the window locations listed through the resolver's
+# COM worker. The snapshot is a {path: position} dict in a journal store, so a change
+# appends only the windows that were opened, closed or moved. When no signature is
+# available the tick interval backs off while nothing changes.
+
+import threading
+import logHandler
+from . import explorer
+from . import persistence
+from . import startupRestore
+
+DEFAULT_INTERVAL = 15.0
+MAX_INTERVAL = 120.0
+LIST_TIMEOUT_MS = 3000
+
+
+class SessionSnapshotter:
+	def __init__(
+		self,
+		store,
+		resolver=None,
+		signature=explorer.explorerWindowSignature,
+		enabled=None,
+		interval=DEFAULT_INTERVAL,
+		maxInterval=MAX_INTERVAL
+	):
+		self.store = store
+		self._resolver = resolver if resolver is not None else explorer.resolver
+		self._signature = signature
+		self._enabled = enabled
+		self.interval = interval
+		self.maxInterval = maxInterval
+		self._delay = interval
+		self._lastSignature = None
+		self._folders = None
+		self._stop = threading.Event()
+		self._thread = None
+		self.listings = 0
+		self.writes = 0
+
+	def start(self):
+		if self._thread is not None:
+			return
+		# Without a snapshot an empty desktop is not recorded, so a restart right after
+		# the first start still finds the folders of the session before it.
+		self._folders = startupRestore.readSnapshot(self.store) or []
+		self._thread = threading.Thread(target=self._run, name="AbsoluteFileAndFolder session snapshot", daemon=True)
+		self._thread.start()
+
+	def stop(self):
+		self._stop.set()
+		thread = self._thread
+		self._thread = None
+		if thread is not None and thread is not threading.current_thread():
+			thread.join(LIST_TIMEOUT_MS / 1000.0)
+
+	def _run(self):
+		while not self._stop.wait(self._delay):
+			try:
+				self.snapshot()
+			except Exception as e:
+				logHandler.log.warning(f"Explorer session snapshot failed: {e}", exc_info=True)
+
+	def snapshot(self):
+		if self._enabled is not None and not self._enabled():
+			return False
+		signature = self._signature() if self._signature is not None else None
+		if signature is not None:
+			if signature == self._lastSignature:
+				return False
+		locations = self._resolver.locations(LIST_TIMEOUT_MS)
+		if locations is None:
+			return False
+		self.listings += 1
+		self._lastSignature = signature
+		folders = list(dict.fromkeys(path for hwnd, path in locations))
+		if folders == self._folders:
+			if signature is None:
+				self._delay = min(self._delay * 2, self.maxInterval)
+			return False
+		self._delay = self.interval
+		self._folders = folders
+		data = {"folders": {path: i for i, path in enumerate(folders)}}
+		persistence.service.markDirty(self.store.path, lambda: self._write(data))
+		return True
+
+	def _write(self, data):
+		try:
+			self.store.save(data)
+			self.writes += 1
+		except Exception as e:
+			logHandler.log.error(f"Failed to save Explorer session: {e}", exc_info=True)
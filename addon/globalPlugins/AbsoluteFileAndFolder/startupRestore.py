@@ -0,0 +1,92 @@
+# startupRestore.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Decides, a few seconds after NVDA starts, whether folders are opened again.
+# Only the boot marker, the auto-open settings in the folder config and the Explorer
+# session file are read, so the check loads neither wx nor the managers and dialogs;
+# the restore pipeline is imported only when there is something to open.
+# The auto-open list the user edits in the dialog wins; the folders of the last Explorer
+# snapshot are only opened when that list is empty.
+
+import os
+import threading
+import globalVars
+import logHandler
+from . import bootSession
+from . import journal
+from . import persistence
+
+_sessionStores = {}
+_sessionStoresLock = threading.Lock()
+
+
+def configFolder():
+	return os.path.join(globalVars.appArgs.configPath, "ChaiChaimee", "AbsoluteFileAndFloder")
+
+
+def configPath():
+	return os.path.join(configFolder(), "AbsoluteFolders.json")
+
+
+def sessionPath():
+	return os.path.join(configFolder(), "AbsoluteFoldersSession.json")
+
+
+def bootMarkerPath():
+	return os.path.join(configFolder(), "BootSession.json")
+
+
+# The journal store of the session file, shared by the snapshotter and the folder manager.
+def sessionStore():
+	path = sessionPath()
+	with _sessionStoresLock:
+		store = _sessionStores.get(path)
+		if store is None:
+			store = _sessionStores[path] = journal.JournalStore(path)
+		return store
+
+
+# Folders of the last snapshot in window order, or None if no snapshot was ever taken. An
+# empty list means no Explorer window was open.
+def readSnapshot(store):
+	persistence.service.flush(store.path)
+	try:
+		data = store.load()
+	except Exception as e:
+		logHandler.log.warning(f"Failed to read Explorer session: {e}", exc_info=True)
+		return None
+	folders = data.get("folders") if data else None
+	if not isinstance(folders, dict):
+		return None
+	return [path for path, position in sorted(folders.items(), key=lambda item: item[1])]
+
+
+def foldersToRestore(remembered, store):
+	if remembered:
+		return list(remembered)
+	return readSnapshot(store) or []
+
+
+# The folder config as saved, or an empty dict when it cannot be read.
+def readSettings():
+	path = configPath()
+	persistence.service.flush(path)
+	try:
+		return journal.JournalStore(path).load() or {}
+	except Exception as e:
+		logHandler.log.warning(f"Failed to load folder config: {e}", exc_info=True)
+		return {}
+
+
+# Returns the folders to open again, empty unless this is the first NVDA start since
+# Windows booted and auto-open is on, with the settings read to decide it.
+def check(marker=None):
+	settings = readSettings()
+	if marker is None:
+		marker = bootSession.BootMarker(bootMarkerPath())
+	# Asked on every start so the marker always tracks the current boot.
+	firstStart = marker.isFirstStartOfBoot(settings.get("lastSystemUptime", 0))
+	if not firstStart or not settings.get("autoLoadLastFolder", False):
+		return [], settings
+	return foldersToRestore(settings.get("lastOpenedFolders", []), sessionStore()), settings
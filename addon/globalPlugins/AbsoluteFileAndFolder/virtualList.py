@@ -0,0 +1,173 @@
+# virtualList.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Owner-data list support for the Saved/Recent lists.
+# The control only asks for the rows it draws, and the model rebuilds its ordered rows
+# only when the key describing the view (data version, tab, filter, sort...) changes.
+# Rows are (label, path column, item key) tuples; the key identifies the entry across
+# rebuilds so selection and focus can follow it. Any further values in a row fill the
+# columns after the path. A status callback can fill the column after those from the row
+# when it is drawn, for text that changes without the rows, such as path health.
+
+import wx
+
+
+# Returns (start, oldStop, newStop) spanning the rows that differ, or None if they are equal.
+def diffRows(old, new):
+	oldLen = len(old)
+	newLen = len(new)
+	limit = min(oldLen, newLen)
+	start = 0
+	while start < limit and old[start] == new[start]:
+		start += 1
+	if start == oldLen == newLen:
+		return None
+	oldStop = oldLen
+	newStop = newLen
+	while oldStop > start and newStop > start and old[oldStop - 1] == new[newStop - 1]:
+		oldStop -= 1
+		newStop -= 1
+	return start, oldStop, newStop
+
+
+class VirtualListModel:
+	def __init__(self):
+		self.rows = []
+		self._key = None
+		self._index = None
+
+	def update(self, key, build):
+		if key == self._key:
+			return None
+		old = self.rows
+		self.rows = build()
+		self._key = key
+		self._index = None
+		return diffRows(old, self.rows)
+
+	def invalidate(self):
+		self._key = None
+
+	# Applies a single reorder in place when the rows still show the view oldKey
+	# describes; newKey is the key of the view that results.
+	def moveRow(self, fromIndex, toIndex, oldKey, newKey):
+		if oldKey != self._key or not (0 <= fromIndex < len(self.rows) and 0 <= toIndex < len(self.rows)):
+			return False
+		self.rows.insert(toIndex, self.rows.pop(fromIndex))
+		self._key = newKey
+		if self._index is not None:
+			for i in range(min(fromIndex, toIndex), max(fromIndex, toIndex) + 1):
+				self._index[self.rows[i][2]] = i
+		return True
+
+	def indexOf(self, itemKey):
+		if self._index is None:
+			self._index = {row[2]: i for i, row in enumerate(self.rows)}
+		return self._index.get(itemKey)
+
+
+class VirtualListCtrl(wx.ListCtrl):
+	def __init__(self, parent, model, style=wx.LC_REPORT, status=None):
+		super().__init__(parent, style=style | wx.LC_VIRTUAL)
+		self.model = model
+		self._status = status
+
+	def OnGetItemText(self, item, column):
+		try:
+			row = self.model.rows[item]
+		except IndexError:
+			return ""
+		if column >= 2:
+			column += 1
+		if column < len(row):
+			return row[column]
+		if column == len(row) and self._status is not None:
+			return self._status(row)
+		return ""
+
+	# Redraws the rows on screen, whose status may have changed.
+	def refreshVisible(self):
+		count = len(self.model.rows)
+		if not count:
+			return
+		top = max(self.GetTopItem(), 0)
+		if top < count:
+			# One more than a full page, for a row cut off at the bottom.
+			self.RefreshItems(top, min(top + self.GetCountPerPage(), count - 1))
+
+	def selectedKey(self):
+		idx = self.GetFirstSelected()
+		if 0 <= idx < len(self.model.rows):
+			return self.model.rows[idx][2]
+		return None
+
+	def selectedIndexes(self):
+		indexes = []
+		idx = self.GetFirstSelected()
+		while idx != -1:
+			indexes.append(idx)
+			idx = self.GetNextSelected(idx)
+		return indexes
+
+	# Keys of every selected row, in row order.
+	def selectedKeys(self):
+		rows = self.model.rows
+		return [rows[idx][2] for idx in self.selectedIndexes() if idx < len(rows)]
+
+	# Rebuilds the rows for viewKey. The selection follows its keys to their new rows;
+	# selectKey replaces it with that one row.
+	def sync(self, viewKey, build, selectKey=None, selectFirst=True):
+		previous = self.selectedIndexes()
+		if selectKey is not None:
+			keys = (selectKey,)
+		else:
+			keys = self.selectedKeys()
+		span = self.model.update(viewKey, build)
+		count = len(self.model.rows)
+		if span is not None:
+			start, oldStop, newStop = span
+			if oldStop != newStop:
+				# Rows shifted: the count changes and everything from the first difference moves.
+				self.SetItemCount(count)
+				if start < count:
+					self.RefreshItems(start, count - 1)
+			elif start < newStop:
+				self.RefreshItems(start, newStop - 1)
+		if not count:
+			return
+		indexes = sorted(index for index in map(self.model.indexOf, keys) if index is not None)
+		if not indexes:
+			if previous:
+				indexes = [min(previous[0], count - 1)]
+			elif selectFirst:
+				indexes = [0]
+			else:
+				return
+		if indexes != previous:
+			kept = set(indexes)
+			for index in previous:
+				if index < count and index not in kept:
+					self.Select(index, False)
+			for index in indexes:
+				self.Select(index)
+		if self.GetFocusedItem() not in indexes:
+			self.Focus(indexes[0])
+
+	# Shows a reorder made by the caller without rebuilding the rows, keeping the moved
+	# row selected and focused. Returns False if the rows need a full sync instead.
+	def moveRow(self, fromIndex, toIndex, oldKey, newKey):
+		if not self.model.moveRow(fromIndex, toIndex, oldKey, newKey):
+			return False
+		self.RefreshItems(min(fromIndex, toIndex), max(fromIndex, toIndex))
+		previous = self.selectedIndexes()
+		if previous != [toIndex]:
+			for index in previous:
+				self.Select(index, False)
+			self.Select(toIndex)
+		self.Focus(toIndex)
+		return True
+
+	def clearSelection(self):
+		for idx in self.selectedIndexes():
+			self.Select(idx, False)
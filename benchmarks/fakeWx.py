@@ -0,0 +1,507 @@
+# fakeWx.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Headless stand-in for the parts of wx the add-on uses. Windows keep just enough state
+# (values, selections, list rows, bound handlers) for the dialog code to run as it does
+# under NVDA; nothing is drawn. Installed as the "wx" module by nvdaStubs.install().
+
+import itertools
+import threading
+
+_ids = itertools.count(1000)
+
+ID_ANY = -1
+ID_OK = 5100
+ID_CANCEL = 5101
+ID_CLOSE = 5102
+YES = 2
+NO = 8
+OK = 4
+CANCEL = 16
+WXK_RETURN = 13
+WXK_ESCAPE = 27
+WXK_DELETE = 127
+WXK_UP = 315
+WXK_DOWN = 317
+WXK_END = 312
+WXK_HOME = 313
+WXK_PAGEUP = 366
+WXK_PAGEDOWN = 367
+LC_VIRTUAL = 1 << 20
+LIST_STATE_FOCUSED = 1
+LIST_STATE_SELECTED = 2
+# Rows a list reports as fitting on one page, starting at its top row 0.
+LIST_PAGE_SIZE = 20
+
+# Style and layout flags only need to be distinct ints that can be or'ed together.
+for _bit, _name in enumerate((
+	"DEFAULT_DIALOG_STYLE RESIZE_BORDER MAXIMIZE_BOX VERTICAL HORIZONTAL ALIGN_CENTER_VERTICAL "
+	"ALIGN_RIGHT ALIGN_CENTER RIGHT LEFT TOP BOTTOM ALL EXPAND CB_READONLY LC_REPORT LC_SINGLE_SEL "
+	"LC_NO_HEADER BORDER_SUNKEN ICON_WARNING ICON_QUESTION ICON_INFORMATION YES_NO TE_PROCESS_ENTER "
+	"TE_MULTILINE LIST_NEXT_ALL"
+).split()):
+	globals()[_name] = 1 << _bit
+
+
+class _EventType:
+	def __init__(self, name):
+		self.name = name
+
+
+for _name in (
+	"EVT_TIMER EVT_ACTIVATE EVT_COMBOBOX EVT_NOTEBOOK_PAGE_CHANGED EVT_BUTTON EVT_LIST_ITEM_ACTIVATED "
+	"EVT_LIST_ITEM_SELECTED EVT_LIST_ITEM_DESELECTED EVT_CONTEXT_MENU EVT_KEY_DOWN EVT_CHAR_HOOK EVT_CLOSE "
+	"EVT_CHECKBOX EVT_MENU EVT_MENU_CLOSE EVT_TEXT EVT_TEXT_ENTER EVT_SPINCTRL EVT_WINDOW_DESTROY"
+).split():
+	globals()[_name] = _EventType(_name)
+
+
+_topLevelWindows = []
+
+
+def GetTopLevelWindows():
+	return [window for window in _topLevelWindows if window]
+
+
+# CallAfter queues like the real main loop; runPending() plays the part of the idle loop.
+_pending = []
+_pendingLock = threading.Lock()
+
+
+def CallAfter(func, *args, **kwargs):
+	with _pendingLock:
+		_pending.append((func, args, kwargs))
+
+
+def runPending():
+	while True:
+		with _pendingLock:
+			if not _pending:
+				return
+			calls = list(_pending)
+			del _pending[:]
+		for func, args, kwargs in calls:
+			func(*args, **kwargs)
+
+
+# CallLater timers never fire on their own; fireTimers() runs every one still pending.
+_timers = []
+
+
+class CallLater:
+	def __init__(self, millis, func, *args, **kwargs):
+		self._call = (func, args, kwargs)
+		self.Start(millis)
+
+	def Start(self, millis=None):
+		if self not in _timers:
+			_timers.append(self)
+
+	Restart = Start
+
+	def Stop(self):
+		if self in _timers:
+			_timers.remove(self)
+
+	def IsRunning(self):
+		return self in _timers
+
+	def Notify(self):
+		self.Stop()
+		func, args, kwargs = self._call
+		func(*args, **kwargs)
+
+
+def fireTimers():
+	while _timers:
+		_timers[0].Notify()
+
+
+def NewIdRef():
+	return next(_ids)
+
+
+class Event:
+	def __init__(self, **kwargs):
+		self.vetoed = False
+		self.skipped = False
+		self.__dict__.update(kwargs)
+
+	def Skip(self, skip=True):
+		self.skipped = skip
+
+	def Veto(self):
+		self.vetoed = True
+
+	def CanVeto(self):
+		return getattr(self, "canVeto", True)
+
+	def GetActive(self):
+		return getattr(self, "active", True)
+
+	def GetEventObject(self):
+		return getattr(self, "eventObject", None)
+
+	def GetKeyCode(self):
+		return getattr(self, "keyCode", 0)
+
+	def AltDown(self):
+		return getattr(self, "alt", False)
+
+	def GetIndex(self):
+		return getattr(self, "index", -1)
+
+
+class EvtHandler:
+	def __init__(self, *args, **kwargs):
+		self._handlers = []
+
+	def Bind(self, event, handler, source=None, id=ID_ANY):
+		self._handlers.append((event, handler, source))
+
+	def Unbind(self, event, source=None, handler=None):
+		self._handlers = [h for h in self._handlers if not (h[0] is event and handler in (None, h[1]))]
+
+	def fire(self, event, source=None, **kwargs):
+		evt = Event(**kwargs)
+		for bound, handler, boundSource in list(self._handlers):
+			if bound is event and (source is None or boundSource is source):
+				handler(evt)
+		return evt
+
+
+class Window(EvtHandler):
+	def __init__(self, parent=None, id=ID_ANY, label="", style=0, **kwargs):
+		super().__init__()
+		self.Parent = parent
+		self.Id = next(_ids)
+		self._label = label
+		self._shown = True
+		self._enabled = True
+		self._destroyed = False
+
+	def __bool__(self):
+		return not self._destroyed
+
+	def Show(self, show=True):
+		self._shown = show
+		return True
+
+	def Hide(self):
+		return self.Show(False)
+
+	def IsShown(self):
+		return self._shown
+
+	def Enable(self, enable=True):
+		self._enabled = enable
+
+	def Disable(self):
+		self._enabled = False
+
+	def IsEnabled(self):
+		return self._enabled
+
+	def GetLabel(self):
+		return self._label
+
+	def SetLabel(self, label):
+		self._label = label
+
+	def GetId(self):
+		return self.Id
+
+	def Destroy(self):
+		if not self._destroyed:
+			self._destroyed = True
+			self.fire(EVT_WINDOW_DESTROY, eventObject=self)
+		return True
+
+	def _noop(self, *args, **kwargs):
+		pass
+
+	SetFocus = Layout = Fit = SetSizer = SetMinSize = CentreOnScreen = Raise = Refresh = _noop
+	PopupMenu = SetName = SetTitle = SetHint = _noop
+
+
+class TopLevelWindow(Window):
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		_topLevelWindows.append(self)
+
+	def Close(self, force=False):
+		evt = self.fire(EVT_CLOSE, canVeto=not force)
+		if not evt.vetoed:
+			self.Destroy()
+		return True
+
+
+class Dialog(TopLevelWindow):
+	def ShowModal(self):
+		return ID_OK
+
+	def EndModal(self, code):
+		pass
+
+
+class Frame(TopLevelWindow):
+	pass
+
+
+class Panel(Window):
+	pass
+
+
+class StaticText(Window):
+	pass
+
+
+class Button(Window):
+	pass
+
+
+class CheckBox(Window):
+	_value = False
+
+	def GetValue(self):
+		return self._value
+
+	def SetValue(self, value):
+		self._value = value
+
+
+class TextCtrl(Window):
+	def __init__(self, parent=None, value="", **kwargs):
+		super().__init__(parent, **kwargs)
+		self._value = value
+
+	def GetValue(self):
+		return self._value
+
+	def SetValue(self, value):
+		self._value = value
+		self.fire(EVT_TEXT)
+
+	def ChangeValue(self, value):
+		self._value = value
+
+	def Clear(self):
+		self.SetValue("")
+
+
+class SpinCtrl(Window):
+	def __init__(self, parent=None, min=0, max=100, initial=0, **kwargs):
+		super().__init__(parent, **kwargs)
+		self._value = initial
+
+	def GetValue(self):
+		return self._value
+
+	def SetValue(self, value):
+		self._value = value
+
+
+class ComboBox(Window):
+	def __init__(self, parent=None, choices=(), **kwargs):
+		super().__init__(parent, **kwargs)
+		self._items = list(choices)
+		self._selection = -1
+
+	def GetSelection(self):
+		return self._selection
+
+	def SetSelection(self, index):
+		self._selection = index
+
+	def GetItems(self):
+		return list(self._items)
+
+	def Set(self, items):
+		self._items = list(items)
+		self._selection = -1
+
+	SetItems = Set
+
+	def GetString(self, index):
+		return self._items[index]
+
+	def SetString(self, index, label):
+		self._items[index] = label
+
+	def GetCount(self):
+		return len(self._items)
+
+
+Choice = ComboBox
+
+
+class Notebook(Window):
+	def __init__(self, parent=None, **kwargs):
+		super().__init__(parent, **kwargs)
+		self._pages = []
+		self._selection = 0
+
+	def AddPage(self, page, text):
+		self._pages.append(page)
+
+	def GetSelection(self):
+		return self._selection
+
+	def ChangeSelection(self, index):
+		self._selection = index
+
+	def SetSelection(self, index):
+		self._selection = index
+		self.fire(EVT_NOTEBOOK_PAGE_CHANGED)
+
+
+class ListCtrl(Window):
+	def __init__(self, parent=None, style=0, **kwargs):
+		super().__init__(parent, style=style, **kwargs)
+		self._virtual = bool(style & LC_VIRTUAL)
+		self._rows = []
+		self._count = 0
+		self._selected = set()
+		self._focused = -1
+		# (start, stop) of every RefreshItems call, for tests.
+		self.refreshed = []
+
+	def InsertColumn(self, index, heading, width=0):
+		pass
+
+	def GetItemCount(self):
+		return self._count if self._virtual else len(self._rows)
+
+	def SetItemCount(self, count):
+		self._count = count
+		self._selected = {i for i in self._selected if i < count}
+
+	def RefreshItems(self, start, stop):
+		self.refreshed.append((start, stop))
+
+	def GetTopItem(self):
+		return 0
+
+	def GetCountPerPage(self):
+		return LIST_PAGE_SIZE
+
+	def RefreshItem(self, index):
+		pass
+
+	def DeleteAllItems(self):
+		self._rows = []
+		self._count = 0
+		self._selected = set()
+
+	def InsertItem(self, index, text):
+		self._rows.insert(index, [text, ""])
+		self._selected = {i + 1 if i >= index else i for i in self._selected}
+		return index
+
+	def DeleteItem(self, index):
+		del self._rows[index]
+		self._selected = {i - 1 if i > index else i for i in self._selected if i != index}
+
+	def SetItem(self, index, column, text):
+		self._rows[index][column] = text
+
+	def GetItemText(self, index, column=0):
+		if self._virtual:
+			return self.OnGetItemText(index, column)
+		return self._rows[index][column]
+
+	def Select(self, index, on=True):
+		if on:
+			self._selected.add(index)
+		else:
+			self._selected.discard(index)
+
+	def IsSelected(self, index):
+		return index in self._selected
+
+	def Focus(self, index):
+		self._focused = index
+
+	def GetFocusedItem(self):
+		return self._focused
+
+	def EnsureVisible(self, index):
+		pass
+
+	def GetFirstSelected(self):
+		return min(self._selected) if self._selected else -1
+
+	def GetNextSelected(self, index):
+		later = [i for i in self._selected if i > index]
+		return min(later) if later else -1
+
+	def GetSelectedItemCount(self):
+		return len(self._selected)
+
+
+class BoxSizer:
+	def __init__(self, *args):
+		pass
+
+	def Add(self, *args, **kwargs):
+		pass
+
+	def AddSpacer(self, *args):
+		pass
+
+	def AddStretchSpacer(self, *args):
+		pass
+
+
+StaticBoxSizer = BoxSizer
+
+
+class Timer(EvtHandler):
+	def __init__(self, owner=None):
+		super().__init__()
+		self.running = False
+
+	def Start(self, millis=0, oneShot=False):
+		self.running = True
+
+	def Stop(self):
+		self.running = False
+
+	def IsRunning(self):
+		return self.running
+
+
+class MenuItem:
+	def __init__(self, label):
+		self.label = label
+		self.Id = next(_ids)
+
+	def GetId(self):
+		return self.Id
+
+
+class Menu(EvtHandler):
+	def __init__(self):
+		super().__init__()
+		self.items = []
+
+	def Append(self, id, label="", *args):
+		item = MenuItem(label)
+		self.items.append(item)
+		return item
+
+	def AppendSeparator(self):
+		pass
+
+	def Destroy(self):
+		pass
+
+
+class TextEntryDialog(Dialog):
+	def __init__(self, parent, message, caption="", value="", **kwargs):
+		super().__init__(parent)
+		self._value = value
+
+	def GetValue(self):
+		return self._value
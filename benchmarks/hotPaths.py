@@ -0,0 +1,361 @@
+# hotPaths.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Times the manager and dialog hot paths at several collection sizes, headless:
+# loadConfig, saveConfig (including the journal write), addToRecent, adding every item of
+# an Explorer selection served by a fake provider, the custom order
+# moves (one place, ten places, to the bottom, and a ten-press burst with its one save),
+# bulk pin and move of up to BULK_SIZE selected bookmarks,
+# updateFiles for each sort mode plus filter/search/recent views, and
+# the startup restore check, plus the GUI-free bookmark engine and the search index on their
+# own: building it and every keystroke of a few typed queries, also at SEARCH_SIZE entries,
+# where the run fails if a keystroke takes KEYSTROKE_BUDGET_MS or more. Every size runs
+# against its own config folder with synthetic bookmarks whose paths do not exist, so
+# health checks answer quickly.
+# The JSON report keeps median and minimum milliseconds per operation.
+#   python benchmarks/hotPaths.py [--sizes 10,1000,10000,100000] [--repeat 5] [--output FILE]
+
+import os
+import sys
+import json
+import time
+import queue
+import random
+import argparse
+import platform
+import statistics
+import tempfile
+
+import nvdaStubs
+
+DEFAULT_SIZES = (10, 1000, 10000, 100000)
+DEFAULT_REPEAT = 5
+REAL_PATHS = 32
+# Bookmarks selected for the bulk pin and move timings.
+BULK_SIZE = 100
+WORDS = ("Report", "budget", "Photos", "notes", "Project", "music", "Invoice", "backup", "Drafts", "scripts")
+EXTENSIONS = (".txt", ".docx", ".py", ".mp3", ".jpg", ".pdf", ".zip", ".exe")
+# Typed one character at a time; includes typos and terms common to every path.
+TYPED = ("report 0001", "budgte 0047", "library", "item4711", "photos 04")
+SEARCH_SIZE = 50000
+KEYSTROKE_BUDGET_MS = 5.0
+
+nvdaStubs.install()
+
+import fakeWx  # noqa: E402
+import globalVars  # noqa: E402
+import gui  # noqa: E402
+from AbsoluteFileAndFolder import AbsoluteFile, AbsoluteFolder, bookmarks, bootSession, explorer, history, pathHealth, persistence, search, startupRestore  # noqa: E402
+
+SORT_MODES = bookmarks.SORT_MODES
+
+
+def measure(func, repeat, setup=None):
+	times = []
+	for i in range(repeat):
+		if setup is not None:
+			setup()
+		started = time.perf_counter()
+		func()
+		times.append((time.perf_counter() - started) * 1000)
+		fakeWx.runPending()
+	return {"medianMs": round(statistics.median(times), 4), "minMs": round(min(times), 4)}
+
+
+def synthesize(size, root, kind):
+	rng = random.Random(size)
+	names = []
+	files = {}
+	for i in range(size):
+		name = "{} {:06d}".format(WORDS[i % len(WORDS)], i)
+		if kind == pathHealth.KIND_FILE:
+			path = os.path.join(root, "library", "item{}{}".format(i, EXTENSIONS[i % len(EXTENSIONS)]))
+		else:
+			path = os.path.join(root, "library", "folder{}".format(i))
+		files[name] = path
+		names.append(name)
+	order = list(names)
+	rng.shuffle(order)
+	return names, files, order, names[::20]
+
+
+def populate(manager, size, root, kind):
+	rng = random.Random(size)
+	names, files, order, pinned = synthesize(size, root, kind)
+	manager._bookmarks.load(files, order, pinned)
+	paths = list(files.values())
+	manager._recent.setCapacity(history.clampCapacity(size))
+	manager._recent.load({path: float(i) for i, path in enumerate(paths[:manager._recent.capacity])})
+	for path in paths[:manager._frecency.capacity]:
+		for visit in range(rng.randint(1, 4)):
+			manager._frecency.visit(path)
+	manager.saveConfig()
+	manager.saveHistory()
+	persistence.service.flush()
+	return names, paths
+
+
+def makeRealPaths(root, kind):
+	folder = os.path.join(root, "real")
+	os.makedirs(folder, exist_ok=True)
+	paths = []
+	for i in range(REAL_PATHS):
+		path = os.path.join(folder, "real{}".format(i))
+		if kind == pathHealth.KIND_FILE:
+			with open(path + ".txt", "w") as f:
+				f.write("x")
+			path += ".txt"
+		else:
+			os.makedirs(path, exist_ok=True)
+		paths.append(path)
+	return paths
+
+
+def benchLoadSave(manager, names, repeat):
+	results = {"loadConfig": measure(lambda: manager.loadConfig(force=True), repeat)}
+	target = names[len(names) // 2]
+	original = manager._bookmarks.path(target)
+
+	def touchEntry():
+		moved = manager._bookmarks.path(target) == original
+		manager._bookmarks.add(target, original + ".moved" if moved else original)
+
+	def save():
+		manager.saveConfig()
+		persistence.service.flush(manager._store.path)
+
+	results["saveConfig"] = measure(save, repeat, touchEntry)
+	manager._bookmarks.add(target, original)
+	save()
+	return results
+
+
+def benchAddToRecent(manager, realPaths, repeat):
+	counter = iter(range(1 << 30))
+	result = measure(lambda: manager.addToRecent(realPaths[next(counter) % len(realPaths)]), repeat)
+	persistence.service.flush()
+	return result
+
+
+def benchAddSelected(manager, realPaths, repeat):
+	original = explorer.resolver
+	explorer.resolver = explorer.ExplorerResolver(explorer.FakeExplorerProvider({1: {"selection": realPaths}}))
+	manager._explorerWindow = 1
+
+	def forget():
+		manager.removeBookmarks([name for path in realPaths for name in manager._bookmarks.namesForPath(path)])
+
+	def addSelected():
+		# The selection arrives on the resolver worker; it is added here as the dialog
+		# adds it back on the GUI thread.
+		selected = queue.Queue()
+		manager.selectedInExplorer(selected.put)
+		manager.addBookmarks(selected.get())
+
+	try:
+		result = measure(addSelected, repeat, forget)
+	finally:
+		forget()
+		explorer.resolver.stop()
+		explorer.resolver = original
+		manager._explorerWindow = None
+	persistence.service.flush()
+	return result
+
+
+def benchDialog(dialog, manager, names, repeat):
+	results = {}
+
+	def invalidate():
+		manager._version += 1
+
+	dialog.tabs.ChangeSelection(0)
+	for mode in SORT_MODES:
+		manager._sortMode = mode
+		results["updateFiles[{}]".format(mode)] = measure(dialog.updateFiles, repeat, invalidate)
+	results["updateFiles[unchanged]"] = measure(dialog.updateFiles, repeat)
+	if hasattr(dialog, "_filterTypes"):
+		dialog.filterCombo.SetSelection(1)
+		results["updateFiles[filter]"] = measure(dialog.updateFiles, repeat, invalidate)
+		dialog.filterCombo.SetSelection(0)
+	# show indexes the search entries on a worker before the first keystroke.
+	manager._savedSearch.prepare()
+	dialog.searchField.ChangeValue("report 00")
+	results["updateFiles[search]"] = measure(dialog.updateFiles, repeat, invalidate)
+	dialog.searchField.ChangeValue("")
+	dialog.tabs.ChangeSelection(1)
+	results["updateFiles[recent]"] = measure(dialog.updateFiles, repeat, invalidate)
+	dialog.tabs.ChangeSelection(0)
+
+	manager._sortMode = "CUSTOM"
+	dialog.updateFiles()
+	unpinned = [name for name in manager._bookmarks if not manager._bookmarks.isPinned(name)]
+	target = unpinned[len(unpinned) // 2]
+	dialog.updateFiles(target)
+	directions = iter(range(1 << 30))
+	results["moveItem"] = measure(lambda: dialog.moveItem(target, 1 if next(directions) % 2 == 0 else -1), repeat)
+	results["moveItem[by 10]"] = measure(lambda: dialog.moveItem(target, 10 if next(directions) % 2 == 0 else -10), repeat)
+	bottom = manager._bookmarks.groupPosition(target)[1] - 1
+	middle = bottom // 2
+	results["moveItemTo[bottom]"] = measure(
+		lambda: dialog.moveItemTo(target, bottom), repeat, lambda: dialog.moveItemTo(target, middle)
+	)
+
+	def burst():
+		for press in range(10):
+			dialog.moveItem(target, 1 if press % 2 == 0 else -1)
+		fakeWx.fireTimers()
+		persistence.service.flush(manager._store.path)
+
+	results["moveBurst[10 presses]"] = measure(burst, repeat)
+	fakeWx.fireTimers()
+
+	selection = unpinned[::max(1, len(unpinned) // BULK_SIZE)][:BULK_SIZE]
+	pinStates = iter(range(1 << 30))
+	results["setPinned[bulk]"] = measure(lambda: dialog.onSetPinned(selection, next(pinStates) % 2 == 0), repeat)
+	dialog.onSetPinned(selection, False)
+	results["moveItems[bulk]"] = measure(lambda: dialog.moveItems(selection, 1 if next(directions) % 2 == 0 else -1), repeat)
+	fakeWx.fireTimers()
+	persistence.service.flush()
+	return results
+
+
+def benchAutoOpen(manager, paths, repeat):
+	marker = bootSession.BootMarker(startupRestore.bootMarkerPath(), uptime=lambda: 3600 * 1000)
+	manager._autoLoadLastFolder = True
+	manager.saveConfig()
+	manager._sessionStore.save({"folders": {path: i for i, path in enumerate(paths)}})
+
+	def sameBoot():
+		marker._answer = None
+
+	def newBoot():
+		marker._answer = None
+		marker._write(0.0, 0)
+
+	marker.isFirstStartOfBoot()
+	return {
+		"startupCheck[sameBoot]": measure(lambda: startupRestore.check(marker), repeat, sameBoot),
+		"startupCheck[newBoot]": measure(lambda: startupRestore.check(marker), repeat, newBoot)
+	}
+
+
+def runKind(kind, size, repeat, root):
+	realPaths = makeRealPaths(root, kind)
+	if kind == pathHealth.KIND_FILE:
+		manager = AbsoluteFile.AbsoluteFileManager()
+	else:
+		manager = AbsoluteFolder.AbsoluteFolderManager()
+	names, paths = populate(manager, size, root, kind)
+	manager.loadConfig(force=True)
+	results = benchLoadSave(manager, names, repeat)
+	results["addToRecent"] = benchAddToRecent(manager, realPaths, repeat)
+	results["addSelected"] = benchAddSelected(manager, realPaths, repeat)
+	if kind == pathHealth.KIND_FILE:
+		dialog = AbsoluteFile.AbsoluteFilesDialog(gui.mainFrame, manager)
+	else:
+		manager._lastOpenedFolders = paths[:20]
+		dialog = AbsoluteFolder.AbsoluteFoldersDialog(gui.mainFrame, manager)
+	results.update(benchDialog(dialog, manager, names, repeat))
+	dialog.Destroy()
+	if kind == pathHealth.KIND_FOLDER:
+		results.update(benchAutoOpen(manager, paths, repeat))
+	return results
+
+
+def benchEngine(size, repeat, root):
+	names, files, order, pinned = synthesize(size, root, pathHealth.KIND_FILE)
+	collection = bookmarks.BookmarkCollection()
+	results = {"load": measure(lambda: collection.load(files, order, pinned), repeat)}
+	tokens = iter(range(1 << 30))
+	score = {path: i % 97 for i, path in enumerate(files.values())}.get
+	for mode in SORT_MODES:
+		results["view[{}]".format(mode)] = measure(lambda: collection.view(mode, score, next(tokens)), repeat)
+	target = names[len(names) // 2]
+	results["togglePin"] = measure(lambda: collection.togglePin(target), repeat)
+	collection.setPinned(target, False)
+	directions = iter(range(1 << 30))
+	results["move"] = measure(lambda: collection.move(target, 1 if next(directions) % 2 == 0 else -1), repeat)
+	bottom = collection.groupPosition(target)[1] - 1
+	results["moveTo"] = measure(lambda: collection.moveTo(target, 0 if next(directions) % 2 == 0 else bottom), repeat)
+	renames = iter(range(1 << 30))
+	current = [target]
+
+	def rename():
+		newName = "{} renamed {}".format(target, next(renames))
+		collection.rename(current[0], newName)
+		current[0] = newName
+
+	results["rename"] = measure(rename, repeat)
+	results["remove+add"] = measure(lambda: collection.add(current[0], collection.remove(current[0]).path), repeat)
+	results["namesForPath"] = measure(lambda: collection.namesForPath(files[names[-1]]), repeat)
+	return results
+
+
+def benchSearch(size, repeat, root):
+	names, files, order, pinned = synthesize(size, root, pathHealth.KIND_FILE)
+	index = search.TrigramIndex()
+
+	def build():
+		index.rebuild((name, name, files[name]) for name in names)
+		index.prepare()
+
+	results = {"rebuild+prepare": measure(build, repeat)}
+	slowest = {"medianMs": 0.0, "minMs": 0.0}
+	for text in TYPED:
+		for end in range(1, len(text) + 1):
+			timing = measure(lambda: index.scored(text[:end], search.RESULT_LIMIT), repeat)
+			if timing["medianMs"] > slowest["medianMs"]:
+				slowest = dict(timing, query=text[:end])
+	results["slowestKeystroke"] = slowest
+	results["withinBudget"] = slowest["medianMs"] < KEYSTROKE_BUDGET_MS
+	return results
+
+
+def runSize(size, repeat):
+	root = tempfile.mkdtemp(prefix="AbsoluteFileAndFolder-bench-")
+	globalVars.appArgs.configPath = root
+	pathHealth.cache.invalidate()
+	return {
+		"bookmarks": benchEngine(size, repeat, root),
+		"search": benchSearch(size, repeat, root),
+		"files": runKind(pathHealth.KIND_FILE, size, repeat, root),
+		"folders": runKind(pathHealth.KIND_FOLDER, size, repeat, root)
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Headless timings of the manager and dialog hot paths.")
+	parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+	parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+	parser.add_argument("--output", help="write the JSON report here instead of stdout")
+	args = parser.parse_args()
+	sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+	# Keep the debounced writer and the health cache from acting in the middle of a timing.
+	persistence.service.windowMs = 3600 * 1000
+	pathHealth.cache.ttl = 3600.0
+	report = {
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"repeat": args.repeat,
+		"results": {str(size): runSize(size, args.repeat) for size in sizes}
+	}
+	keystrokes = benchSearch(SEARCH_SIZE, args.repeat, tempfile.mkdtemp(prefix="AbsoluteFileAndFolder-bench-"))
+	report["keystrokesAt{}".format(SEARCH_SIZE)] = keystrokes
+	persistence.service.stop()
+	pathHealth.cache.shutdown()
+	text = json.dumps(report, indent="\t")
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as f:
+			f.write(text + "\n")
+	else:
+		sys.stdout.write(text + "\n")
+	if not keystrokes["withinBudget"]:
+		sys.exit("A keystroke took {medianMs} ms at {size} entries ({query!r}), over the {budget} ms budget.".format(
+			size=SEARCH_SIZE, budget=KEYSTROKE_BUDGET_MS, **keystrokes["slowestKeystroke"]
+		))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,93 @@
+# importTime.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Measures what loading the add-on costs NVDA at startup: importing the plugin package
+# and constructing GlobalPlugin, in a fresh interpreter each run, then the callbacks it
+# defers with core.callLater (the restore check NVDA runs three seconds later).
+#   startup - the add-on as shipped; modules load on first use
+#   eager   - every add-on module imported up front, as before lazy loading
+# Prints a JSON report with the median times per mode and the modules each one loaded;
+# fails if the deferred check of the shipped add-on loads the managers or dialogs.
+#   python benchmarks/importTime.py [--runs N]
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+EAGER_MODULES = [
+	"AbsoluteFile", "AbsoluteFolder", "dialogPool", "explorer", "palette",
+	"pathHealth", "persistence", "prefetch", "restore", "session"
+]
+# Modules the startup check must leave unloaded.
+DIALOG_MODULES = ["AbsoluteFile", "AbsoluteFolder", "bookmarkDialog", "bookmarkManager", "dialogPool"]
+
+
+def child(mode):
+	import time
+	import importlib
+	sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+	import nvdaStubs
+	nvdaStubs.install()
+	deferred = []
+	sys.modules["core"].callLater = lambda delay, callback, *args, **kwargs: deferred.append((callback, args, kwargs))
+	started = time.perf_counter()
+	package = importlib.import_module(nvdaStubs.PACKAGE)
+	if mode == "eager":
+		for name in EAGER_MODULES:
+			importlib.import_module(f"{nvdaStubs.PACKAGE}.{name}")
+	plugin = package.GlobalPlugin()
+	elapsed = (time.perf_counter() - started) * 1000
+	modules = nvdaStubs.addonModules()
+	started = time.perf_counter()
+	for callback, args, kwargs in deferred:
+		callback(*args, **kwargs)
+	deferredMs = (time.perf_counter() - started) * 1000
+	deferredModules = nvdaStubs.addonModules()
+	plugin.terminate()
+	print(json.dumps({"ms": elapsed, "modules": modules, "deferredMs": deferredMs, "deferredModules": deferredModules}))
+
+
+def run(mode, runs):
+	times = []
+	deferredTimes = []
+	for i in range(runs):
+		output = subprocess.run(
+			[sys.executable, "-X", "utf8", os.path.abspath(__file__), "--child", mode],
+			check=True, capture_output=True, text=True
+		).stdout
+		result = json.loads(output.strip().splitlines()[-1])
+		times.append(result["ms"])
+		deferredTimes.append(result["deferredMs"])
+	return {
+		"medianMs": round(statistics.median(times), 3),
+		"deferredMedianMs": round(statistics.median(deferredTimes), 3),
+		"runs": runs,
+		"modules": result["modules"],
+		"deferredModules": result["deferredModules"]
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument("--runs", type=int, default=15)
+	parser.add_argument("--child", choices=("startup", "eager"))
+	args = parser.parse_args()
+	if args.child:
+		child(args.child)
+		return
+	report = {mode: run(mode, args.runs) for mode in ("startup", "eager")}
+	report["reductionPercent"] = round(
+		100 * (1 - report["startup"]["medianMs"] / report["eager"]["medianMs"]), 1
+	)
+	print(json.dumps(report, indent="\t"))
+	loaded = sorted(set(report["startup"]["deferredModules"]) & set(DIALOG_MODULES))
+	if loaded:
+		sys.exit(f"The startup check loaded {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+	main()
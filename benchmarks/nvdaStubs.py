@@ -0,0 +1,88 @@
+# nvdaStubs.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# Minimal stand-ins for the NVDA modules the add-on imports, plus fakeWx as "wx", so its
+# managers and dialogs can be loaded and timed outside NVDA. Nothing here draws a window
+# or talks to COM; message boxes answer yes.
+
+import os
+import sys
+import types
+import builtins
+import logging
+import tempfile
+
+BENCHMARK_ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addon", "globalPlugins")
+PACKAGE = "AbsoluteFileAndFolder"
+
+
+def _module(name, **attrs):
+	module = types.ModuleType(name)
+	module.__dict__.update(attrs)
+	sys.modules[name] = module
+	return module
+
+
+def _noop(*args, **kwargs):
+	return None
+
+
+def install(configPath=None):
+	if configPath is None:
+		configPath = tempfile.mkdtemp(prefix="AbsoluteFileAndFolder-bench-")
+	builtins._ = lambda s: s
+	builtins.ngettext = lambda singular, plural, n: singular if n == 1 else plural
+	builtins.pgettext = lambda context, s: s
+
+	if BENCHMARK_ROOT not in sys.path:
+		sys.path.insert(0, BENCHMARK_ROOT)
+	import fakeWx
+	sys.modules["wx"] = fakeWx
+
+	log = logging.getLogger("nvda")
+	log.debugWarning = log.warning
+	_module("logHandler", log=log)
+	_module("addonHandler", initTranslation=_noop)
+	_module("globalVars", appArgs=types.SimpleNamespace(configPath=configPath))
+	_module("core", callLater=_noop)
+	_module("ui", message=_noop, browseableMessage=_noop)
+	_module("api", getForegroundObject=_noop, getFocusObject=_noop, copyToClip=_noop)
+
+	class MainFrame(fakeWx.Frame):
+		def prePopup(self):
+			pass
+
+		def postPopup(self):
+			pass
+
+	_module("gui", mainFrame=MainFrame(), messageBox=lambda *args, **kwargs: fakeWx.YES)
+
+	class GlobalPlugin:
+		def __init__(self):
+			pass
+
+		def terminate(self):
+			pass
+
+	_module("globalPluginHandler", GlobalPlugin=GlobalPlugin)
+
+	def script(**kwargs):
+		return lambda func: func
+
+	_module("scriptHandler", script=script, getLastScriptRepeatCount=lambda: 0)
+
+	comtypes = _module("comtypes", CoInitialize=_noop, CoUninitialize=_noop)
+	comtypes.client = _module("comtypes.client", CreateObject=_noop)
+
+	if PACKAGE_ROOT not in sys.path:
+		sys.path.insert(0, PACKAGE_ROOT)
+	return configPath
+
+
+def addonModules():
+	return sorted(
+		name[len(PACKAGE) + 1:] for name in sys.modules
+		if name.startswith(PACKAGE + ".")
+	)
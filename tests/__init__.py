@@ -0,0 +1,28 @@
+# __init__.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+# The tests run the add-on outside NVDA on the stand-ins the benchmarks use.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import nvdaStubs  # noqa: E402
+
+nvdaStubs.install()
+
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import unittest  # noqa: E402
+import globalVars  # noqa: E402
+
+
+# Points the NVDA config path at a fresh folder for each test, so every manager starts empty.
+class ConfigTestCase(unittest.TestCase):
+	def setUp(self):
+		self.configPath = tempfile.mkdtemp(prefix="AbsoluteFileAndFolder-test-")
+		self.addCleanup(shutil.rmtree, self.configPath, True)
+		self.addCleanup(setattr, globalVars.appArgs, "configPath", globalVars.appArgs.configPath)
+		globalVars.appArgs.configPath = self.configPath
@@ -0,0 +1,87 @@
+# test_bookmarkManager.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import unittest
+from unittest import mock
+import fakeWx
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import AbsoluteFile
+from AbsoluteFileAndFolder import AbsoluteFolder
+from AbsoluteFileAndFolder import persistence
+
+
+class BookmarkManagerTest(ConfigTestCase):
+	def makeManager(self, count):
+		manager = AbsoluteFile.AbsoluteFileManager()
+		for i in range(count):
+			manager.addBookmark("file{}".format(i), os.path.join(self.configPath, "file{}.txt".format(i)))
+		persistence.service.flush(manager._store.path)
+		return manager
+
+	def test_removeBookmarksSavesOnlyWhatWasRemoved(self):
+		manager = self.makeManager(3)
+		self.assertEqual(manager.removeBookmarks(["gone", "missing"]), [])
+		self.assertFalse(persistence.service.isPending(manager._store.path))
+		self.assertEqual(manager.removeBookmarks(["file1", "gone", "file1"]), ["file1"])
+		self.assertTrue(persistence.service.isPending(manager._store.path))
+		self.assertNotIn("file1", manager._savedSearch.search("file1"))
+		persistence.service.flush(manager._store.path)
+		self.assertEqual(manager._store.load()["order"], ["file0", "file2"])
+
+	def test_addBookmarksNumbersNamesAndSkipsSavedPaths(self):
+		manager = self.makeManager(2)
+		saved = manager._bookmarks.path("file0")
+		other = os.path.join(self.configPath, "other", "file0.txt")
+		paths = [saved, other, other, os.path.join(self.configPath, "new.txt"), ""]
+		with mock.patch.object(manager, "saveConfig", wraps=manager.saveConfig) as saveConfig:
+			added = manager.addBookmarks(paths)
+			self.assertEqual(added, ["file0.txt", "new.txt"])
+			self.assertEqual(saveConfig.call_count, 1)
+			self.assertEqual(manager.addBookmarks([other, saved]), [])
+			self.assertEqual(saveConfig.call_count, 1)
+			self.assertEqual(manager.addBookmarks([os.path.join(self.configPath, "more", "file0.txt")]), ["file0.txt (2)"])
+		self.assertEqual(manager._bookmarks.path("file0.txt"), other)
+		self.assertEqual(manager._savedSearch.search("new.txt")[0], "new.txt")
+
+	def test_loadQueuesTheSearchIndexes(self):
+		self.makeManager(3)
+		manager = AbsoluteFile.AbsoluteFileManager()
+		manager.loadConfig(force=True)
+		self.assertFalse(manager._savedSearch.isPrepared())
+		self.assertEqual(len(manager._savedSearch), 3)
+		# The first search indexes what the load queued.
+		self.assertEqual(manager._savedSearch.search("file2"), ["file2"])
+		self.assertTrue(manager._savedSearch.isPrepared())
+		manager.loadConfig(force=True)
+		with mock.patch("threading.Thread") as thread:
+			manager.prepareSearch()
+		thread.return_value.start.assert_called_once_with()
+		thread.call_args.kwargs["target"]()
+		self.assertTrue(manager._savedSearch.isPrepared())
+		self.assertTrue(manager._recentSearch.isPrepared())
+
+
+class FolderManagerTest(ConfigTestCase):
+	def test_cancelOpeningStopsBulkOpens(self):
+		manager = AbsoluteFolder.AbsoluteFolderManager()
+		paths = [os.path.join(self.configPath, "folder{}".format(i)) for i in range(3)]
+		for path in paths:
+			os.mkdir(path)
+		opened = []
+		with mock.patch.object(os, "startfile", opened.append, create=True):
+			pipeline = manager.openFolders(paths)
+			self.assertIn(pipeline, manager._openPipelines)
+			manager.cancelOpening()
+			# Folders are opened on the GUI thread, which the test stands in for here.
+			while pipeline.report is None:
+				fakeWx.runPending()
+				pipeline.wait(0.01)
+		self.assertEqual(pipeline.action, "Opened")
+		self.assertTrue(pipeline.report["cancelled"])
+		self.assertLess(len(opened), len(paths))
+		self.assertEqual(manager._openPipelines, set())
+
+if __name__ == "__main__":
+	unittest.main()
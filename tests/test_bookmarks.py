@@ -0,0 +1,93 @@
+# test_bookmarks.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import unittest
+from AbsoluteFileAndFolder import bookmarks
+
+
+class BookmarkCollectionTest(unittest.TestCase):
+	def makeCollection(self):
+		collection = bookmarks.BookmarkCollection()
+		collection.load(
+			{"a": "/docs/a.txt", "b": "/docs/b.txt", "c": "/docs/c.txt", "d": "/docs/d.txt"},
+			["c", "a", "b", "d"],
+			["b"]
+		)
+		return collection
+
+	def test_loadNormalisesOrder(self):
+		collection = bookmarks.BookmarkCollection()
+		files = {"a": "/a", "b": "/b", "c": "/c", "d": "/d"}
+		collection.load(files, ["c", "gone", "a", "c", "d"], ["d", "gone"])
+		# Unknown and repeated names are dropped, missing ones go last and pinned ones first.
+		self.assertEqual(list(collection), ["d", "c", "a", "b"])
+		self.assertEqual(collection.dump(), {"files": files, "order": ["d", "c", "a", "b"], "pinned": ["d"]})
+		self.assertTrue(collection.isPinned("d"))
+		self.assertFalse(collection.isPinned("gone"))
+		self.assertEqual([collection.index(name) for name in "dcab"], [0, 1, 2, 3])
+
+	def test_loadWithoutOrder(self):
+		collection = bookmarks.BookmarkCollection()
+		collection.load({"x": "/x", "y": "/y"})
+		self.assertEqual(list(collection), ["x", "y"])
+		collection.load({}, ["x"])
+		self.assertEqual(len(collection), 0)
+		self.assertFalse(collection.hasPath("/x"))
+
+	def test_renameKeepsIndexes(self):
+		collection = self.makeCollection()
+		collection.add("a2", "/docs/./a.txt")
+		collection.rename("a", "renamed")
+		self.assertNotIn("a", collection)
+		self.assertEqual(collection.path("renamed"), "/docs/a.txt")
+		self.assertEqual(collection.index("renamed"), 2)
+		self.assertEqual(list(collection), ["b", "c", "renamed", "d", "a2"])
+		self.assertEqual(collection.namesForPath("/docs/a.txt"), ["renamed", "a2"])
+		collection.rename("b", "pinned")
+		self.assertTrue(collection.isPinned("pinned"))
+		self.assertEqual(collection.index("pinned"), 0)
+		with self.assertRaises(ValueError):
+			collection.rename("c", "d")
+		self.assertEqual(collection.path("c"), "/docs/c.txt")
+		self.assertEqual(list(collection), ["pinned", "c", "renamed", "d", "a2"])
+
+	def test_removeKeepsIndexes(self):
+		collection = self.makeCollection()
+		collection.add("b2", "/docs/b.txt")
+		entry = collection.remove("b")
+		self.assertEqual(entry.path, "/docs/b.txt")
+		self.assertIsNone(collection.remove("b"))
+		self.assertTrue(collection.hasPath("/docs/b.txt"))
+		self.assertEqual(collection.namesForPath("/docs/b.txt"), ["b2"])
+		collection.remove("b2")
+		self.assertFalse(collection.hasPath("/docs/b.txt"))
+		self.assertEqual(collection.namesForPath("/docs/b.txt"), [])
+		self.assertEqual(list(collection), ["c", "a", "d"])
+		self.assertEqual([collection.index(name) for name in ("c", "a", "d")], [0, 1, 2])
+		self.assertEqual(collection.dump()["pinned"], [])
+
+	def test_viewIsCached(self):
+		collection = self.makeCollection()
+		names, positions = collection.view(bookmarks.SORT_DESCENDING, token=1)
+		self.assertEqual(names, ["b", "d", "c", "a"])
+		self.assertEqual(positions, {"b": 0, "d": 1, "c": 2, "a": 3})
+		self.assertIs(collection.view(bookmarks.SORT_DESCENDING, token=1)[0], names)
+		# A change to the data, the sort mode or the token builds a new view.
+		self.assertIsNot(collection.view(bookmarks.SORT_DESCENDING, token=2)[0], names)
+		custom = collection.view(bookmarks.SORT_CUSTOM, token=2)[0]
+		self.assertEqual(custom, ["b", "c", "a", "d"])
+		self.assertIs(collection.view(bookmarks.SORT_CUSTOM, token=2)[0], custom)
+		collection.move("c", 1)
+		self.assertEqual(collection.view(bookmarks.SORT_CUSTOM, token=2)[0], ["b", "a", "c", "d"])
+
+	def test_frecencyView(self):
+		collection = self.makeCollection()
+		scores = {"/docs/d.txt": 5.0, "/docs/a.txt": 1.0}
+		names = collection.view(bookmarks.SORT_FRECENCY, lambda path: scores.get(path, 0.0), token=0)[0]
+		self.assertEqual(names, ["b", "d", "a", "c"])
+
+	def test_uniqueName(self):
+		self.assertEqual(bookmarks.uniqueName("a.txt", {}), "a.txt")
+		self.assertEqual(bookmarks.uniqueName("a.txt", {"a.txt"}), "a.txt (2)")
+		self.assertEqual(bookmarks.uniqueName("a.txt", {"a.txt", "a.txt (2)", "a.txt (4)"}), "a.txt (3)")
@@ -0,0 +1,103 @@
+# test_bootSession.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import json
+import unittest
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import bootSession
+
+HOUR_MS = 3600 * 1000
+
+
+class BootMarkerTest(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.path = os.path.join(self.configPath, "BootSession.json")
+		self.now = 1000000.0
+		self.uptimeMs = HOUR_MS
+
+	def start(self, legacyUptimeMs=0):
+		marker = bootSession.BootMarker(self.path, tolerance=120.0, uptime=lambda: self.uptimeMs, clock=lambda: self.now)
+		return marker.isFirstStartOfBoot(legacyUptimeMs)
+
+	# Lets time pass in the same boot, with the wall clock off by drift seconds.
+	def elapse(self, seconds, drift=0.0):
+		self.uptimeMs += seconds * 1000
+		self.now += seconds + drift
+
+	def reboot(self, downSeconds, uptimeSeconds):
+		self.now += downSeconds + uptimeSeconds
+		self.uptimeMs = uptimeSeconds * 1000
+
+	def marker(self):
+		with open(self.path, encoding="utf-8") as f:
+			return json.load(f)
+
+	def test_firstInstallIsNotANewBoot(self):
+		self.assertFalse(self.start())
+		self.assertEqual(self.marker(), {"bootTime": self.now - 3600, "uptime": HOUR_MS})
+
+	def test_restartInTheSameBootWritesNothing(self):
+		self.start()
+		written = os.stat(self.path).st_mtime_ns
+		self.elapse(600, drift=30)
+		self.assertFalse(self.start())
+		self.assertEqual(os.stat(self.path).st_mtime_ns, written)
+		self.assertEqual(self.marker()["uptime"], HOUR_MS)
+
+	def test_reboot(self):
+		self.start()
+		self.reboot(60, 300)
+		self.assertTrue(self.start())
+		self.assertEqual(self.marker()["uptime"], 300 * 1000)
+		self.elapse(60)
+		self.assertFalse(self.start())
+
+	def test_lowerUptimeIsANewBootEvenWithinTheTolerance(self):
+		self.start()
+		# The boot time estimate lands within the tolerance, but the uptime went back.
+		self.now += 60
+		self.uptimeMs -= 60 * 1000
+		self.assertTrue(self.start())
+
+	def test_slowDriftIsFollowed(self):
+		self.start()
+		for i in range(20):
+			# Seventy seconds of drift between restarts: off by far more than the tolerance in total.
+			self.elapse(86400, drift=70)
+			self.assertFalse(self.start())
+		self.assertEqual(self.marker()["bootTime"], self.now - self.uptimeMs / 1000.0)
+
+	def test_largeClockJumpIsANewBoot(self):
+		self.start()
+		self.elapse(600, drift=300)
+		self.assertTrue(self.start())
+
+	def test_markerWithoutUptime(self):
+		with open(self.path, "w", encoding="utf-8") as f:
+			json.dump({"bootTime": self.now - 3600}, f)
+		self.assertFalse(self.start())
+		self.reboot(60, 600)
+		self.assertTrue(self.start())
+
+	def test_legacyUptimeWithoutMarker(self):
+		self.assertTrue(self.start(legacyUptimeMs=2 * HOUR_MS))
+		os.remove(self.path)
+		self.assertFalse(self.start(legacyUptimeMs=HOUR_MS // 2))
+
+	def test_noUptimeIsNeverANewBoot(self):
+		self.uptimeMs = 0
+		self.assertFalse(self.start())
+		self.assertFalse(os.path.exists(self.path))
+
+	def test_answerIsKeptForTheSession(self):
+		marker = bootSession.BootMarker(self.path, uptime=lambda: self.uptimeMs, clock=lambda: self.now)
+		self.assertFalse(marker.isFirstStartOfBoot())
+		self.reboot(60, 300)
+		self.assertFalse(marker.isFirstStartOfBoot())
+
+
+if __name__ == "__main__":
+	unittest.main()
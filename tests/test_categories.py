@@ -0,0 +1,74 @@
+# test_categories.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import unittest
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import AbsoluteFile
+from AbsoluteFileAndFolder import categories
+from AbsoluteFileAndFolder import persistence
+
+
+class NormalizeRegistryTest(unittest.TestCase):
+	def test_validRegistryIsKept(self):
+		registry = [{"label": "Logs", "rules": [".log", "*.log.1"]}]
+		self.assertEqual(categories.normalizeRegistry(registry), registry)
+
+	def test_invalidEntriesAreDropped(self):
+		registry = [
+			"Audio",
+			{"label": 3, "rules": [".mp3"]},
+			{"label": "  ", "rules": [".mp3"]},
+			{"label": "Video", "rules": ".mp4"},
+			{"rules": [".pdf"]},
+			{"label": " Logs ", "rules": [".log", 7, None, " *.tmp ", ""]},
+			{"label": "Logs", "rules": [".txt"]},
+			{"label": "Empty"}
+		]
+		self.assertEqual(categories.normalizeRegistry(registry), [
+			{"label": "Logs", "rules": [".log", "*.tmp"]},
+			{"label": "Empty", "rules": []}
+		])
+
+	def test_fallsBackToTheDefaults(self):
+		for registry in (None, "Audio", {"label": "Audio"}, [], [None, {"label": ""}]):
+			self.assertEqual(categories.normalizeRegistry(registry), categories.defaultRegistry())
+
+	def test_bareWordsAreExtensions(self):
+		registry = categories.normalizeRegistry([{"label": "Archives", "rules": ["zip", " 7Z ", ".rar", "*.tar.*"]}])
+		self.assertEqual(registry, [{"label": "Archives", "rules": [".zip", ".7Z", ".rar", "*.tar.*"]}])
+		matcher = categories.CategoryMatcher([{"label": "Archives", "rules": ["zip", "7z"]}])
+		self.assertEqual(matcher.classify(r"C:\downloads\photos.zip"), "Archives")
+		self.assertEqual(matcher.classify(r"C:\downloads\setup.7Z"), "Archives")
+		self.assertIsNone(matcher.classify(r"C:\downloads\zip"))
+
+	def test_normalizedRegistryBuildsAMatcher(self):
+		registry = categories.normalizeRegistry([{"label": "Logs", "rules": [".log", 1]}, {"label": None}])
+		matcher = categories.CategoryMatcher(registry)
+		self.assertEqual(matcher.labels, ["Logs"])
+		self.assertEqual(matcher.classify(r"C:\app\run.log"), "Logs")
+
+
+class StoredRegistryTest(ConfigTestCase):
+	def test_brokenStoredRegistryLoadsAndSaves(self):
+		manager = AbsoluteFile.AbsoluteFileManager()
+		manager._store.save({
+			"files": {"run": r"C:\app\run.log"},
+			"categories": [{"label": "Logs", "rules": [".log", 5]}, {"label": ["bad"]}, "junk"]
+		})
+		manager.loadConfig(force=True)
+		self.assertEqual(manager._categories, [{"label": "Logs", "rules": [".log"]}])
+		self.assertEqual(manager._savedIndex.members("Logs"), {"run"})
+		manager.saveConfig()
+		persistence.service.flush(manager._store.path)
+		self.assertEqual(manager._store.load()["categories"], [{"label": "Logs", "rules": [".log"]}])
+
+	def test_unusableStoredRegistryFallsBackToTheDefaults(self):
+		manager = AbsoluteFile.AbsoluteFileManager()
+		manager._store.save({"files": {}, "categories": "Audio"})
+		manager.loadConfig(force=True)
+		self.assertEqual(manager._categories, categories.defaultRegistry())
+
+
+if __name__ == "__main__":
+	unittest.main()
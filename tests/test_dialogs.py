@@ -0,0 +1,217 @@
+# test_dialogs.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import time
+import threading
+import unittest
+from unittest import mock
+import fakeWx
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import AbsoluteFile
+from AbsoluteFileAndFolder import AbsoluteFolder
+from AbsoluteFileAndFolder import bookmarkDialog
+from AbsoluteFileAndFolder import bookmarks
+from AbsoluteFileAndFolder import dialogPool
+from AbsoluteFileAndFolder import explorer
+from AbsoluteFileAndFolder import pathHealth
+from AbsoluteFileAndFolder import persistence
+
+
+class DialogTestCase(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.addCleanup(dialogPool.pool.destroyAll)
+
+	def showFiles(self, count):
+		manager = AbsoluteFile.AbsoluteFileManager()
+		for i in range(count):
+			manager._bookmarks.add("file{}".format(i), os.path.join(self.configPath, "file{}.txt".format(i)))
+		manager._sortMode = bookmarks.SORT_CUSTOM
+		manager.show({"file": None, "folder": None, "hwnd": None})
+		return manager
+
+	def showFolders(self, count):
+		manager = AbsoluteFolder.AbsoluteFolderManager()
+		for i in range(count):
+			manager._bookmarks.add("folder{}".format(i), os.path.join(self.configPath, "folder{}".format(i)))
+		manager._sortMode = bookmarks.SORT_CUSTOM
+		manager.show({"file": None, "folder": None, "hwnd": None})
+		return manager
+
+
+class DialogPoolTest(DialogTestCase):
+	def test_showingAgainReusesOneDialogPerKind(self):
+		managers = (AbsoluteFile.AbsoluteFileManager(), AbsoluteFolder.AbsoluteFolderManager())
+		dialogs = []
+		for i in range(5):
+			for manager in managers:
+				manager.show({"file": None, "folder": None, "hwnd": None})
+				self.assertTrue(manager.dialog.IsShown())
+				manager.dialog.Close()
+				self.assertFalse(manager.dialog.IsShown())
+				dialogs.append(manager.dialog)
+			self.assertEqual(dialogPool.pool.liveWindowCount(), 2)
+		self.assertEqual(len(set(map(id, dialogs))), 2)
+		dialogPool.pool.destroyAll()
+		self.assertEqual(dialogPool.pool.liveWindowCount(), 0)
+
+	def test_showingAgainResetsTheControls(self):
+		for manager in (AbsoluteFile.AbsoluteFileManager(), AbsoluteFolder.AbsoluteFolderManager()):
+			manager.show({"file": None, "folder": None, "hwnd": None})
+			dialog = manager.dialog
+			self.assertEqual(dialog.sortCombo.GetSelection(), bookmarks.SORT_MODES.index(bookmarks.SORT_ASCENDING))
+			dialog.searchField.ChangeValue("report")
+			dialog.tabs.ChangeSelection(1)
+			dialog.Close()
+			manager._sortMode = bookmarks.SORT_FRECENCY
+			manager.show({"file": None, "folder": None, "hwnd": None})
+			self.assertIs(manager.dialog, dialog)
+			self.assertEqual(dialog.sortCombo.GetSelection(), bookmarks.SORT_MODES.index(bookmarks.SORT_FRECENCY))
+			self.assertEqual(dialog.searchField.GetValue(), "")
+			self.assertEqual(dialog.tabs.GetSelection(), 0)
+
+	def test_dialogsMustImplementTheAbstractMethods(self):
+		class Incomplete(bookmarkDialog.BookmarkDialog):
+			def _initUI(self):
+				pass
+
+		with self.assertRaises(TypeError):
+			Incomplete(None, AbsoluteFile.AbsoluteFileManager())
+
+
+class PendingMovesTest(DialogTestCase):
+	def assertFlushSaves(self, manager, name):
+		persistence.service.flush(manager._store.path)
+		manager.dialog.moveItems([name], 1)
+		self.assertFalse(persistence.service.isPending(manager._store.path))
+		dialogPool.pool.flush()
+		self.assertTrue(persistence.service.isPending(manager._store.path))
+		persistence.service.flush(manager._store.path)
+		self.assertEqual(manager._store.load()["order"][:2], [name.replace("0", "1"), name])
+
+	def test_poolFlushSavesPendingMoves(self):
+		self.assertFlushSaves(self.showFiles(3), "file0")
+		self.assertFlushSaves(self.showFolders(3), "folder0")
+
+	def test_closeSavesPendingMoves(self):
+		manager = self.showFiles(3)
+		manager.dialog.moveItems(["file0"], 1)
+		manager.dialog.Close()
+		self.assertTrue(persistence.service.isPending(manager._store.path))
+		persistence.service.flush(manager._store.path)
+		self.assertEqual(manager._store.load()["order"][:2], ["file1", "file0"])
+
+
+class HealthTest(DialogTestCase):
+	def test_statusIsLookedUpForDrawnRows(self):
+		looked = []
+		state = pathHealth.cache.state
+		self.addCleanup(vars(pathHealth.cache).pop, "state")
+		pathHealth.cache.state = lambda path, kind: looked.append(path) or state(path, kind)
+		manager = self.showFiles(50)
+		dialog = manager.dialog
+		rows = dialog.savedModel.rows
+		self.assertEqual(len(rows), 50)
+		self.assertEqual(looked, [])
+		pathHealth.cache.verify(manager._bookmarks.path("file3"), pathHealth.KIND_FILE)
+		self.assertEqual(dialog.listSaved.GetItemText(3, 2), pathHealth.describe(pathHealth.MISSING))
+		self.assertEqual(looked, [manager._bookmarks.path("file3")])
+		# A burst of health changes redraws the rows on screen once and keeps the rows.
+		dialog.listSaved.refreshed.clear()
+		dialog._onHealthChanged()
+		dialog._onHealthChanged()
+		fakeWx.runPending()
+		self.assertIs(dialog.savedModel.rows, rows)
+		self.assertEqual(dialog.listSaved.refreshed, [(0, fakeWx.LIST_PAGE_SIZE)])
+
+	def test_destroyStopsHealthUpdates(self):
+		dialog = self.showFolders(1).dialog
+		self.assertIn(dialog._onHealthChanged, pathHealth.cache._listeners)
+		dialogPool.pool.destroyAll()
+		self.assertNotIn(dialog._onHealthChanged, pathHealth.cache._listeners)
+
+
+class OpenTest(DialogTestCase):
+	def test_fileThatFailsToOpenCountsAsUnavailable(self):
+		manager = self.showFiles(3)
+		paths = [manager._bookmarks.path("file{}".format(i)) for i in range(3)]
+		for path in paths:
+			open(path, "w").close()
+
+		def startfile(path):
+			if path == paths[1]:
+				raise OSError("No application is associated with the file")
+
+		dialog = manager.dialog
+		for i in range(3):
+			dialog.listSaved.Select(i)
+		with mock.patch.object(os, "startfile", startfile, create=True), mock.patch("ui.message") as message:
+			dialog.onOpen(None)
+		message.assert_called_once_with(dialog.messages["someUnavailable"].format(1, 3))
+		self.assertEqual(sorted(manager._recent), sorted([paths[0], paths[2]]))
+		self.assertFalse(dialog.IsShown())
+
+	def test_unansweredChecksShareOneTimeout(self):
+		manager = self.showFolders(6)
+		paths = [manager._bookmarks.path("folder{}".format(i)) for i in range(6)]
+		os.mkdir(paths[0])
+		hung = threading.Event()
+		self.addCleanup(hung.set)
+
+		def probe(path, kind):
+			if path != paths[0]:
+				# An offline share: the stat does not answer.
+				hung.wait(5)
+			return pathHealth.probe(path, kind)
+
+		cache = pathHealth.PathHealthCache(timeout=0.3, workers=len(paths), probe=probe)
+		self.addCleanup(cache.shutdown)
+		dialog = manager.dialog
+		for i in range(len(paths)):
+			dialog.listSaved.Select(i)
+		started = time.monotonic()
+		with mock.patch.object(pathHealth, "cache", cache), mock.patch.object(dialog, "_open", return_value=[paths[0]]) as opener, mock.patch("ui.message") as message:
+			dialog.onOpen(None)
+		# Five hung checks cost one timeout, not five.
+		self.assertLess(time.monotonic() - started, 1.0)
+		unavailable = opener.call_args[0][1]
+		opener.assert_called_once_with([paths[0]], unavailable)
+		self.assertEqual(unavailable, [(path, pathHealth.UNREACHABLE) for path in paths[1:]])
+		message.assert_called_once_with(dialog.messages["someUnavailable"].format(5, 6))
+
+
+class AddSelectedTest(DialogTestCase):
+	def setUp(self):
+		super().setUp()
+		self.addCleanup(setattr, explorer, "resolver", explorer.resolver)
+
+	def test_selectionIsAddedWithoutBlocking(self):
+		paths = [os.path.join(self.configPath, "file{}.txt".format(i)) for i in range(3)]
+		for path in paths:
+			open(path, "w").close()
+		provider = explorer.FakeExplorerProvider({1: {"selection": paths + [self.configPath]}}, delay=0.2)
+		explorer.resolver = explorer.ExplorerResolver(provider)
+		self.addCleanup(explorer.resolver.stop)
+		manager = AbsoluteFile.AbsoluteFileManager()
+		manager._bookmarks.add("saved", paths[0])
+		manager.show({"file": None, "folder": None, "hwnd": 1})
+		dialog = manager.dialog
+		started = time.monotonic()
+		with mock.patch("ui.message") as message:
+			dialog.onAddSelected(None)
+			# A second press while the first read runs is ignored.
+			dialog.onAddSelected(None)
+			self.assertLess(time.monotonic() - started, 0.15)
+			self.assertEqual(len(manager._bookmarks), 1)
+			explorer.resolver.selection(1)
+			fakeWx.runPending()
+		message.assert_called_once_with(dialog.messages["addedSkipped"].format(2, 1))
+		self.assertEqual(list(manager._bookmarks), ["saved", "file1.txt", "file2.txt"])
+		self.assertEqual(dialog.listSaved.selectedKeys(), ["file1.txt"])
+		self.assertFalse(dialog._selectionPending)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,140 @@
+# test_explorer.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import sys
+import time
+import queue
+import unittest
+from AbsoluteFileAndFolder import explorer
+
+WINDOWS = {
+	1: {"file": r"C:\docs\a.txt", "folder": r"C:\docs", "selection": [r"C:\docs\a.txt", r"C:\docs\b.txt"]},
+	2: {"file": None, "folder": r"D:\music", "selection": []}
+}
+
+
+class FakeShell:
+	def __init__(self, windows):
+		self.windows = windows
+		self.fail = False
+
+	def Windows(self):
+		if self.fail:
+			raise OSError("Explorer restarted")
+		return self.windows
+
+
+class FakeWindow:
+	def __init__(self, hwnd):
+		self.hwnd = hwnd
+
+
+class ProviderTest(unittest.TestCase):
+	def test_providerIsAbstract(self):
+		with self.assertRaises(TypeError):
+			explorer.ExplorerProvider()
+
+	def test_fakeWindowSelection(self):
+		provider = explorer.FakeExplorerProvider(WINDOWS)
+		self.assertEqual(provider.windowSelection(WINDOWS[1]), [r"C:\docs\a.txt", r"C:\docs\b.txt"])
+		self.assertEqual(provider.windowSelection({"folder": r"C:\docs"}), [])
+		self.assertIsNone(provider.windowSelection(WINDOWS[1], time.monotonic() - 1))
+		self.assertEqual(provider.windowPaths(WINDOWS[1]), {"file": r"C:\docs\a.txt", "folder": r"C:\docs"})
+
+	def test_shellIsCachedAndRecreatedAfterFailure(self):
+		client = sys.modules["comtypes.client"]
+		shells = []
+
+		def createObject(progId):
+			shells.append(FakeShell([FakeWindow(1), FakeWindow(2)]))
+			return shells[-1]
+
+		original = client.CreateObject
+		client.CreateObject = createObject
+		try:
+			provider = explorer.ShellExplorerProvider()
+			self.assertEqual([hwnd for hwnd, window in provider.windows()], [1, 2])
+			self.assertEqual([hwnd for hwnd, window in provider.windows()], [1, 2])
+			self.assertEqual(len(shells), 1)
+			shells[0].fail = True
+			with self.assertRaises(OSError):
+				list(provider.windows())
+			self.assertEqual([hwnd for hwnd, window in provider.windows()], [1, 2])
+			self.assertEqual(len(shells), 2)
+		finally:
+			client.CreateObject = original
+
+
+class ResolverTest(unittest.TestCase):
+	def setUp(self):
+		self.provider = explorer.FakeExplorerProvider(WINDOWS)
+		self.resolver = explorer.ExplorerResolver(self.provider, timeoutMs=1000)
+
+	def tearDown(self):
+		self.resolver.stop()
+
+	def test_resolve(self):
+		result = self.resolver.resolve([2, 1])
+		self.assertEqual(result, {"file": r"C:\docs\a.txt", "folder": r"D:\music", "hwnd": 2})
+
+	def test_resolveWithoutHandlesSkipsTheWorker(self):
+		self.assertEqual(self.resolver.resolve([]), {"file": None, "folder": None, "hwnd": None})
+		self.assertIsNone(self.resolver._thread)
+
+	def test_locationsAndSelection(self):
+		self.assertEqual(self.resolver.locations(), [(1, r"C:\docs"), (2, r"D:\music")])
+		self.assertEqual(self.resolver.selection(1), [r"C:\docs\a.txt", r"C:\docs\b.txt"])
+		self.assertIsNone(self.resolver.selection(3))
+
+	def test_deadline(self):
+		self.provider.delay = 0.3
+		started = time.monotonic()
+		result = self.resolver.resolve([1], timeoutMs=50)
+		self.assertLess(time.monotonic() - started, 0.25)
+		self.assertEqual(result, {"file": None, "folder": None, "hwnd": None})
+
+	def test_expiredRequestsAreSkipped(self):
+		self.provider.delay = 0.2
+		calls = []
+		windowPaths = self.provider.windowPaths
+
+		def countingWindowPaths(window):
+			calls.append(window)
+			return windowPaths(window)
+
+		self.provider.windowPaths = countingWindowPaths
+		# The first request holds the worker past the deadline of the second, which is
+		# then dropped without touching the provider.
+		self.resolver.resolve([1], timeoutMs=50)
+		self.resolver.resolve([2], timeoutMs=50)
+		self.provider.delay = 0
+		self.assertEqual(self.resolver.resolve([2])["folder"], r"D:\music")
+		self.assertEqual(calls, [WINDOWS[1], WINDOWS[2]])
+
+	def test_selectionAsync(self):
+		results = queue.Queue()
+		request = self.resolver.selectionAsync(1, results.put)
+		self.assertEqual(results.get(timeout=5), [r"C:\docs\a.txt", r"C:\docs\b.txt"])
+		self.assertTrue(request.done.is_set())
+		# A read past its deadline still answers, with None, and a failing callback
+		# leaves the worker running.
+		self.provider.delay = 0.2
+		self.resolver.selectionAsync(1, results.put, timeoutMs=50)
+		self.assertIsNone(results.get(timeout=5))
+		self.provider.delay = 0
+		self.resolver.selectionAsync(2, lambda paths: 1 / 0)
+		self.assertEqual(self.resolver.selection(2), [])
+
+	def test_workerRestartsAfterStop(self):
+		self.assertEqual(self.resolver.resolve([1])["hwnd"], 1)
+		first = self.resolver._thread
+		self.resolver.stop()
+		self.assertFalse(first.is_alive())
+		self.assertEqual(self.resolver.resolve([2])["hwnd"], 2)
+		self.assertIsNot(self.resolver._thread, first)
+		self.assertTrue(self.resolver._thread.is_alive())
+
+
+if __name__ == "__main__":
+	unittest.main()
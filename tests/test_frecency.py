@@ -0,0 +1,58 @@
+# test_frecency.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import random
+import unittest
+from AbsoluteFileAndFolder import frecency
+
+DAY = 86400.0
+
+
+class FrecencyTrackerTest(unittest.TestCase):
+	def test_recentVisitsOutrankOldOnes(self):
+		tracker = frecency.FrecencyTracker()
+		tracker.visit("old", now=0)
+		tracker.visit("old", now=DAY)
+		tracker.visit("new", now=60 * DAY)
+		self.assertEqual(tracker.top(), ["new", "old"])
+		self.assertEqual(tracker.visits("old"), 2)
+
+	def test_weakestPathIsEvicted(self):
+		tracker = frecency.FrecencyTracker(capacity=2)
+		tracker.visit("a", now=DAY)
+		tracker.visit("b", now=2 * DAY)
+		tracker.visit("a", now=3 * DAY)
+		self.assertEqual(tracker.visit("c", now=4 * DAY), ["b"])
+		self.assertEqual(set(tracker.dump()), {"a", "c"})
+
+	def test_setCapacityTrimsLoadedData(self):
+		tracker = frecency.FrecencyTracker()
+		for day in range(5):
+			tracker.visit(str(day), now=day * DAY)
+		data = tracker.dump()
+		loaded = frecency.FrecencyTracker()
+		loaded.load(data)
+		self.assertEqual(loaded.setCapacity(3), ["0", "1"])
+		self.assertEqual(loaded.top(), ["4", "3", "2"])
+
+	def test_matchesAFullSort(self):
+		rng = random.Random(13)
+		tracker = frecency.FrecencyTracker(capacity=20)
+		now = 0.0
+		for step in range(3000):
+			now += rng.random() * DAY
+			path = "p{}".format(rng.randrange(40))
+			if rng.random() < 0.1:
+				tracker.remove(path)
+			else:
+				tracker.visit(path, now=now)
+			self.assertLessEqual(len(tracker), 20)
+			expected = sorted(tracker.dump(), key=tracker.logScore, reverse=True)
+			self.assertEqual(tracker.top(), expected)
+			self.assertEqual(tracker.top(5), expected[:5])
+			self.assertLessEqual(len(tracker._heap), 2 * len(tracker) + 16)
+
+
+if __name__ == "__main__":
+	unittest.main()
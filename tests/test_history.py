@@ -0,0 +1,81 @@
+# test_history.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import unittest
+from AbsoluteFileAndFolder import history
+
+
+def paths(count):
+	return ["/p{}".format(i) for i in range(count)]
+
+
+class RecentHistoryTest(unittest.TestCase):
+	def test_touchMovesToFrontAndEvictsOldest(self):
+		recent = history.RecentHistory(20)
+		for path in paths(20):
+			self.assertEqual(recent.touch(path), [])
+		self.assertEqual(list(recent)[:3], ["/p19", "/p18", "/p17"])
+		recent.touch("/p0")
+		self.assertEqual(list(recent)[0], "/p0")
+		self.assertEqual(recent.touch("/new"), ["/p1"])
+		self.assertEqual(len(recent), 20)
+		self.assertNotIn("/p1", recent)
+		self.assertIn("/p0", recent)
+
+	def test_capacityIsClamped(self):
+		self.assertEqual(history.RecentHistory(5).capacity, history.MIN_CAPACITY)
+		self.assertEqual(history.RecentHistory(10 ** 6).capacity, history.MAX_CAPACITY)
+		self.assertEqual(history.RecentHistory("many").capacity, history.DEFAULT_CAPACITY)
+		self.assertEqual(history.clampCapacity("30"), 30)
+
+	def test_setCapacityReturnsEvicted(self):
+		recent = history.RecentHistory(30)
+		for path in paths(30):
+			recent.touch(path)
+		self.assertEqual(recent.setCapacity(100), [])
+		self.assertEqual(recent.setCapacity(22), ["/p0", "/p1", "/p2", "/p3", "/p4", "/p5", "/p6", "/p7"])
+		self.assertEqual(len(recent), 22)
+		self.assertEqual(list(recent)[-1], "/p8")
+
+	def test_reloadKeepsOrder(self):
+		recent = history.RecentHistory(20)
+		for path in ["/a", "/b", "/c", "/a"]:
+			recent.touch(path)
+		reloaded = history.RecentHistory(20)
+		reloaded.load(recent.dump())
+		self.assertEqual(list(reloaded), ["/a", "/c", "/b"])
+		# New opens after a reload still go in front of every loaded path.
+		reloaded.touch("/b")
+		self.assertEqual(list(reloaded), ["/b", "/a", "/c"])
+
+	def test_loadTrimsAndSkipsBadStamps(self):
+		recent = history.RecentHistory(20)
+		stamps = {path: float(i) for i, path in enumerate(paths(25))}
+		stamps["/bad"] = "yesterday"
+		evicted = recent.load(stamps)
+		self.assertEqual(sorted(evicted), sorted(paths(5)))
+		self.assertEqual(list(recent)[0], "/p24")
+		self.assertNotIn("/bad", recent)
+
+	def test_loadListFromOldConfig(self):
+		recent = history.RecentHistory(20)
+		recent.loadList(["/newest", "", "/older", "/oldest"])
+		self.assertEqual(list(recent), ["/newest", "/older", "/oldest"])
+		reloaded = history.RecentHistory(20)
+		reloaded.load(recent.dump())
+		self.assertEqual(list(reloaded), ["/newest", "/older", "/oldest"])
+
+	def test_removeAndClear(self):
+		recent = history.RecentHistory(20)
+		recent.touch("/a")
+		recent.touch("/b")
+		self.assertTrue(recent.remove("/a"))
+		self.assertFalse(recent.remove("/a"))
+		self.assertEqual(list(recent), ["/b"])
+		recent.clear()
+		self.assertEqual(len(recent), 0)
+
+
+if __name__ == "__main__":
+	unittest.main()
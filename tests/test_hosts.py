@@ -0,0 +1,112 @@
+# test_hosts.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import threading
+import unittest
+from AbsoluteFileAndFolder import hosts
+
+ROOT = "\\\\server\\share\\"
+
+
+class SplitHostTest(unittest.TestCase):
+	def test_splitHost(self):
+		self.assertEqual(hosts.splitHost("\\\\Server\\Share\\docs\\a.txt"), ("server", "\\\\Server\\Share\\"))
+		self.assertEqual(hosts.splitHost("//server/share/a"), ("server", "\\\\server\\share\\"))
+		self.assertEqual(hosts.splitHost("\\\\?\\UNC\\server\\share\\a"), ("server", "\\\\server\\share\\"))
+		self.assertEqual(hosts.splitHost("\\\\?\\C:\\a"), (None, None))
+		self.assertEqual(hosts.splitHost("C:\\docs"), (None, None))
+		self.assertEqual(hosts.splitHost("\\\\server"), (None, None))
+		self.assertEqual(hosts.splitHost(""), (None, None))
+
+
+class HostCircuitBreakerTest(unittest.TestCase):
+	def setUp(self):
+		self.now = 0.0
+		self.reachable = True
+		self.probes = []
+		self.recovered = []
+		self.breaker = hosts.HostCircuitBreaker(
+			probe=self.probe,
+			deadline=1.0,
+			threshold=3,
+			hostTtl=60.0,
+			retryDelay=0.01,
+			maxRetryDelay=0.04,
+			clock=lambda: self.now
+		)
+		self.recoveredEvent = threading.Event()
+		self.breaker.onRecovered = self.onRecovered
+		self.addCleanup(self.breaker.stop)
+
+	def probe(self, root):
+		self.probes.append(root)
+		return self.reachable
+
+	def onRecovered(self, host):
+		self.recovered.append(host)
+		self.recoveredEvent.set()
+
+	def test_reachableHostIsProbedOncePerTtl(self):
+		self.assertTrue(self.breaker.allow("server", ROOT))
+		self.now = 59.0
+		self.assertTrue(self.breaker.allow("server", ROOT))
+		self.assertEqual(self.probes, [ROOT])
+		self.now = 61.0
+		self.assertTrue(self.breaker.allow("server", ROOT))
+		self.assertEqual(len(self.probes), 2)
+
+	def test_failedProbeTripsTheBreaker(self):
+		self.reachable = False
+		self.assertFalse(self.breaker.allow("server", ROOT))
+		self.assertTrue(self.breaker.isOpen("server"))
+		self.assertEqual(self.breaker.openHosts(), ["server"])
+		probes = len(self.probes)
+		# Other checks are answered without a probe of their own.
+		self.assertFalse(self.breaker.allow("server", ROOT))
+		self.assertLessEqual(len(self.probes) - probes, 1)
+
+	def test_repeatedFailuresTripTheBreaker(self):
+		self.assertTrue(self.breaker.allow("server", ROOT))
+		self.breaker.record("server", False)
+		self.breaker.record("server", False)
+		self.breaker.record("server", True)
+		self.breaker.record("server", False)
+		self.breaker.record("server", False)
+		self.assertFalse(self.breaker.isOpen("server"))
+		self.reachable = False
+		self.breaker.record("server", False)
+		self.assertTrue(self.breaker.isOpen("server"))
+		self.breaker.record("other", False)
+		self.assertFalse(self.breaker.isOpen("other"))
+
+	def test_retryBacksOffAndRecovers(self):
+		self.reachable = False
+		self.breaker.allow("server", ROOT)
+		state = self.breaker._hosts["server"]
+		# Failed re-probes double the delay up to the maximum.
+		while len(self.probes) < 5:
+			self.assertFalse(self.recoveredEvent.wait(0.01))
+		self.assertEqual(state.retryDelay, 0.04)
+		self.assertTrue(self.breaker.isOpen("server"))
+		self.reachable = True
+		self.assertTrue(self.recoveredEvent.wait(5))
+		self.assertEqual(self.recovered, ["server"])
+		self.assertFalse(self.breaker.isOpen("server"))
+		probes = len(self.probes)
+		self.assertTrue(self.breaker.allow("server", ROOT))
+		self.assertEqual(len(self.probes), probes)
+
+	def test_stopCancelsRetries(self):
+		self.reachable = False
+		self.breaker.allow("server", ROOT)
+		self.breaker.stop()
+		probes = len(self.probes)
+		self.reachable = True
+		self.assertFalse(self.recoveredEvent.wait(0.1))
+		self.assertEqual(len(self.probes), probes)
+		self.assertTrue(self.breaker.isOpen("server"))
+
+
+if __name__ == "__main__":
+	unittest.main()
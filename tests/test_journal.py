@@ -0,0 +1,92 @@
+# test_journal.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from AbsoluteFileAndFolder import journal
+
+
+class JournalStoreTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp(prefix="AbsoluteFileAndFolder-journal-")
+		self.addCleanup(shutil.rmtree, self.folder, True)
+		self.path = os.path.join(self.folder, "AbsoluteFiles.json")
+
+	def readLog(self, store):
+		with open(store.logPath, encoding="utf-8") as f:
+			return [json.loads(line) for line in f if line.strip()]
+
+	def test_saveAppendsOnlyChanges(self):
+		store = journal.JournalStore(self.path)
+		self.assertEqual(store.load(), {})
+		self.assertTrue(store.save({"files": {"a": "/a", "b": "/b"}, "sortMode": "CUSTOM"}))
+		self.assertFalse(store.save({"files": {"a": "/a", "b": "/b"}, "sortMode": "CUSTOM"}))
+		store.save({"files": {"a": "/a2", "c": "/c"}, "sortMode": "CUSTOM"})
+		self.assertEqual(self.readLog(store)[2:], [{"put": "files", "items": {"a": "/a2", "c": "/c"}}, {"drop": "files", "names": ["b"]}])
+		self.assertFalse(os.path.exists(self.path))
+
+	def test_replay(self):
+		store = journal.JournalStore(self.path)
+		store.save({"files": {"a": "/a"}, "order": ["a"]})
+		store.save({"files": {"a": "/a", "b": "/b"}, "order": ["b", "a"]})
+		reopened = journal.JournalStore(self.path)
+		self.assertEqual(reopened.load(), {"files": {"a": "/a", "b": "/b"}, "order": ["b", "a"]})
+		self.assertFalse(reopened.isStale())
+		store.save({"files": {"b": "/b"}, "order": ["b"]})
+		self.assertTrue(reopened.isStale())
+		self.assertEqual(reopened.load()["files"], {"b": "/b"})
+
+	def test_compaction(self):
+		store = journal.JournalStore(self.path, compactThreshold=200)
+		for i in range(20):
+			store.save({"files": {"item{}".format(j): "/path/{}".format(j) for j in range(i + 1)}})
+		store.wait()
+		with open(self.path, encoding="utf-8") as f:
+			snapshot = json.load(f)
+		self.assertGreater(len(snapshot["files"]), 1)
+		self.assertFalse(os.path.exists(store._compactingPath))
+		self.assertEqual(len(journal.JournalStore(self.path).load()["files"]), 20)
+		store.compact(wait=True)
+		self.assertFalse(os.path.exists(store.logPath))
+		with open(self.path, encoding="utf-8") as f:
+			self.assertEqual(len(json.load(f)["files"]), 20)
+
+	def test_leftoverCompactionIsReplayedAndKept(self):
+		store = journal.JournalStore(self.path)
+		store.save({"files": {"a": "/a"}})
+		# A compaction that died before writing its snapshot leaves its log behind.
+		os.replace(store.logPath, store._compactingPath)
+		store.save({"files": {"a": "/a", "b": "/b"}})
+		self.assertEqual(journal.JournalStore(self.path).load(), {"files": {"a": "/a", "b": "/b"}})
+		store.compact(wait=True)
+		self.assertEqual(journal.JournalStore(self.path).load(), {"files": {"a": "/a", "b": "/b"}})
+		self.assertFalse(os.path.exists(store._compactingPath))
+
+	def test_tornLastLineIsSkipped(self):
+		store = journal.JournalStore(self.path)
+		store.save({"files": {"a": "/a"}, "sortMode": "CUSTOM"})
+		store.save({"files": {"a": "/a", "b": "/b"}, "sortMode": "CUSTOM"})
+		with open(store.logPath, "a", encoding="utf-8") as f:
+			f.write('{"put": "files", "items": {"c": "/')
+		recovered = journal.JournalStore(self.path)
+		self.assertEqual(recovered.load(), {"files": {"a": "/a", "b": "/b"}, "sortMode": "CUSTOM"})
+		# Later saves are still read after the torn record.
+		with open(store.logPath, "a", encoding="utf-8") as f:
+			f.write("\n")
+		recovered.save({"files": {"a": "/a", "b": "/b", "d": "/d"}, "sortMode": "CUSTOM"})
+		self.assertEqual(journal.JournalStore(self.path).load()["files"], {"a": "/a", "b": "/b", "d": "/d"})
+
+	def test_loadReturnsACopy(self):
+		store = journal.JournalStore(self.path)
+		store.save({"files": {"a": "/a"}})
+		data = store.load()
+		data["files"]["b"] = "/b"
+		self.assertFalse(store.save({"files": {"a": "/a"}}))
+
+
+if __name__ == "__main__":
+	unittest.main()
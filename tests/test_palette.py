@@ -0,0 +1,80 @@
+# test_palette.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import unittest
+from unittest import mock
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import AbsoluteFile
+from AbsoluteFileAndFolder import AbsoluteFolder
+from AbsoluteFileAndFolder import palette
+from AbsoluteFileAndFolder import search
+
+
+class QuickOpenTest(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.fileManager = AbsoluteFile.AbsoluteFileManager()
+		self.folderManager = AbsoluteFolder.AbsoluteFolderManager()
+		self.quickOpen = palette.QuickOpen(lambda: self.fileManager, lambda: self.folderManager)
+		self.reports = os.path.join(self.configPath, "reports")
+		os.mkdir(self.reports)
+		self.report = self.makeFile("report.txt")
+		self.notes = self.makeFile("notes.txt")
+		self.fileManager.addBookmark("Quarterly report", self.report)
+		self.fileManager.addBookmark("notes.txt", self.notes)
+		self.fileManager.addToRecent(self.report)
+		self.folderManager.addBookmark("reports", self.reports)
+
+	def makeFile(self, name):
+		path = os.path.join(self.reports, name)
+		with open(path, "w") as f:
+			f.write("x")
+		return path
+
+	def test_resultsMergeBothManagers(self):
+		self.quickOpen.refreshIndex()
+		index = self.quickOpen.index
+		keys = index.search("report")
+		# The saved and recent report.txt is listed once, ahead of the folder for its usage;
+		# notes.txt only matches on its folder.
+		self.assertEqual(keys, [
+			(palette.KIND_FILE, os.path.normcase(self.report)),
+			(palette.KIND_FOLDER, os.path.normcase(self.reports)),
+			(palette.KIND_FILE, os.path.normcase(self.notes))
+		])
+		self.assertEqual(index.entry(keys[0])["name"], "Quarterly report")
+		self.assertEqual(index.search(""), [(palette.KIND_FILE, os.path.normcase(self.report)), (palette.KIND_FOLDER, os.path.normcase(self.reports)), (palette.KIND_FILE, os.path.normcase(self.notes))])
+
+	def test_updateReusesTheManagersIndexes(self):
+		self.quickOpen.refreshIndex()
+		with mock.patch.object(search.TrigramIndex, "rebuild") as rebuild:
+			self.fileManager.addBookmark("Budget", self.makeFile("budget.xlsx"))
+			self.assertTrue(self.quickOpen.index.update(self.fileManager, self.folderManager))
+			self.assertFalse(self.quickOpen.index.update(self.fileManager, self.folderManager))
+		rebuild.assert_not_called()
+		self.assertEqual(self.quickOpen.index.search("budget"), [(palette.KIND_FILE, os.path.normcase(os.path.join(self.reports, "budget.xlsx")))])
+
+	def test_openFolderIsRemembered(self):
+		self.quickOpen.refreshIndex()
+		self.folderManager._autoLoadLastFolder = True
+		key = self.quickOpen.index.search("reports")[0]
+		with mock.patch.object(os, "startfile", create=True) as startfile:
+			self.assertTrue(self.quickOpen.open(key))
+		startfile.assert_called_once_with(self.reports)
+		self.assertEqual(list(self.folderManager._recent), [self.reports])
+		self.assertEqual(self.folderManager._lastOpenedFolders, [self.reports])
+
+	def test_failedOpenIsReported(self):
+		self.quickOpen.refreshIndex()
+		key = self.quickOpen.index.search("notes")[0]
+		error = OSError("No application is associated with the specified file")
+		with mock.patch.object(os, "startfile", side_effect=error, create=True), mock.patch("ui.message") as message:
+			self.assertFalse(self.quickOpen.open(key))
+		message.assert_called_once_with("{} is {}".format(self.notes, "unreachable"))
+		self.assertNotIn(self.notes, self.fileManager._recent)
+
+
+if __name__ == "__main__":
+	unittest.main()
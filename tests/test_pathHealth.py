@@ -0,0 +1,94 @@
+# test_pathHealth.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import threading
+import unittest
+from AbsoluteFileAndFolder import pathHealth
+
+KIND = pathHealth.KIND_FILE
+
+
+class PathHealthCacheTest(unittest.TestCase):
+	def setUp(self):
+		self.now = 0.0
+		self.states = {}
+		self.probes = []
+		self.release = threading.Event()
+		self.release.set()
+		self.cache = pathHealth.PathHealthCache(ttl=30.0, timeout=1.0, probe=self.probe, clock=lambda: self.now)
+		self.addCleanup(self.cache.shutdown)
+		self.addCleanup(self.release.set)
+
+	def probe(self, path, kind):
+		self.probes.append(path)
+		self.release.wait(5)
+		return self.states.get(path, pathHealth.MISSING)
+
+	def test_resultIsCachedUntilTheTtlExpires(self):
+		self.states["/a"] = pathHealth.OK
+		self.assertEqual(self.cache.verify("/a", KIND), pathHealth.OK)
+		self.now = 29.0
+		self.assertEqual(self.cache.state("/a", KIND), pathHealth.OK)
+		self.assertEqual(self.probes, ["/a"])
+		self.now = 31.0
+		self.states["/a"] = pathHealth.MISSING
+		self.cache.state("/a", KIND)
+		self.assertEqual(self.cache.verify("/a", KIND), pathHealth.MISSING)
+		self.assertEqual(self.probes, ["/a", "/a"])
+		self.assertEqual(self.cache.state("", KIND), pathHealth.MISSING)
+
+	def test_slowCheckIsUnreachableAfterTheTimeout(self):
+		self.release.clear()
+		self.states["/slow"] = pathHealth.OK
+		self.assertEqual(self.cache.state("/slow", KIND), pathHealth.UNKNOWN)
+		self.now = 0.5
+		self.assertEqual(self.cache.state("/slow", KIND), pathHealth.UNKNOWN)
+		self.now = 1.5
+		self.assertEqual(self.cache.state("/slow", KIND), pathHealth.UNREACHABLE)
+		self.assertEqual(self.cache.verify("/slow", KIND, timeout=0.01), pathHealth.UNREACHABLE)
+		# The check answering late replaces the timeout and tells the listeners.
+		changed = threading.Event()
+		self.cache.addListener(changed.set)
+		self.release.set()
+		self.assertTrue(changed.wait(5))
+		self.assertEqual(self.cache.state("/slow", KIND), pathHealth.OK)
+		self.assertEqual(self.probes, ["/slow"])
+
+	def test_missingPathBeingRecheckedIsStale(self):
+		self.assertEqual(self.cache.verify("/gone", KIND), pathHealth.MISSING)
+		self.release.clear()
+		self.now = 40.0
+		self.assertEqual(self.cache.state("/gone", KIND), pathHealth.STALE)
+		# Opening does not wait for ever on a stale path; it is still treated as missing.
+		self.assertEqual(self.cache.verify("/gone", KIND, timeout=0.01), pathHealth.MISSING)
+		self.states["/gone"] = pathHealth.OK
+		self.release.set()
+		self.assertEqual(self.cache.verify("/gone", KIND), pathHealth.OK)
+
+	def test_refreshQueuesChecksWithoutWaiting(self):
+		self.release.clear()
+		self.cache.refresh(["/a", "", "/b"], KIND)
+		self.assertEqual(set(self.cache._entries), {("/a", KIND), ("/b", KIND)})
+		self.release.set()
+		self.assertEqual(self.cache.verify("/b", KIND), pathHealth.MISSING)
+
+	def test_invalidate(self):
+		self.cache.verify("/a", KIND)
+		self.cache.invalidate("/a")
+		self.cache.verify("/a", KIND)
+		self.assertEqual(self.probes, ["/a", "/a"])
+		self.cache.invalidate()
+		self.assertEqual(self.cache._entries, {})
+
+
+class DescribeTest(unittest.TestCase):
+	def test_describe(self):
+		self.assertEqual(pathHealth.describe(pathHealth.OK), "")
+		self.assertEqual(pathHealth.describe(pathHealth.UNKNOWN), "")
+		self.assertEqual(pathHealth.describe(pathHealth.MISSING), "missing")
+		self.assertEqual(pathHealth.describe(pathHealth.STALE), "missing, checking again")
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,87 @@
+# test_persistence.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import time
+import threading
+import unittest
+from AbsoluteFileAndFolder import persistence
+
+
+class PersistenceServiceTest(unittest.TestCase):
+	def makeService(self, windowMs):
+		service = persistence.PersistenceService(windowMs)
+		self.addCleanup(service.stop)
+		return service
+
+	def test_writesWithinTheWindowAreCoalesced(self):
+		service = self.makeService(100)
+		written = []
+		done = threading.Event()
+
+		def write(value):
+			written.append(value)
+			done.set()
+
+		for i in range(5):
+			service.markDirty("config", lambda i=i: write(i))
+		self.assertTrue(service.isPending("config"))
+		self.assertEqual(written, [])
+		self.assertTrue(done.wait(5))
+		service.flush()
+		# Only the newest payload is written.
+		self.assertEqual(written, [4])
+		self.assertEqual(service.requestedWrites, 5)
+		self.assertEqual(service.performedWrites, 1)
+		self.assertEqual(service.coalescedWrites, 4)
+		self.assertFalse(service.isPending("config"))
+
+	def test_keysAreWrittenSeparately(self):
+		service = self.makeService(50)
+		written = []
+		service.markDirty("files", lambda: written.append("files"))
+		service.markDirty("folders", lambda: written.append("folders"))
+		deadline = time.monotonic() + 5
+		while len(written) < 2 and time.monotonic() < deadline:
+			time.sleep(0.01)
+		self.assertEqual(sorted(written), ["files", "folders"])
+
+	def test_flush(self):
+		service = self.makeService(60000)
+		written = []
+		service.markDirty("files", lambda: written.append("files"))
+		service.markDirty("folders", lambda: written.append("folders"))
+		service.flush("files")
+		self.assertEqual(written, ["files"])
+		self.assertTrue(service.isPending("folders"))
+		service.flush("files")
+		self.assertEqual(written, ["files"])
+		service.flush()
+		self.assertEqual(written, ["files", "folders"])
+		self.assertEqual(service.coalescedWrites, 0)
+
+	def test_stopWritesWhatIsPending(self):
+		service = self.makeService(60000)
+		written = []
+		service.markDirty("files", lambda: written.append("files"))
+		service.stop()
+		self.assertEqual(written, ["files"])
+		self.assertIsNone(service._thread)
+		# A later change starts the worker again.
+		service.markDirty("files", lambda: written.append("again"))
+		service.flush()
+		self.assertEqual(written, ["files", "again"])
+
+	def test_failingWriteDoesNotStopTheWorker(self):
+		service = self.makeService(10)
+		done = threading.Event()
+		service.markDirty("broken", lambda: 1 / 0)
+		service.markDirty("files", done.set)
+		self.assertTrue(done.wait(5))
+		# The flush waits for the worker's write to finish.
+		service.flush()
+		self.assertEqual(service.performedWrites, 2)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,118 @@
+# test_restore.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import time
+import unittest
+from unittest import mock
+import fakeWx
+from AbsoluteFileAndFolder import pathHealth
+from AbsoluteFileAndFolder import restore
+
+
+class FakeHealthCache:
+	def __init__(self, states=None):
+		self.states = states or {}
+		self.refreshed = []
+
+	def refresh(self, paths, kind):
+		self.refreshed.extend(paths)
+
+	def verify(self, path, kind, timeout=None):
+		return self.states.get(path, pathHealth.OK)
+
+
+def waitFor(condition, timeout=5):
+	deadline = time.monotonic() + timeout
+	while not condition():
+		if time.monotonic() > deadline:
+			return False
+		time.sleep(0.01)
+	return True
+
+
+class RestorePipelineTest(unittest.TestCase):
+	def setUp(self):
+		self.windows = 0
+		self.opened = []
+
+	def makePipeline(self, paths, concurrency, states=None, opener=None, **kwargs):
+		pipeline = restore.RestorePipeline(
+			paths,
+			concurrency=concurrency,
+			opener=opener or self.opened.append,
+			windowCounter=lambda: self.windows,
+			healthCache=FakeHealthCache(states),
+			**kwargs
+		)
+		self.addCleanup(pipeline.wait, 5)
+		self.addCleanup(pipeline.cancel)
+		return pipeline
+
+	def test_opensAsWindowsAppear(self):
+		pipeline = self.makePipeline(["/a", "/b", "/gone", "/c", "/d"], 2, {"/gone": pathHealth.MISSING})
+		pipeline.start()
+		self.assertEqual(pipeline._cache.refreshed, ["/a", "/b", "/gone", "/c", "/d"])
+		self.assertTrue(waitFor(lambda: len(self.opened) == 2))
+		# No more than two opened folders may be waiting for their window.
+		time.sleep(0.2)
+		self.assertEqual(self.opened, ["/a", "/b"])
+		self.windows = 1
+		self.assertTrue(waitFor(lambda: len(self.opened) == 3))
+		time.sleep(0.2)
+		self.assertEqual(self.opened, ["/a", "/b", "/c"])
+		self.windows = 4
+		pipeline.wait(5)
+		self.assertEqual(self.opened, ["/a", "/b", "/c", "/d"])
+		self.assertEqual(pipeline.report["opened"], self.opened)
+		self.assertEqual(pipeline.report["skipped"], {"/gone": pathHealth.MISSING})
+		self.assertFalse(pipeline.report["cancelled"])
+
+	def test_cancel(self):
+		done = []
+		pipeline = self.makePipeline(["/a", "/b", "/c"], 1, onDone=done.append)
+		pipeline.start()
+		self.assertTrue(waitFor(lambda: self.opened))
+		pipeline.cancel()
+		pipeline.wait(5)
+		self.assertEqual(self.opened, ["/a"])
+		self.assertTrue(pipeline.report["cancelled"])
+		self.assertEqual(done, [pipeline.report])
+
+	def test_failedOpenIsNotCounted(self):
+		def opener(path):
+			if path == "/b":
+				raise OSError("Access is denied")
+			self.opened.append(path)
+			self.windows += 1
+
+		pipeline = self.makePipeline(["/a", "/b", "/c"], 3, opener=opener)
+		pipeline.start()
+		pipeline.wait(5)
+		self.assertEqual(pipeline.report["opened"], ["/a", "/c"])
+		self.assertEqual(pipeline.report["skipped"], {"/b": "error"})
+
+	def test_errorFromTheGuiThreadReachesThePipeline(self):
+		def startfile(path):
+			if path == "/b":
+				raise OSError("The network path was not found")
+			self.opened.append(path)
+			self.windows += 1
+
+		pipeline = self.makePipeline(["/a", "/b"], 3, opener=restore._openOnMainThread)
+		with mock.patch.object(os, "startfile", startfile, create=True):
+			pipeline.start()
+			self.assertTrue(waitFor(lambda: fakeWx.runPending() or pipeline.report is not None))
+		self.assertEqual(pipeline.report["opened"], ["/a"])
+		self.assertEqual(pipeline.report["skipped"], {"/b": "error"})
+
+	def test_clampConcurrency(self):
+		self.assertEqual(restore.clampConcurrency(0), 1)
+		self.assertEqual(restore.clampConcurrency("4"), 4)
+		self.assertEqual(restore.clampConcurrency(99), restore.MAX_CONCURRENCY)
+		self.assertEqual(restore.clampConcurrency(None), restore.DEFAULT_CONCURRENCY)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,129 @@
+# test_search.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import time
+import unittest
+from unittest import mock
+from AbsoluteFileAndFolder import search
+
+WORDS = ("Report", "budget", "Photos", "notes", "Project", "music", "Invoice", "backup", "Drafts", "scripts")
+# Every prefix of these is typed as one keystroke.
+TYPED = ("report 0001", "budgte", "library", "item4711", "photos 04", "zzz")
+KEYSTROKE_BUDGET_MS = 5.0
+
+
+def entries(count):
+	for i in range(count):
+		name = "{} {:06d}".format(WORDS[i % len(WORDS)], i)
+		yield name, name, "C:/Users/me/library/item{}.txt".format(i)
+
+
+def makeIndex(items):
+	index = search.TrigramIndex()
+	index.rebuild(items)
+	return index
+
+
+class TrigramIndexTest(unittest.TestCase):
+	def setUp(self):
+		self.index = makeIndex([
+			("report", "Report", "C:\\docs\\2024\\report.docx"),
+			("annual", "Annual report", "C:\\docs\\2024\\annual.docx"),
+			("budget", "Budget", "C:\\finance\\reports\\budget.xlsx"),
+			("notes", "Notes", "C:\\home\\notes.txt"),
+			("reporter", "Reporter", "C:\\apps\\reporter.exe")
+		])
+
+	def test_tiers(self):
+		ranked = self.index.scored("report")
+		self.assertEqual([key for score, key in ranked], ["report", "reporter", "annual", "budget"])
+		self.assertEqual([score for score, key in ranked], [search.PREFIX_SCORE, search.PREFIX_SCORE, search.NAME_SCORE, search.PATH_SCORE])
+
+	def test_typoStillMatches(self):
+		self.assertEqual(self.index.search("budgte")[0], "budget")
+		self.assertEqual(self.index.search("xyz"), [])
+		self.assertIsNone(self.index.search("  "))
+
+	def test_shortQueriesMatchWordStarts(self):
+		self.assertEqual(self.index.search("re"), ["report", "reporter", "annual", "budget"])
+		self.assertEqual(self.index.search("n"), ["notes"])
+
+	def test_limitAndWithin(self):
+		self.assertEqual(self.index.search("report", 2), ["report", "reporter"])
+		self.assertEqual(self.index.search("report", within={"annual", "budget"}), ["annual", "budget"])
+
+	def test_changesWhileQueuedAndIndexed(self):
+		self.assertFalse(self.index.isPrepared())
+		self.index.remove("notes")
+		self.index.add("diary", "Diary", "C:\\home\\diary.txt")
+		self.assertEqual(len(self.index), 5)
+		self.assertEqual(self.index.search("diary"), ["diary"])
+		self.assertTrue(self.index.isPrepared())
+		self.index.rename("diary", "journal", "Journal", "C:\\home\\journal.txt")
+		self.index.remove("report")
+		self.assertEqual(self.index.search("diary"), [])
+		self.assertEqual(self.index.search("journal"), ["journal"])
+		self.assertEqual(self.index.search("report"), ["reporter", "annual", "budget"])
+
+	def test_changesDuringABuildAreKept(self):
+		index = self.index
+		build = search.TrigramIndex._indexAll
+
+		def buildWhileEditing(built, entries):
+			# The GUI thread changes the index while the worker builds.
+			index.add("diary", "Diary", "C:\\home\\diary.txt")
+			index.remove("notes")
+			index.add("budget", "Budget", "C:\\finance\\budget 2025.xlsx")
+			build(built, entries)
+
+		with mock.patch.object(search.TrigramIndex, "_indexAll", buildWhileEditing):
+			index.prepare()
+		self.assertTrue(index.isPrepared())
+		self.assertEqual(index.search("diary"), ["diary"])
+		self.assertEqual(index.search("notes"), [])
+		self.assertEqual(index.search("2025"), ["budget"])
+		self.assertEqual(len(index), 5)
+
+	def test_compaction(self):
+		index = makeIndex(entries(3000))
+		index.prepare()
+		for name, _name, path in list(entries(3000))[:1501]:
+			index.remove(name)
+		# Once more than half the ids are dead the index keeps only the live ones.
+		self.assertEqual(len(index._keys), 1499)
+		self.assertEqual(index._dead, 0)
+		self.assertEqual(len(index), 1499)
+		self.assertEqual(index.search("report 00", 3), ["Report 001510", "Report 001520", "Report 001530"])
+		self.assertEqual(index.search("report 0015", within={"Report 001500", "Report 002990"}), ["Report 002990"])
+
+
+class KeystrokeTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.index = makeIndex(entries(50000))
+		cls.index.prepare()
+
+	def test_everyKeystrokeAt50kEntries(self):
+		slowest = 0.0
+		for text in TYPED:
+			for end in range(1, len(text) + 1):
+				query = text[:end]
+				best = min(self.time(query) for i in range(3))
+				slowest = max(slowest, best)
+		self.assertLess(slowest, KEYSTROKE_BUDGET_MS)
+
+	def time(self, query):
+		started = time.perf_counter()
+		self.index.scored(query, search.RESULT_LIMIT)
+		return (time.perf_counter() - started) * 1000
+
+	def test_limitedResultsKeepTheTiers(self):
+		ranked = self.index.scored("report 00012", 3)
+		self.assertEqual(ranked[0], (search.PREFIX_SCORE, "Report 000120"))
+		self.assertTrue(all(score < 1 for score, key in ranked[1:]))
+		self.assertEqual(self.index.scored("item4711", 2), [(search.PATH_SCORE, "budget 004711"), (search.PATH_SCORE, "Report 047110")])
+
+
+if __name__ == "__main__":
+	unittest.main()
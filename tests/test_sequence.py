@@ -0,0 +1,133 @@
+# test_sequence.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import random
+import unittest
+from AbsoluteFileAndFolder import sequence
+
+
+class OrderedSequenceTest(unittest.TestCase):
+	def assertMatches(self, seq, expected):
+		self.assertEqual(list(seq), expected)
+		self.assertEqual(len(seq), len(expected))
+		for i, name in enumerate(expected):
+			self.assertEqual(seq.index(name), i)
+			self.assertEqual(seq[i], name)
+		self.assertTreeIsValid(seq)
+
+	def assertTreeIsValid(self, seq):
+		def walk(node, parent):
+			if node is None:
+				return 0
+			self.assertIs(node.parent, parent)
+			for child in (node.left, node.right):
+				if child is not None:
+					self.assertLessEqual(child.priority, node.priority)
+			size = 1 + walk(node.left, node) + walk(node.right, node)
+			self.assertEqual(node.size, size)
+			return size
+
+		self.assertEqual(walk(seq._root, None), len(seq))
+
+	def test_basics(self):
+		seq = sequence.OrderedSequence(["a", "b", "c"])
+		seq.insert(1, "x")
+		seq.append("d")
+		self.assertMatches(seq, ["a", "x", "b", "c", "d"])
+		self.assertEqual(seq[-1], "d")
+		with self.assertRaises(IndexError):
+			seq[5]
+		with self.assertRaises(ValueError):
+			seq.append("a")
+		with self.assertRaises(ValueError):
+			seq.extend(["e", "b"])
+		with self.assertRaises(ValueError):
+			seq.extend(["e", "e"])
+		seq.remove("x")
+		self.assertMatches(seq, ["a", "b", "c", "d"])
+		seq.clear()
+		self.assertMatches(seq, [])
+
+	def test_swapStopsAtTheEnds(self):
+		seq = sequence.OrderedSequence(["a", "b", "c"])
+		self.assertFalse(seq.swap("a", -1))
+		self.assertFalse(seq.swap("c", 1))
+		self.assertTrue(seq.swap("a", 1))
+		self.assertMatches(seq, ["b", "a", "c"])
+		self.assertTrue(seq.swap("c", -1))
+		self.assertMatches(seq, ["b", "c", "a"])
+
+	def test_moveClampsTheIndex(self):
+		seq = sequence.OrderedSequence(["a", "b", "c", "d"])
+		self.assertEqual(seq.move("a", 10), (0, 3))
+		self.assertEqual(seq.move("c", -4), (1, 0))
+		self.assertMatches(seq, ["c", "b", "d", "a"])
+
+	def test_rename(self):
+		seq = sequence.OrderedSequence(["a", "b"])
+		seq.rename("a", "z")
+		self.assertMatches(seq, ["z", "b"])
+		self.assertNotIn("a", seq)
+		with self.assertRaises(ValueError):
+			seq.rename("z", "b")
+
+	def test_matchesAList(self):
+		rng = random.Random(7)
+		seq = sequence.OrderedSequence(rng=random.Random(11))
+		model = []
+		counter = 0
+
+		def newNames(count):
+			nonlocal counter
+			names = ["n{}".format(counter + i) for i in range(count)]
+			counter += count
+			return names
+
+		for step in range(2000):
+			op = rng.choice(("insert", "extend", "remove", "swap", "move", "rename"))
+			if op == "insert":
+				name = newNames(1)[0]
+				index = rng.randrange(len(model) + 1)
+				seq.insert(index, name)
+				model.insert(index, name)
+			elif op == "extend":
+				names = newNames(rng.randrange(4))
+				seq.extend(names)
+				model.extend(names)
+			elif not model:
+				continue
+			elif op == "remove":
+				name = rng.choice(model)
+				seq.remove(name)
+				model.remove(name)
+			elif op == "swap":
+				name = rng.choice(model)
+				direction = rng.choice((-1, 1))
+				i = model.index(name)
+				j = i + direction
+				self.assertEqual(seq.swap(name, direction), 0 <= j < len(model))
+				if 0 <= j < len(model):
+					model[i], model[j] = model[j], model[i]
+			elif op == "move":
+				name = rng.choice(model)
+				index = rng.randrange(-2, len(model) + 2)
+				old = model.index(name)
+				model.remove(name)
+				new = max(0, min(index, len(model)))
+				model.insert(new, name)
+				self.assertEqual(seq.move(name, index), (old, new))
+			elif op == "rename":
+				name = rng.choice(model)
+				newName = newNames(1)[0]
+				seq.rename(name, newName)
+				model[model.index(name)] = newName
+			if step % 50 == 0:
+				self.assertMatches(seq, model)
+			else:
+				self.assertEqual(list(seq), model)
+		self.assertMatches(seq, model)
+
+
+if __name__ == "__main__":
+	unittest.main()
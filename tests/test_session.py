@@ -0,0 +1,125 @@
+# test_session.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import os
+import unittest
+from tests import ConfigTestCase
+from AbsoluteFileAndFolder import AbsoluteFolder
+from AbsoluteFileAndFolder import journal
+from AbsoluteFileAndFolder import persistence
+from AbsoluteFileAndFolder import session
+from AbsoluteFileAndFolder import startupRestore
+
+
+class FakeResolver:
+	def __init__(self, *folders):
+		self.folders = list(folders)
+
+	def locations(self, timeoutMs=None):
+		return [(hwnd, path) for hwnd, path in enumerate(self.folders, 1)]
+
+
+class FakeSignature:
+	def __init__(self, value=1):
+		self.value = value
+
+	def __call__(self):
+		return self.value
+
+
+class SessionTest(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.store = journal.JournalStore(os.path.join(self.configPath, "Session.json"))
+
+	def snapshotter(self, resolver, signature=None, **kwargs):
+		snapshotter = session.SessionSnapshotter(self.store, resolver=resolver, signature=signature, **kwargs)
+		snapshotter._folders = startupRestore.readSnapshot(self.store) or []
+		return snapshotter
+
+	def flush(self):
+		persistence.service.flush(self.store.path)
+
+	def test_readSnapshot(self):
+		self.assertIsNone(startupRestore.readSnapshot(self.store))
+		self.store.save({"folders": {r"D:\b": 1, r"C:\a": 0}})
+		self.assertEqual(startupRestore.readSnapshot(self.store), [r"C:\a", r"D:\b"])
+		self.store.save({"folders": {}})
+		self.assertEqual(startupRestore.readSnapshot(self.store), [])
+
+	def test_unchangedSignatureSkipsTheListing(self):
+		signature = FakeSignature()
+		snapshotter = self.snapshotter(FakeResolver(r"C:\a"), signature)
+		self.assertTrue(snapshotter.snapshot())
+		self.assertFalse(snapshotter.snapshot())
+		self.assertEqual(snapshotter.listings, 1)
+		signature.value = 2
+		self.assertFalse(snapshotter.snapshot())
+		self.assertEqual(snapshotter.listings, 2)
+
+	def test_writesOnlyWhenTheFoldersChange(self):
+		resolver = FakeResolver(r"C:\a", r"D:\b", r"C:\a")
+		snapshotter = self.snapshotter(resolver)
+		self.assertTrue(snapshotter.snapshot())
+		self.flush()
+		self.assertEqual(snapshotter.writes, 1)
+		self.assertEqual(startupRestore.readSnapshot(self.store), [r"C:\a", r"D:\b"])
+		self.assertFalse(snapshotter.snapshot())
+		self.flush()
+		self.assertEqual(snapshotter.writes, 1)
+		resolver.folders = []
+		self.assertTrue(snapshotter.snapshot())
+		self.flush()
+		self.assertEqual(snapshotter.writes, 2)
+		self.assertEqual(startupRestore.readSnapshot(self.store), [])
+
+	def test_backOffWithoutSignature(self):
+		resolver = FakeResolver(r"C:\a")
+		snapshotter = self.snapshotter(resolver, interval=10, maxInterval=35)
+		snapshotter.snapshot()
+		delays = []
+		for i in range(4):
+			snapshotter.snapshot()
+			delays.append(snapshotter._delay)
+		self.assertEqual(delays, [20, 35, 35, 35])
+		resolver.folders.append(r"D:\b")
+		snapshotter.snapshot()
+		self.assertEqual(snapshotter._delay, 10)
+		self.flush()
+
+	def test_disabledSnapshotterDoesNothing(self):
+		snapshotter = self.snapshotter(FakeResolver(r"C:\a"), enabled=lambda: False)
+		self.assertFalse(snapshotter.snapshot())
+		self.assertEqual(snapshotter.listings, 0)
+
+	def test_emptyDesktopIsNotRecordedBeforeTheFirstSnapshot(self):
+		snapshotter = self.snapshotter(FakeResolver())
+		self.assertFalse(snapshotter.snapshot())
+		self.assertIsNone(startupRestore.readSnapshot(self.store))
+
+
+class FoldersToRestoreTest(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.manager = AbsoluteFolder.AbsoluteFolderManager()
+		self.manager._lastOpenedFolders = [r"C:\remembered"]
+
+	def test_withoutSnapshotTheRememberedFoldersOpen(self):
+		self.assertEqual(self.manager.foldersToRestore(), [r"C:\remembered"])
+
+	def test_rememberedFoldersWinOverTheSnapshot(self):
+		self.manager._sessionStore.save({"folders": {r"C:\open": 0}})
+		self.assertEqual(self.manager.foldersToRestore(), [r"C:\remembered"])
+
+	def test_snapshotIsTheFallbackForAnEmptyList(self):
+		self.manager._lastOpenedFolders = []
+		self.assertEqual(self.manager.foldersToRestore(), [])
+		self.manager._sessionStore.save({"folders": {r"C:\second": 1, r"C:\open": 0}})
+		self.assertEqual(self.manager.foldersToRestore(), [r"C:\open", r"C:\second"])
+		self.manager._sessionStore.save({"folders": {}})
+		self.assertEqual(self.manager.foldersToRestore(), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,97 @@
+# test_startupRestore.py
+# Copyright (C) 2026 'Chai Chaimee'
+# Licensed under GNU General Public License. See COPYING.txt for details.
+
+import unittest
+from unittest import mock
+from tests import ConfigTestCase
+import AbsoluteFileAndFolder
+from AbsoluteFileAndFolder import journal
+from AbsoluteFileAndFolder import restore
+from AbsoluteFileAndFolder import session
+from AbsoluteFileAndFolder import startupRestore
+
+
+class FakeMarker:
+	def __init__(self, firstStart):
+		self.firstStart = firstStart
+		self.legacyUptimes = []
+
+	def isFirstStartOfBoot(self, legacyUptimeMs=0):
+		self.legacyUptimes.append(legacyUptimeMs)
+		return self.firstStart
+
+
+class StartupRestoreTest(ConfigTestCase):
+	def saveSettings(self, **settings):
+		journal.JournalStore(startupRestore.configPath()).save(settings)
+
+	def saveSnapshot(self, *folders):
+		startupRestore.sessionStore().save({"folders": {path: i for i, path in enumerate(folders)}})
+
+	def test_rememberedFoldersWinOverTheSnapshot(self):
+		self.saveSettings(autoLoadLastFolder=True, lastOpenedFolders=["C:/remembered"], lastSystemUptime=42)
+		self.saveSnapshot("C:/open")
+		marker = FakeMarker(True)
+		folders, settings = startupRestore.check(marker)
+		self.assertEqual(folders, ["C:/remembered"])
+		self.assertEqual(marker.legacyUptimes, [42])
+
+	def test_snapshotIsTheFallback(self):
+		self.saveSettings(autoLoadLastFolder=True, lastOpenedFolders=[])
+		self.saveSnapshot("C:/open", "D:/second")
+		self.assertEqual(startupRestore.check(FakeMarker(True))[0], ["C:/open", "D:/second"])
+
+	def test_nothingOpensOutsideTheFirstStartOrWithAutoOpenOff(self):
+		self.saveSettings(autoLoadLastFolder=False, lastOpenedFolders=["C:/remembered"])
+		marker = FakeMarker(True)
+		self.assertEqual(startupRestore.check(marker)[0], [])
+		# The marker is asked even then, so it tracks the current boot.
+		self.assertEqual(len(marker.legacyUptimes), 1)
+		self.saveSettings(autoLoadLastFolder=True, lastOpenedFolders=["C:/remembered"])
+		self.assertEqual(startupRestore.check(FakeMarker(False))[0], [])
+
+	def test_noConfigYet(self):
+		self.assertEqual(startupRestore.check(FakeMarker(True)), ([], {}))
+
+
+class StartupCheckTest(ConfigTestCase):
+	def setUp(self):
+		super().setUp()
+		self.plugin = AbsoluteFileAndFolder.GlobalPlugin()
+		self.addCleanup(self.plugin.terminate)
+		getFolderManager = mock.patch.object(self.plugin, "_getFolderManager", side_effect=AssertionError("manager loaded"))
+		getFolderManager.start()
+		self.addCleanup(getFolderManager.stop)
+		startSnapshots = mock.patch.object(session.SessionSnapshotter, "start")
+		startSnapshots.start()
+		self.addCleanup(startSnapshots.stop)
+		journal.JournalStore(startupRestore.configPath()).save({
+			"autoLoadLastFolder": True,
+			"lastOpenedFolders": ["C:/remembered"],
+			"restoreConcurrency": 99
+		})
+
+	def check(self, firstStart):
+		with mock.patch.object(startupRestore.bootSession.BootMarker, "isFirstStartOfBoot", return_value=firstStart):
+			self.plugin._checkAndOpenLastFolders()
+
+	def test_restoreRunsWithoutTheManagers(self):
+		with mock.patch.object(restore, "RestorePipeline") as pipeline:
+			self.check(True)
+		pipeline.assert_called_once_with(["C:/remembered"], concurrency=restore.MAX_CONCURRENCY, onDone=self.plugin._onRestoreDone)
+		pipeline.return_value.start.assert_called_once_with()
+		self.assertIsNone(self.plugin._session)
+
+	def test_snapshotsStartWhenNothingIsRestored(self):
+		with mock.patch.object(restore, "RestorePipeline") as pipeline:
+			self.check(False)
+		pipeline.assert_not_called()
+		self.assertIs(self.plugin._session.store, startupRestore.sessionStore())
+		self.assertTrue(self.plugin._autoOpenEnabled())
+		self.plugin._folderManager = mock.Mock(_autoLoadLastFolder=False)
+		self.assertFalse(self.plugin._autoOpenEnabled())
+
+
+if __name__ == "__main__":
+	unittest.main()